@@ -0,0 +1,367 @@
+"""
+Benchmarks for dataset loading, preprocessing, filters, chart binning and image export on synthetic datasets of different sizes.
+
+Each scale gets a synthetic dataset in benchmarks/datasets/{scale}x (generated on first use, see synthetic_dataset.py),
+then every benchmark is run a few times on it and the fastest and median times are reported.
+Comparing runs before and after a change (eg. with --json) shows whether it made things faster, and comparing scales shows how it grows with the catalog.
+
+Usage:
+    python benchmarks/run_benchmarks.py                          # 1x, 10x and 100x
+    python benchmarks/run_benchmarks.py --scales 1 10 --repeat 5 --json benchmarks/results.json
+    python benchmarks/run_benchmarks.py --only filter            # Benchmarks with "filter" in their name
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import traceback
+
+benchmarks_directory = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(benchmarks_directory, "..", "src"))
+
+import numpy as np
+import pandas as pd
+import mcdowell_dataset_analysis as mda
+import vague_dates
+from synthetic_dataset import generate_synthetic_dataset
+
+benchmarks = [] # (group, name, needs, function taking a BenchmarkContext)
+
+def benchmark(group, name, needs=()):
+    """
+    Decorator that adds a function to the benchmark list.
+    Args:
+        needs (tuple str, optional): BenchmarkContext methods to call before timing, so shared setup (eg. loading the dataset) isn't counted in the first run.
+    """
+    def register(function):
+        benchmarks.append((group, name, needs, function))
+        return function
+    return register
+
+class BenchmarkContext:
+    """
+    Everything a benchmark needs for one scale: the dataset directory, the raw tsv dataframes and a loaded dataset, each read once and shared.
+    Benchmarks must not modify these, work on copies or views.
+    """
+
+    def __init__(self, dataset_directory):
+        self.dataset_directory = dataset_directory
+        self.translation = mda.Translation(dataset_directory=dataset_directory)
+        self.cached = {}
+
+    def get(self, name, function):
+        if name not in self.cached:
+            self.cached[name] = function()
+        return self.cached[name]
+
+    def raw_tsvs(self):
+        return [self.raw(name) for name in ["launch", "satcat", "psatcat", "auxcat"]]
+
+    def raw(self, name):
+        """
+        Raw tsv as read by Launch/Satcat, eg. raw("launch")
+        """
+        return self.get(f"raw_{name}", lambda: pd.read_csv(f"{self.dataset_directory}/{name}.tsv", sep="\t", encoding="utf-8", low_memory=False))
+
+    def release(self, prefixes):
+        """
+        Drop cached dataframes whose name starts with one of prefixes, so large scales don't keep them all in memory.
+        """
+        self.cached = {name: value for name, value in self.cached.items() if not name.startswith(tuple(prefixes))}
+
+    def dataset(self):
+        return self.get("dataset", lambda: mda.McdowellDataset(self.dataset_directory, use_cache=False))
+
+    def dataset_cache(self):
+        """
+        Make sure the dataset cache entry exists
+        """
+        return self.get("dataset_cache", lambda: mda.McdowellDataset(self.dataset_directory).cache)
+
+    def arrow_store(self):
+        """
+        Make sure the dataset is exported to an Arrow store, returns its directory
+        """
+        def export():
+            self.dataset().export_arrow(f"{self.dataset_directory}/.arrow")
+            return f"{self.dataset_directory}/.arrow"
+        return self.get("arrow_store", export)
+
+    def preprocessed_launch(self):
+        """
+        Launch after preprocess_launch_df(), before the satcat dependent columns
+        """
+        def preprocess():
+            launch = mda.Launch(self.translation, self.dataset_directory, df=self.raw("launch").copy(), auxcat_df=self.raw("auxcat"))
+            launch.preprocess_launch_df()
+            return launch
+        return self.get("preprocessed_launch", preprocess)
+
+    def preprocessed_satcat(self):
+        """
+        Satcat after preprocess_satcat_df() and the psatcat columns, before the launch dependent columns
+        """
+        def preprocess():
+            satcat = mda.Satcat(self.translation, self.dataset_directory, df=self.raw("satcat").copy(), psatcat_df=self.raw("psatcat"))
+            satcat.preprocess_satcat_df()
+            satcat.process_psatcat_dependent_columns(satcat.psatcat_df)
+            return satcat
+        return self.get("preprocessed_satcat", preprocess)
+
+# Dataset load
+
+@benchmark("load", "McdowellDataset from tsv (no cache)")
+def load_from_tsv(context):
+    mda.Translation.loaded.clear() # Cold start, read the translation tables too
+    mda.McdowellDataset(context.dataset_directory, use_cache=False)
+
+@benchmark("load", "McdowellDataset from tsv (no cache, read_threads=1)")
+def load_from_tsv_serial(context):
+    mda.Translation.loaded.clear()
+    mda.McdowellDataset(context.dataset_directory, use_cache=False, read_threads=1)
+
+@benchmark("load", "McdowellDataset from tsv (launch_columns=[Launch_Date, LV_Type])")
+def load_projected(context):
+    mda.Translation.loaded.clear()
+    mda.McdowellDataset(context.dataset_directory, use_cache=False, launch_columns=["Launch_Date", "LV_Type"])
+
+@benchmark("load", "McdowellDataset from cache", needs=("dataset_cache",))
+def load_from_cache(context):
+    mda.McdowellDataset(context.dataset_directory)
+
+@benchmark("load", "McdowellDataset from arrow store (memory-mapped)", needs=("arrow_store",))
+def load_from_arrow_store(context):
+    mda.McdowellDataset(context.dataset_directory, arrow_store=context.arrow_store())
+
+@benchmark("load", "export_arrow()", needs=("dataset",))
+def export_arrow(context):
+    context.dataset().export_arrow(f"{context.dataset_directory}/.arrow")
+
+@benchmark("load", "read launch.tsv")
+def read_launch(context):
+    pd.read_csv(f"{context.dataset_directory}/launch.tsv", sep="\t", encoding="utf-8", low_memory=False)
+
+@benchmark("load", "read satcat.tsv")
+def read_satcat(context):
+    pd.read_csv(f"{context.dataset_directory}/satcat.tsv", sep="\t", encoding="utf-8", low_memory=False)
+
+@benchmark("load", "Translation tables")
+def load_translation(context):
+    mda.Translation(dataset_directory=context.dataset_directory)
+
+# Preprocessing stages, each on a copy of the output of the stage before it
+
+@benchmark("preprocess", "Launch.preprocess_launch_df", needs=("raw_tsvs",))
+def preprocess_launch(context):
+    launch = mda.Launch(context.translation, context.dataset_directory, df=context.raw("launch").copy(), auxcat_df=context.raw("auxcat"))
+    launch.preprocess_launch_df()
+
+@benchmark("preprocess", "Satcat.preprocess_satcat_df", needs=("raw_tsvs",))
+def preprocess_satcat(context):
+    satcat = mda.Satcat(context.translation, context.dataset_directory, df=context.raw("satcat").copy(), psatcat_df=context.raw("psatcat"))
+    satcat.preprocess_satcat_df()
+
+@benchmark("preprocess", "parse_vague_dates (satcat DDate)", needs=("raw_tsvs",))
+def parse_decay_dates(context):
+    vague_dates.parse_vague_dates(context.raw("satcat")["DDate"].iloc[1:])
+
+@benchmark("preprocess", "Satcat.process_psatcat_dependent_columns", needs=("preprocessed_satcat",))
+def psatcat_columns(context):
+    satcat = context.preprocessed_satcat()
+    satcat = mda.Satcat(context.translation, context.dataset_directory, df=satcat.df.copy(), psatcat_df=satcat.psatcat_df)
+    satcat.process_psatcat_dependent_columns(satcat.psatcat_df)
+
+@benchmark("preprocess", "Launch.process_satcat_dependent_columns", needs=("preprocessed_launch", "preprocessed_satcat"))
+def satcat_dependent_columns(context):
+    launch = context.preprocessed_launch()
+    launch = mda.Launch(context.translation, context.dataset_directory, df=launch.df.copy(), auxcat_df=launch.auxcat_df)
+    launch.process_satcat_dependent_columns(context.preprocessed_satcat())
+
+@benchmark("preprocess", "Launch.add_custom_launch_types", needs=("dataset",))
+def custom_launch_types(context):
+    launch = mda.Launch(context.translation, context.dataset_directory, df=context.dataset().launch.df.copy())
+    launch.add_custom_launch_types()
+
+@benchmark("preprocess", "Satcat.process_launch_dependent_columns", needs=("preprocessed_satcat", "dataset"))
+def launch_dependent_columns(context):
+    satcat = context.preprocessed_satcat()
+    satcat = mda.Satcat(context.translation, context.dataset_directory, df=satcat.df.copy(), psatcat_df=satcat.psatcat_df)
+    satcat.process_launch_dependent_columns(context.dataset().launch)
+
+@benchmark("preprocess", "convert_to_categorical (launch and satcat)", needs=("dataset",))
+def convert_to_categorical(context):
+    dataset = context.dataset()
+    mda.Launch(context.translation, context.dataset_directory, df=dataset.launch.df.copy()).convert_to_categorical()
+    mda.Satcat(context.translation, context.dataset_directory, df=dataset.satcat.df.copy()).convert_to_categorical()
+
+# Filter chains, on views like the chart functions
+
+@benchmark("filter", "orbital Falcon 9 launches to LEO since 2015", needs=("dataset",))
+def filter_falcon_9(context):
+    launch = context.dataset().view().launch
+    launch = mda.Filters.filter_by_launch_category(launch, ["O", "D"])
+    launch = mda.Filters.filter_by_launch_vehicle_name_simplified(launch, "Falcon 9")
+    launch = mda.Filters.filter_by_orbit(launch, ["LEO", "SSO"])
+    launch = mda.Filters.filter_by_launch_date(launch, start_date="2015-01-01")
+    launch.df
+
+@benchmark("filter", "Starlink launches by mission name", needs=("dataset",))
+def filter_mission(context):
+    launch = mda.Filters.filter_by_mission(context.dataset().view().launch, "Starlink")
+    launch.df
+
+@benchmark("filter", "US and Chinese payloads in LEO with mass 100-1000 kg", needs=("dataset",))
+def filter_payloads(context):
+    satcat = context.dataset().view().satcat
+    satcat = mda.Filters.filter_by_sat_type_coarse(satcat, ["P"])
+    satcat = mda.Filters.filter_by_state_code(satcat, ["US", "CN"])
+    satcat = mda.Filters.filter_by_orbit(satcat, "LEO")
+    satcat = mda.Filters.filter_by_mass(satcat, 100, 1000)
+    satcat.df
+
+@benchmark("filter", "payloads by program and payload category", needs=("dataset",))
+def filter_programs(context):
+    satcat = context.dataset().view().satcat
+    satcat = mda.Filters.filter_by_payload_program_raw(satcat, ["OneWeb", "Kosmos", "Iridium"])
+    satcat = mda.Filters.filter_by_simple_payload_category(satcat, ["Communications", "Observation"])
+    satcat.df
+
+@benchmark("filter", "filter launch and satcat in place then reload()", needs=("dataset",))
+def filter_and_reload(context):
+    dataset = context.dataset()
+    mda.Filters.filter_by_orbit(dataset.launch, "LEO")
+    mda.Filters.filter_by_orbit(dataset.satcat, "LEO")
+    dataset.reload()
+
+# Chart data: binning and grouping in ChartUtils and the datasets
+
+@benchmark("chart data", "launches per year by orbit (matrix binning)", needs=("dataset",))
+def bin_year_by_orbit(context):
+    launch = mda.Filters.filter_by_launch_category(context.dataset().view().launch, ["O", "D"])
+    launch = mda.Filters.filter_by_launch_date(launch, start_date="1957-01-01", end_date="2025-12-31")
+    launch.df["Launch_Year"] = launch.df["Launch_Date"].dt.year
+    mda.ChartUtils.bin_dataset_into_matrix_by_filter_function(launch, mda.Filters.filter_by_orbit, ["LEO", "SSO", "MEO", "GTO", "GEO", "HEO", "BEO"], "Launch_Year", list(range(1956, 2026)), list(range(1957, 2026)))
+
+@benchmark("chart data", "launches by payload mass by launch vehicle (dictionary binning)", needs=("dataset",))
+def bin_mass_by_vehicle(context):
+    launch = mda.Filters.filter_by_launch_category(context.dataset().view().launch, ["O", "D"])
+    vehicles = list(mda.Filters.column(launch, "Launch_Vehicle_Simplified").value_counts().index[:10])
+    mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(launch, mda.Filters.filter_by_launch_vehicle_name_simplified, vehicles, "Payload_Mass", list(range(0, 30000, 1000)), [f"{i}-{i + 1}t" for i in range(29)])
+
+@benchmark("chart data", "cumulative payloads by program", needs=("dataset",))
+def cumulative_payloads(context):
+    satcat = mda.Filters.filter_by_sat_type_coarse(context.dataset().view().satcat, ["P"])
+    programs = ["OneWeb", "Kosmos", "Iridium", "GPS", "Yaogan"]
+    views = mda.ChartUtils.filter_dataset_by_each_parameter(satcat, mda.Filters.filter_by_payload_program_raw, programs)
+    mda.ChartUtils.cumulative_counts_on_dense_axis({program: mda.Filters.column(view, "Launch_Date") for program, view in zip(programs, views)})
+
+@benchmark("chart data", "objects in orbit per month by orbit", needs=("dataset",))
+def population(context):
+    context.dataset().satcat.population_over_time(group_by="Simple_Orbit", freq="MS")
+
+@benchmark("chart data", "build LaunchCube", needs=("dataset",))
+def build_launch_cube(context):
+    mda.LaunchCube(context.dataset().launch)
+
+# Image export
+
+@benchmark("export", "plot_bar PNG (requires kaleido)")
+def export_bar(context):
+    data = pd.DataFrame(np.random.default_rng(0).integers(0, 100, (69, 7)), index=range(1957, 2026), columns=["LEO", "SSO", "MEO", "GTO", "GEO", "HEO", "BEO"])
+    with tempfile.TemporaryDirectory() as directory:
+        mda.ChartUtils.plot_bar(data, "Benchmark", "Synthetic data", "Year", "Launches", f"{directory}/bar.png", color_map=mda.ChartUtils.orbit_color_map)
+
+def run_benchmark(function, needs, context, repeat):
+    """
+    Run a benchmark repeat times.
+
+    Returns:
+        dict: {"times": list float seconds} or {"error": str} if it raised
+    """
+    try:
+        for need in needs:
+            getattr(context, need)()
+    except Exception as error:
+        return {"error": f"setup {need}: {type(error).__name__}: {error}", "traceback": traceback.format_exc()}
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            function(context)
+        except Exception as error:
+            return {"error": f"{type(error).__name__}: {error}", "traceback": traceback.format_exc()}
+        times.append(time.perf_counter() - start)
+    return {"times": times}
+
+def dataset_for_scale(scale, dataset_root, source_directory):
+    """
+    Directory of the synthetic dataset for a scale, generated if it doesn't exist yet.
+    """
+    directory = f"{dataset_root}/{scale:g}x"
+    if not os.path.exists(f"{directory}/launch.tsv"):
+        print(f"Generating {scale:g}x synthetic dataset in {directory}...")
+        rows = generate_synthetic_dataset(directory, scale, source_directory)
+        print(", ".join(f"{name}: {count} rows" for name, count in rows.items()))
+    return directory
+
+def run(scales, repeat=3, only=None, dataset_root=None, source_directory="./datasets"):
+    """
+    Run the benchmarks on each scale.
+    Args:
+        scales (list float): Multiples of the real dataset size, eg. [1, 10, 100]
+        repeat (int, optional): Times each benchmark is run. Defaults to 3.
+        only (str, optional): Only run benchmarks with this in their group or name. Defaults to all.
+        dataset_root (str, optional): Where synthetic datasets are kept. Defaults to benchmarks/datasets.
+        source_directory (str, optional): Real dataset directory for lv.tsv, sites.tsv and orgs.tsv. Defaults to "./datasets".
+
+    Returns:
+        list dict: One result per benchmark and scale with group, name, scale, and times or error
+    """
+    dataset_root = dataset_root or f"{benchmarks_directory}/datasets"
+    selected = [entry for entry in benchmarks if only is None or only.lower() in f"{entry[0]}: {entry[1]}".lower()]
+    results = []
+
+    for scale in scales:
+        context = BenchmarkContext(dataset_for_scale(scale, dataset_root, source_directory))
+        print(f"\n{scale:g}x ({len(context.raw('launch'))} launches, {len(context.raw('satcat'))} satcat objects)")
+        print(f"{'benchmark':<80} {'min':>9} {'median':>9}")
+
+        working_directory = os.getcwd()
+        with tempfile.TemporaryDirectory() as output_directory:
+            os.chdir(output_directory) # Chart functions write to ./examples/outputs
+            try:
+                for group, name, needs, function in selected:
+                    if group not in ("load", "preprocess"):
+                        context.release(["raw_", "preprocessed_"])
+                    result = {"group": group, "name": name, "scale": scale, **run_benchmark(function, needs, context, repeat)}
+                    results.append(result)
+                    label = f"{group}: {name}"
+                    if "error" in result:
+                        print(f"{label:<80} {'failed':>9} {' '.join(result['error'].split())[:100]}")
+                    else:
+                        print(f"{label:<80} {min(result['times']):>8.3f}s {statistics.median(result['times']):>8.3f}s")
+            finally:
+                os.chdir(working_directory)
+
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the dataset pipeline on synthetic datasets.")
+    parser.add_argument("--scales", type=float, nargs="+", default=[1, 10, 100], help="Dataset sizes as multiples of the real dataset (default 1 10 100)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of each benchmark, the fastest and median are reported (default 3)")
+    parser.add_argument("--only", help="Only run benchmarks with this in their group or name")
+    parser.add_argument("--datasets", help="Directory for the synthetic datasets (default benchmarks/datasets)")
+    parser.add_argument("--source", default="./datasets", help="Real dataset directory with lv.tsv, sites.tsv and orgs.tsv (default ./datasets)")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = run(args.scales, args.repeat, args.only, args.datasets, args.source)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump([{key: value for key, value in result.items() if key != "traceback"} for result in results], file, indent=2)
@@ -0,0 +1,362 @@
+"""
+Synthetic GCAT-shaped datasets for the benchmarks.
+
+Writes launch.tsv, satcat.tsv, psatcat.tsv and auxcat.tsv with the same columns and value formats as Jonathan McDowell's files
+(vague dates, fixed width Type codes, "-" for missing values, the "# Updated" row), scaled to a multiple of the real row counts.
+lv.tsv, sites.tsv and orgs.tsv are copied from the real dataset directory, and launch vehicles, sites, agencies and owners are drawn from them,
+so the translation tables match like they do on the real data.
+
+Value distributions follow the real catalog where it matters for speed:
+    - Launches per year grow from the 1960s, dip in the 2000s and grow quickly after 2015. About 10% are orbital, the rest suborbital.
+    - Launch vehicles, sites, pads, agencies and owners are heavy tailed (a few very common values, long tail of rare ones).
+    - Orbital launches carry a heavy tailed number of objects: usually a payload and a stage, sometimes hundreds of debris pieces.
+      Starlink launches after 2019 carry 20-60 payloads each.
+    - Dates are written to mixed precision (second, minute, day, month, with "?" for uncertain ones), most old objects have decayed.
+    - Orbits are split into LEO/SSO/MEO/GTO/GEO/HEO/deep space with matching perigee, apogee and inclination.
+
+The files are written in chunks of launches, so 100x (about 7 million launches and 7 million objects) doesn't need the whole dataset in memory.
+
+Usage:
+    python benchmarks/synthetic_dataset.py benchmarks/datasets/10x --scale 10
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+from translations import Translation
+
+# Approximate row counts of the real files (December 2025), scale=1 writes about this many rows
+real_row_counts = {"launch": 70000, "satcat": 68000, "psatcat": 24000, "auxcat": 11700}
+
+first_year = 1957
+last_year = 2025
+cutoff = "2025 Dec  1 0109:52"
+chunk_launches = 250000 # Launches generated and written at a time
+
+months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+launch_columns = ["#Launch_Tag", "Launch_JD", "Launch_Date", "LV_Type", "Variant", "Flight_ID", "Flight", "Mission", "FlightCode", "Platform", "Launch_Site", "Launch_Pad", "Ascent_Site", "Ascent_Pad", "Apogee", "Apoflag", "Range", "RangeFlag", "Dest", "OrbPay", "Agency", "LaunchCode", "FailCode", "Group", "Category", "LTCite", "Cite", "Notes"]
+satcat_columns = ["#JCAT", "Satcat", "Launch_Tag", "Piece", "Type", "Name", "PLName", "LDate", "Parent", "SDate", "Primary", "DDate", "Status", "Dest", "Owner", "State", "Manufacturer", "Bus", "Motor", "Mass", "MassFlag", "DryMass", "DryFlag", "TotMass", "TotFlag", "Length", "LFlag", "Diameter", "DFlag", "Span", "SpanFlag", "Shape", "ODate", "Perigee", "PF", "Apogee", "AF", "Inc", "IF", "OpOrbit", "OQUAL", "AltNames"]
+psatcat_columns = ["#JCAT", "Piece", "Name", "LDate", "TLast", "TOp", "TAnom", "TStatus", "TF", "Program", "Plane", "Att", "Mvr", "Class", "Category", "Result", "Control", "Discipline", "Un_State", "Un_Reg", "Un_Period", "Un_Perigee", "Un_Apogee", "Un_Inc", "Disp_Epoch", "Disp_Peri", "Disp_Apo", "Disp_Inc", "Comment"]
+
+# Launch category orbit: (weight, satcat OpOrbit choices, perigee km range, apogee km range, inclination deg range)
+orbits = {
+    "LEO": (0.38, ["LLEO/I", "LEO/I", "LLEO/E", "LEO/R"], (180, 1200), (200, 1400), (0, 75)),
+    "SSO": (0.22, ["LLEO/S", "LEO/S", "LLEO/P", "LEO/P"], (450, 900), (450, 950), (96, 99)),
+    "ISS": (0.05, ["LLEO/I"], (380, 420), (390, 430), (51.6, 51.7)),
+    "MEO": (0.05, ["MEO"], (19000, 23500), (19500, 23600), (50, 65)),
+    "GTO": (0.12, ["GTO", "GEO/S", "GEO/D", "GEO/I"], (180, 35700), (35700, 36000), (0, 28)),
+    "GEO": (0.03, ["GEO/S", "GEO/I", "GEO/NS"], (35700, 35800), (35780, 35900), (0, 5)),
+    "HEO": (0.05, ["HEO", "HEO/M", "VHEO"], (300, 1500), (20000, 400000), (40, 65)),
+    "MOL": (0.03, ["HEO/M"], (400, 1000), (39000, 40500), (62, 64)),
+    "DSO": (0.03, ["DSO", "HCO", "CLO"], (0, 0), (0, 0), (0, 0)),
+    "EEO": (0.02, ["EEO", "HCO"], (0, 0), (0, 0), (0, 0)),
+    "STO": (0.02, ["GTO", "GEO/S"], (200, 35700), (40000, 70000), (0, 28)),
+}
+
+groups = (["C", "G", "CX", "OG", "M", "B", "-"], [0.25, 0.3, 0.05, 0.05, 0.2, 0.05, 0.1])
+programs = ["OneWeb", "Kosmos", "Iridium", "GPS", "Planet Dove", "Yaogan", "Spire Lemur", "Molniya", "Intelsat", "Gonets", "Shiyan", "Qianfan", "Kuiper", "Beidou", "-"]
+
+def zipf_weights(count, exponent=1.1):
+    """
+    Heavy tailed weights for count values, the first value is the most common.
+    """
+    weights = 1.0 / np.arange(1, count + 1) ** exponent
+    return weights / weights.sum()
+
+def year_weights():
+    """
+    Relative number of launches in each year from first_year to last_year, roughly the shape of the real launch rate.
+    """
+    years = np.arange(first_year, last_year + 1)
+    weights = np.interp(years, [1957, 1965, 1985, 1995, 2005, 2015, 2020, 2025], [0.2, 1.0, 1.3, 1.0, 0.6, 0.8, 1.6, 3.0])
+    return years, weights / weights.sum()
+
+def vague_dates(rng, years, months_, days, precision):
+    """
+    McDowell vague date strings, eg. "2019 Nov 11 1456:03", "1966 Jul?" or "1970 Mar  3".
+    Args:
+        precision (array int): 6 second, 5 minute, 3 day, 2 month (uncertain), 1 day (uncertain)
+    """
+    base = pd.Series(years.astype(str)) + " " + pd.Series(np.array(months)[months_ - 1])
+    day = pd.Series(np.char.rjust(days.astype(str), 2))
+    hours = rng.integers(0, 24, len(years))
+    minutes = rng.integers(0, 60, len(years))
+    seconds = rng.integers(0, 60, len(years))
+    time = pd.Series(np.char.zfill(hours.astype(str), 2)) + pd.Series(np.char.zfill(minutes.astype(str), 2))
+
+    dates = base + " " + day
+    dates = dates.where(precision != 5, dates + " " + time)
+    dates = dates.where(precision != 6, dates + " " + time + ":" + pd.Series(np.char.zfill(seconds.astype(str), 2)))
+    dates = dates.where(precision != 2, base + "?")
+    dates = dates.where(precision != 1, base + " " + day + "?")
+    return dates.to_numpy(dtype=object)
+
+def number_strings(values, width, decimals=0):
+    """
+    Right aligned numbers like McDowell's fixed width columns, eg. "    1250 ".
+    """
+    return np.char.add(np.char.rjust(np.round(values, decimals).astype(int if decimals == 0 else float).astype(str), width), " ").astype(object)
+
+def load_lookup_tables(source_directory):
+    """
+    Codes to draw from, from the real lv.tsv, sites.tsv and orgs.tsv. The most common real values come first so zipf_weights() favours them.
+    """
+    lv = pd.read_csv(f"{source_directory}/lv.tsv", sep="\t", skiprows=[1], dtype=str)
+    sites = pd.read_csv(f"{source_directory}/sites.tsv", sep="\t", skiprows=[1], dtype=str)
+    orgs = pd.read_csv(f"{source_directory}/orgs.tsv", sep="\t", skiprows=[1], dtype=str)
+
+    popular_orbital = ["Falcon 9", "Soyuz-2-1a", "Soyuz-2-1b", "Chang Zheng 2D", "Electron", "Atlas V 401", "Soyuz-U", "Kosmos-3M", "Proton-M/Briz-M", "Chang Zheng 3B", "Ariane 5ECA", "Delta 7925", "PSLV-XL", "Tsiklon-3", "H-IIA 202"]
+    orbital = lv.loc[lv["Class"].str.strip() == "O", "#LV_Name"].str.strip()
+    popular_orbital = [name for name in popular_orbital if name in set(orbital)]
+    suborbital = lv.loc[lv["Class"].str.strip().isin(["R", "M", "A", "B"]), "#LV_Name"].str.strip()
+
+    popular_sites = ["GIK-5", "CC", "GIK-1", "V", "KSC", "JQ", "TY", "XSC", "MAHIA", "KOU", "SHAR", "WI", "PMRF", "WSMR"]
+    site_codes = sites.loc[sites["Type"].str.strip() == "LS", "#Site"].str.strip()
+    popular_sites = [site for site in popular_sites if site in set(site_codes)]
+
+    org_codes = orgs["#Code"].str.strip()
+    popular_orgs = [code for code in ["SPX", "RVSN", "NASA", "USAF", "CASC", "VKS", "ARIAN", "ISRO", "RL", "MHI", "ULA", "ONEWEB"] if code in set(org_codes)]
+    states = orgs["StateCode"].str.strip()
+    popular_states = [state for state in ["US", "SU", "RU", "CN", "F", "J", "IN", "UK", "D", "I", "CA"] if state in set(states)]
+
+    def ordered(popular, everything):
+        return np.array(popular + sorted(set(everything) - set(popular)), dtype=object)
+
+    return {
+        "orbital_lv": ordered(popular_orbital, orbital),
+        "suborbital_lv": ordered([], suborbital),
+        "site": ordered(popular_sites, site_codes),
+        "org": ordered(popular_orgs, org_codes),
+        "state": ordered(popular_states, states.unique()),
+    }
+
+def generate_launches(rng, tables, years, orbital, first_index):
+    """
+    One chunk of launch.tsv rows. Returns (launch rows, per launch arrays the satcat rows are built from).
+    """
+    count = len(years)
+    months_ = rng.integers(1, 13, count)
+    days = rng.integers(1, 29, count)
+    precision = rng.choice([6, 5, 3, 2, 1], count, p=[0.45, 0.3, 0.19, 0.04, 0.02])
+    dates = vague_dates(rng, years, months_, days, precision)
+
+    index = np.arange(first_index, first_index + count)
+    tags = np.where(orbital, pd.Series(years.astype(str)) + "-" + pd.Series(np.char.zfill(index.astype(str), 3)), pd.Series(years.astype(str)) + "-U" + pd.Series(index.astype(str))).astype(object)
+
+    lv_type = np.where(orbital, rng.choice(tables["orbital_lv"], count, p=zipf_weights(len(tables["orbital_lv"]))), rng.choice(tables["suborbital_lv"], count, p=zipf_weights(len(tables["suborbital_lv"]), 0.8)))
+    site = rng.choice(tables["site"], count, p=zipf_weights(len(tables["site"]), 1.3))
+    pad = np.char.add("LC", rng.choice(np.arange(1, 60), count, p=zipf_weights(59)).astype(str)).astype(object)
+
+    orbit_names = list(orbits)
+    orbit = np.array(orbit_names, dtype=object)[rng.choice(len(orbit_names), count, p=[orbits[name][0] for name in orbit_names])]
+    starlink = orbital & (years >= 2019) & (rng.random(count) < np.clip((years - 2018) * 0.06, 0, 0.45))
+    orbit[starlink] = "LEO"
+    category = np.where(orbital, "Sat " + pd.Series(orbit) + " SD 0", rng.choice(["Sub Missile", "Sub Test", "Sub Weapon", "Sub Training", "Sub Sci"], count, p=[0.4, 0.2, 0.1, 0.1, 0.2])).astype(object)
+
+    first_letter = np.where(orbital, np.where(orbit == "DSO", "D", "O"), rng.choice(list("SMATHRY"), count, p=[0.4, 0.3, 0.1, 0.1, 0.04, 0.03, 0.03]))
+    outcome = rng.choice(list("SFUE"), count, p=[0.92, 0.06, 0.01, 0.01])
+
+    mission = np.where(starlink, "Starlink Group " + pd.Series(rng.integers(1, 12, count).astype(str)) + "-" + pd.Series(rng.integers(1, 30, count).astype(str)), "Mission " + pd.Series(index.astype(str))).astype(object)
+
+    launch_df = pd.DataFrame({column: "-" for column in launch_columns}, index=range(count))
+    launch_df["#Launch_Tag"] = tags
+    launch_df["Launch_JD"] = (2436116.31 + (years - first_year) * 365.25 + months_ * 30.4 + days).round(4).astype(str)
+    launch_df["Launch_Date"] = dates
+    launch_df["LV_Type"] = lv_type
+    launch_df["Flight"] = "F" + pd.Series(rng.integers(1, 400, count).astype(str))
+    launch_df["Mission"] = mission
+    launch_df["Launch_Site"] = site
+    launch_df["Launch_Pad"] = pad
+    launch_df["Apogee"] = number_strings(np.where(orbital, 0, rng.lognormal(4.5, 1.2, count)), 7)
+    launch_df["Apoflag"] = ""
+    launch_df["RangeFlag"] = ""
+    launch_df["OrbPay"] = np.where(orbital, "1", "0")
+    launch_df["Agency"] = rng.choice(tables["org"], count, p=zipf_weights(len(tables["org"]), 1.2))
+    launch_df["LaunchCode"] = np.char.add(first_letter.astype(str), outcome.astype(str)).astype(object)
+    launch_df["Group"] = rng.choice(groups[0], count, p=groups[1])
+    launch_df["Category"] = category
+
+    launches = {"tags": tags, "years": years, "months": months_, "days": days, "orbit": orbit, "starlink": starlink, "lv_type": lv_type}
+    return launch_df, launches
+
+def generate_objects(rng, tables, launches, orbital, object_count, first_jcat, jcat_prefix="S"):
+    """
+    One chunk of satcat.tsv (or auxcat.tsv) rows for the orbital launches of a launch chunk.
+    Every orbital launch gets a payload and a stage first, the rest are spread with heavy tailed weights (debris events), Starlink launches get mostly payloads.
+
+    Returns:
+        tuple(DataFrame, DataFrame): satcat rows and psatcat rows for the payloads among them
+    """
+    launch_index = np.flatnonzero(orbital)
+    if len(launch_index) == 0 or object_count <= 0:
+        return pd.DataFrame(columns=satcat_columns), pd.DataFrame(columns=psatcat_columns)
+
+    base_count = min(object_count, 2 * len(launch_index))
+    weights = rng.lognormal(0, 1.5, len(launch_index)) * np.where(launches["starlink"][launch_index], 8, 1)
+    extra = rng.choice(launch_index, object_count - base_count, p=weights / weights.sum())
+    parent = np.sort(np.concatenate([np.repeat(launch_index, 2)[:base_count], extra]))
+
+    count = len(parent)
+    position = np.arange(count) - np.searchsorted(parent, parent) # Position of each object within its launch
+    starlink = launches["starlink"][parent]
+
+    object_type = np.where(position == 0, "P", np.where(position == 1, "R2", rng.choice(["P", "C", "D", "R1", "R3"], count, p=[0.12, 0.18, 0.65, 0.03, 0.02])))
+    object_type = np.where(starlink & (position > 1), np.where(rng.random(count) < 0.9, "P", "D"), object_type)
+    payload = object_type == "P"
+    object_type = np.where(payload, np.where(rng.random(count) < 0.15, "P  A", "P"), object_type)
+
+    jcat = np.char.add(jcat_prefix, np.char.zfill(np.arange(first_jcat, first_jcat + count).astype(str), 5)).astype(object)
+    years = launches["years"][parent]
+    months_ = launches["months"][parent]
+    days = launches["days"][parent]
+    launch_date = vague_dates(rng, years, months_, days, np.full(count, 3))
+
+    # Older and lower objects are more likely to have decayed
+    orbit = launches["orbit"][parent]
+    low = np.isin(orbit, ["LEO", "SSO", "ISS"])
+    decayed = rng.random(count) < np.where(low, 0.85, 0.25) * np.clip((2030 - years) / 40, 0.2, 1)
+    decay_years = np.minimum(years + rng.geometric(0.15, count) - 1, last_year)
+    decay_date = vague_dates(rng, decay_years, rng.integers(1, 13, count), rng.integers(1, 29, count), rng.choice([5, 3, 2], count, p=[0.6, 0.35, 0.05]))
+    decay_date[~decayed] = "-"
+
+    perigee = np.zeros(count)
+    apogee = np.zeros(count)
+    inclination = np.zeros(count)
+    op_orbit = np.empty(count, dtype=object)
+    for name, (_, op_orbits, perigee_range, apogee_range, inclination_range) in orbits.items():
+        mask = orbit == name
+        n = int(mask.sum())
+        perigee[mask] = rng.uniform(*perigee_range, n)
+        apogee[mask] = np.maximum(perigee[mask], rng.uniform(*apogee_range, n))
+        inclination[mask] = rng.uniform(*inclination_range, n)
+        op_orbit[mask] = rng.choice(op_orbits, n)
+    op_orbit[decayed & (rng.random(count) < 0.05)] = "TA"
+
+    mass = rng.lognormal(np.where(payload, 5.5, 4.0), np.where(starlink, 0.1, 1.8), count).clip(0.1, 120000)
+    mass = np.where(starlink & payload, rng.choice([260, 306, 800], count), mass)
+
+    owner = rng.choice(tables["org"], count, p=zipf_weights(len(tables["org"]), 1.1))
+    owner = np.where(starlink, "SPX", owner)
+
+    satcat_df = pd.DataFrame({column: "-" for column in satcat_columns}, index=range(count))
+    satcat_df["#JCAT"] = jcat
+    satcat_df["Satcat"] = np.char.rjust(np.arange(first_jcat, first_jcat + count).astype(str), 5).astype(object)
+    satcat_df["Launch_Tag"] = launches["tags"][parent]
+    satcat_df["Piece"] = launches["tags"][parent] + " " + pd.Series(position.astype(str))
+    satcat_df["Type"] = np.char.ljust(object_type.astype(str), 12).astype(object)
+    satcat_df["Name"] = np.where(starlink & payload, "Starlink", np.where(payload, "Sat", np.where(object_type == "R2", launches["lv_type"][parent] + " Stage 2", "Debris"))).astype(object)
+    satcat_df["PLName"] = np.where(starlink & payload, "Starlink-" + pd.Series(np.arange(count).astype(str)), np.where(payload, "Sat " + pd.Series(jcat), "-")).astype(object)
+    satcat_df["LDate"] = launch_date
+    satcat_df["SDate"] = launch_date
+    satcat_df["Primary"] = "Earth"
+    satcat_df["DDate"] = decay_date
+    satcat_df["Status"] = np.where(decayed, "R", "O")
+    satcat_df["Owner"] = owner
+    satcat_df["State"] = rng.choice(tables["state"], count, p=zipf_weights(len(tables["state"]), 1.4))
+    satcat_df["Manufacturer"] = rng.choice(tables["org"], count, p=zipf_weights(len(tables["org"]), 1.1))
+    satcat_df["Bus"] = rng.choice(["-", "Starlink v1.5", "Starlink v2 Mini", "A2100", "SSL-1300", "DFH-4", "Cubesat 3U", "Cubesat 6U", "KAUR-1"], count)
+    for column, flag in [("Mass", "MassFlag"), ("DryMass", "DryFlag"), ("TotMass", "TotFlag")]:
+        satcat_df[column] = number_strings(mass, 8)
+        satcat_df[flag] = ""
+    satcat_df.loc[rng.random(count) < 0.05, "Mass"] = "-"
+    for column, flag, scale in [("Length", "LFlag", 3.0), ("Diameter", "DFlag", 1.5), ("Span", "SpanFlag", 4.0)]:
+        satcat_df[column] = number_strings(rng.lognormal(0, 1, count) * scale, 6, 1)
+        satcat_df[flag] = ""
+    satcat_df["Shape"] = rng.choice(["Cyl", "Box", "Cone", "Sphere", "Irr"], count)
+    satcat_df["ODate"] = launch_date
+    satcat_df["Perigee"] = number_strings(perigee, 8)
+    satcat_df["Apogee"] = number_strings(apogee, 8)
+    satcat_df["Inc"] = number_strings(inclination, 6, 2)
+    for column in ["PF", "AF", "IF"]:
+        satcat_df[column] = ""
+    satcat_df["OpOrbit"] = op_orbit
+
+    payloads = satcat_df.loc[payload, ["#JCAT", "Piece"]].reset_index(drop=True)
+    payload_count = len(payloads)
+    payload_starlink = starlink[payload]
+    psatcat_df = pd.DataFrame({column: "-" for column in psatcat_columns}, index=range(payload_count))
+    psatcat_df["#JCAT"] = payloads["#JCAT"]
+    psatcat_df["Piece"] = payloads["Piece"]
+    psatcat_df["Name"] = satcat_df.loc[payload, "PLName"].to_numpy()
+    psatcat_df["LDate"] = launch_date[payload]
+    psatcat_df["Program"] = np.where(payload_starlink, "Starlink", rng.choice(programs, payload_count, p=zipf_weights(len(programs), 0.7)))
+    psatcat_df["Class"] = rng.choice(list("ABCD"), payload_count, p=[0.15, 0.4, 0.3, 0.15])
+    categories = list(Translation.payload_category_to_simple_payload_category)
+    psatcat_df["Category"] = np.where(payload_starlink, "COM", rng.choice(categories, payload_count, p=zipf_weights(len(categories), 0.6)))
+    psatcat_df["Result"] = rng.choice(["S", "F", "U"], payload_count, p=[0.9, 0.07, 0.03])
+    psatcat_df["Discipline"] = np.where(payload_starlink, "COM", rng.choice(["COM", "IMG", "SCI", "NAV", "TECH", "-"], payload_count))
+    psatcat_df["Comment"] = "-"
+
+    return satcat_df, psatcat_df
+
+def write_tsv(dataframe, path, append):
+    """
+    Append rows to a McDowell style tsv, writing the header and "# Updated" row first if it's a new file.
+    """
+    with open(path, "a" if append else "w", encoding="utf-8", newline="") as file:
+        if not append:
+            file.write("\t".join(dataframe.columns) + "\n")
+            file.write(f"# Updated {cutoff}\n")
+        dataframe.to_csv(file, sep="\t", index=False, header=False)
+
+def generate_synthetic_dataset(output_directory, scale=1.0, source_directory="./datasets", seed=0):
+    """
+    Write a synthetic dataset directory that McdowellDataset can load.
+    Args:
+        output_directory (str): Directory to write the tsv files to, created if needed.
+        scale (float, optional): Multiple of the real row counts, eg. 10 for 10x. Defaults to 1.
+        source_directory (str, optional): Real dataset directory to copy lv.tsv, sites.tsv and orgs.tsv from. Defaults to "./datasets".
+        seed (int, optional): Random seed, the same seed and scale always give the same files. Defaults to 0.
+
+    Returns:
+        dict: Number of rows written to each tsv
+    """
+
+    rng = np.random.default_rng(seed)
+    os.makedirs(output_directory, exist_ok=True)
+    for name in ["lv.tsv", "sites.tsv", "orgs.tsv"]:
+        shutil.copy(f"{source_directory}/{name}", f"{output_directory}/{name}")
+    tables = load_lookup_tables(source_directory)
+
+    launch_count = int(real_row_counts["launch"] * scale)
+    year_values, weights = year_weights()
+    years = np.sort(rng.choice(year_values, launch_count, p=weights))
+    orbital = rng.random(launch_count) < 0.1
+    orbital_total = max(int(orbital.sum()), 1)
+
+    rows = {"launch": 0, "satcat": 0, "psatcat": 0, "auxcat": 0}
+    for start in range(0, launch_count, chunk_launches):
+        stop = min(start + chunk_launches, launch_count)
+        append = start > 0
+        chunk_orbital = orbital[start:stop]
+        share = chunk_orbital.sum() / orbital_total
+
+        launch_df, launches = generate_launches(rng, tables, years[start:stop], chunk_orbital, start)
+        satcat_df, psatcat_df = generate_objects(rng, tables, launches, chunk_orbital, round(real_row_counts["satcat"] * scale * share), rows["satcat"])
+
+        # auxcat has the satcat columns, mostly stages and components
+        auxcat_df, _ = generate_objects(rng, tables, launches, chunk_orbital, round(real_row_counts["auxcat"] * scale * share), rows["auxcat"], jcat_prefix="A")
+        auxcat_df["Type"] = np.where(auxcat_df["Type"].str.startswith("P"), "C  A        ", auxcat_df["Type"])
+
+        for name, dataframe in [("launch", launch_df), ("satcat", satcat_df), ("psatcat", psatcat_df), ("auxcat", auxcat_df)]:
+            write_tsv(dataframe, f"{output_directory}/{name}.tsv", append)
+            rows[name] += len(dataframe)
+
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic GCAT-shaped dataset for benchmarks.")
+    parser.add_argument("output_directory")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiple of the real row counts (default 1)")
+    parser.add_argument("--source", default="./datasets", help="Real dataset directory with lv.tsv, sites.tsv and orgs.tsv (default ./datasets)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rows = generate_synthetic_dataset(args.output_directory, args.scale, args.source, args.seed)
+    print(", ".join(f"{name}: {count} rows" for name, count in rows.items()))
@@ -1,9 +1,13 @@
+import mcdowell_dataset_analysis as mda
 import standard_chart_generation as scg
 from datetime import datetime
 import pandas as pd
 
+# Charts are queued here and generated in parallel at the end of the script
+batch = mda.ChartBatch()
+
 def generate(chart_types, vehicle_name, display_name, file_name, year_x_tick_step_size=5, month_x_tick_step_size=60, mass_step_size=1000):
-    """ Generates charts for a given launch vehicle using specified chart types.
+    """ Queues charts for a given launch vehicle using specified chart types.
 
     Args:
         chart_types (str): String containing chart types to generate (can contain "single", "family", "scatter").
@@ -15,7 +19,8 @@ def generate(chart_types, vehicle_name, display_name, file_name, year_x_tick_ste
     """
     
     if "single" in chart_types:
-        scg.generate_launch_vehicle_charts(
+        batch.add(
+            scg.generate_launch_vehicle_charts,
             launch_vehicle_simplified_name=vehicle_name,
             chart_title_prefix=display_name,
             output_prefix=file_name,
@@ -25,7 +30,8 @@ def generate(chart_types, vehicle_name, display_name, file_name, year_x_tick_ste
         )
 
     if "scatter" in chart_types:
-        scg.generate_launch_vehicle_scatter_plots(
+        batch.add(
+            scg.generate_launch_vehicle_scatter_plots,
             launch_vehicle_simplified_name=vehicle_name,
             chart_title_prefix=display_name,
             output_prefix=file_name,
@@ -33,7 +39,8 @@ def generate(chart_types, vehicle_name, display_name, file_name, year_x_tick_ste
         )
 
     if "family" in chart_types:
-        scg.generate_launch_vehicle_family_charts(
+        batch.add(
+            scg.generate_launch_vehicle_family_charts,
             launch_vehicle_simplified_name=vehicle_name,
             chart_title_prefix=display_name,
             output_prefix=file_name,
@@ -42,7 +49,8 @@ def generate(chart_types, vehicle_name, display_name, file_name, year_x_tick_ste
         )
     
     if "extra" in chart_types:
-        scg.generate_extra_charts(
+        batch.add(
+            scg.generate_extra_charts,
             launch_vehicle_simplified_name=vehicle_name,
             chart_title_prefix=display_name,
             output_prefix=file_name,
@@ -51,8 +59,6 @@ def generate(chart_types, vehicle_name, display_name, file_name, year_x_tick_ste
 start_time = datetime.now()
 print("Start time: ", start_time)
 
-scg.generate_extra_charts(launch_vehicle_simplified_name="Falcon 9", chart_title_prefix="Falcon 9", output_prefix="f9")
-
 generate("single family scatter", ['Antares 110', 'Antares 120', 'Antares 130', 'Antares 230', 'Antares 230+'], "Antares", "antares", 1, 12)
 generate("single scatter extra", "Falcon 9", "Falcon 9", "f9", 1, 12)
 generate("single", "Falcon Heavy", "Falcon Heavy", "f9h", 1, 12)
@@ -63,5 +69,10 @@ generate("single", "Soyuz", "Soyuz", "soyuz")
 generate("single family", ['Delta 1', 'Delta 2', 'Delta 3', 'Delta 4M', 'Delta 4H'], "Delta Orbital", "delta")
 generate("single family", ["Ariane 1", "Ariane 2", "Ariane 3", "Ariane 4", "Ariane 5", "Ariane 6"], "Ariane", "ariane")
 
+if __name__ == "__main__": # Needed where worker processes are spawned instead of forked
+    results = batch.run()
+    for result in mda.ChartBatch.failures(results):
+        print(f"\n{result.job.name} failed:\n{result.traceback_text}")
+
 print("End time: ", datetime.now())
 print("Elapsed time: ", datetime.now() - start_time)
\ No newline at end of file
@@ -0,0 +1,12 @@
+import sys
+import mcdowell_dataset_analysis as mda
+
+# Generate every chart in a chart manifest, eg. python examples/run_manifest.py examples/manifests/v2.yaml
+
+if __name__ == "__main__":
+    manifest = mda.ChartManifest.load(sys.argv[1])
+    print(manifest.describe())
+    
+    results = manifest.run()
+    for result in mda.ChartBatch.failures(results):
+        print(f"\n{result.job.name} failed:\n{result.traceback_text}")
@@ -0,0 +1,265 @@
+import concurrent.futures
+import multiprocessing
+import os
+import time
+import traceback
+
+class ChartJob:
+    """
+    One chart to generate: a chart function (eg. standard_chart_generation.launches_vs_year_by_orbit) and its keyword arguments.
+    """
+
+    def __init__(self, function, kwargs=None, name=None):
+        """
+        Args:
+            function (function): Chart function. Must be defined at module level so it can be sent to worker processes.
+            kwargs (dict, optional): Keyword arguments for the function. Defaults to no arguments.
+            name (str, optional): Name shown in progress output. Defaults to the function name and output_prefix.
+        """
+
+        self.function = function
+        self.kwargs = kwargs or {}
+        self.name = name or " ".join(str(part) for part in [function.__name__, self.kwargs.get("output_prefix")] if part is not None)
+
+class ChartJobResult:
+    """
+    Outcome of one ChartJob. Failed jobs keep the error and traceback instead of stopping the batch.
+    """
+
+    def __init__(self, job, index, duration, error=None, traceback_text=None):
+        self.job = job
+        self.index = index # Position of the job in the batch
+        self.duration = duration # Seconds
+        self.error = error # Exception message, None if the job succeeded
+        self.traceback_text = traceback_text
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+def run_job(indexed_job):
+    """
+    Run one job, catching any exception so a broken chart doesn't take down the worker or the batch.
+    Args:
+        indexed_job (tuple): (index, ChartJob)
+    """
+
+    index, job = indexed_job
+    start = time.perf_counter()
+    try:
+        job.function(**job.kwargs)
+    except Exception as e:
+        return ChartJobResult(job, index, time.perf_counter() - start, f"{type(e).__name__}: {e}", traceback.format_exc())
+    return ChartJobResult(job, index, time.perf_counter() - start)
+
+def future_result(future, indexed_job):
+    """
+    Result of a job run on a ProcessPoolExecutor. A job whose worker process died (segfault, OOM killer, os._exit) or that couldn't be sent
+    to a worker is reported as a failed ChartJobResult instead of stopping the batch.
+    Args:
+        future (Future): Future of run_job(indexed_job)
+        indexed_job (tuple): (index, ChartJob)
+    """
+
+    try:
+        return future.result()
+    except Exception as e: # BrokenProcessPool for the jobs that were running when a worker died
+        index, job = indexed_job
+        return ChartJobResult(job, index, 0.0, f"{type(e).__name__}: {e}", traceback.format_exc())
+
+def stop_workers(executor):
+    """
+    Shut down an executor without waiting for the jobs it's running, after an exception or Ctrl-C.
+    """
+
+    if hasattr(executor, "terminate_workers"): # Python 3.14+
+        executor.terminate_workers()
+        return
+    for process in list((executor._processes or {}).values()): # No public way to do this before Python 3.14
+        process.terminate()
+    executor.shutdown(wait=True)
+
+def start_forked_worker():
+    """
+    Pool initializer for forked workers. A ChartRenderer running in the parent is inherited without its writer thread or Kaleido server,
+    so PNGs queued on it would never be written. Workers write their PNGs directly instead.
+    """
+
+    from chart_utils import ChartUtils
+    ChartUtils.renderer = None
+
+def load_worker_dataset(dataset_directory, arrow_store=None):
+    """
+    Pool initializer for start methods that don't fork, each worker loads the session dataset once (from the dataset cache if it's there).
+    With an arrow_store the worker opens it memory-mapped instead, which is almost instant and shares the data with the other workers.
+    """
+
+    import mcdowell_dataset_analysis as mda # Imported here since mcdowell_dataset_analysis imports this module
+    mda.DatasetSession.default_directory = dataset_directory # So chart functions use it too
+    mda.DatasetSession.get(dataset_directory, arrow_store=arrow_store)
+
+def print_progress(result, completed, total):
+    """
+    Default progress callback, one line per finished job.
+    """
+
+    status = "ok" if result.succeeded else f"FAILED {result.error}"
+    print(f"[{completed}/{total}] {result.job.name}: {status} ({result.duration:.1f}s)", flush=True)
+
+class ChartBatch:
+    """
+    Generate many independent charts across a pool of worker processes.
+
+    The session dataset (mda.DatasetSession) is loaded once in this process before the pool starts.
+    Where fork is available (Linux) workers inherit it without loading or copying anything,
+    otherwise each worker loads it once when it starts. Chart functions pick it up as usual since they default to the session dataset.
+
+    Inherited dataframes are still copied bit by bit, since Python writes to the memory of every string object it touches.
+    With arrow_store the dataset is exported to a memory-mapped Arrow store (see DatasetStore) and every worker opens that instead,
+    so they start in milliseconds and share one copy of the data no matter how many there are.
+
+    Usage:
+        batch = mda.ChartBatch()
+        batch.add(scg.launches_vs_year_by_orbit, chart_title_prefix="Falcon 9", output_prefix="f9", launch_vehicle_simplified_name="Falcon 9")
+        batch.add(scg.generate_launch_vehicle_charts, launch_vehicle_simplified_name="Electron", chart_title_prefix="Electron", output_prefix="electron")
+        results = batch.run()
+
+    Scripts that run a batch need an if __name__ == "__main__": guard on platforms without fork (Windows, macOS).
+    A ChartRenderer only renders PNGs for jobs run in its own process (processes=1), worker processes write theirs directly.
+    """
+
+    def __init__(self, processes=None, dataset_directory=None, progress=print_progress, arrow_store=None):
+        """
+        Args:
+            processes (int, optional): Number of worker processes. 1 runs every job in this process. Defaults to the number of CPUs.
+            dataset_directory (str, optional): Dataset directory the chart functions use, it's the session's default directory (DatasetSession.default_directory) while the batch runs. Defaults to DatasetSession.default_directory ("./datasets").
+            progress (function, optional): Called as progress(result, completed, total) as each job finishes. None for no output. Defaults to print_progress.
+            arrow_store (str, optional): Directory to export the session dataset to as a memory-mapped Arrow store that the workers share, eg. "./datasets/.arrow". Defaults to None.
+        """
+
+        self.processes = processes or os.cpu_count() or 1
+        self.dataset_directory = dataset_directory
+        self.progress = progress
+        self.arrow_store = arrow_store
+        self.jobs = []
+
+    def add(self, function, name=None, **kwargs):
+        """
+        Queue a chart.
+        Args:
+            function (function): Chart function, eg. scg.launches_vs_year_by_orbit
+            name (str, optional): Name shown in progress output.
+            **kwargs: Keyword arguments for the chart function.
+        """
+
+        self.jobs.append(ChartJob(function, kwargs, name))
+
+    def run(self):
+        """
+        Run all queued jobs and clear the queue.
+
+        Returns:
+            list ChartJobResult: One result per job, in the order the jobs were added.
+        """
+
+        jobs, self.jobs = list(enumerate(self.jobs)), []
+        results = [None] * len(jobs)
+
+        import mcdowell_dataset_analysis as mda # Imported here since mcdowell_dataset_analysis imports this module
+        dataset_directory = self.dataset_directory or mda.DatasetSession.default_directory
+
+        # Chart functions use the session's dataset for the default directory, so point it at this one while the batch runs (forked workers inherit it)
+        previous_directory = mda.DatasetSession.default_directory
+        mda.DatasetSession.default_directory = dataset_directory
+        try:
+            dataset = mda.DatasetSession.get(dataset_directory) # Load before forking so workers share it
+            if self.arrow_store is not None and dataset.arrow_store != self.arrow_store:
+                # Export once, then this process and the workers all use the memory-mapped copy
+                dataset.export_arrow(self.arrow_store)
+                mda.DatasetSession.set(mda.McdowellDataset(dataset_directory, arrow_store=self.arrow_store), dataset_directory)
+
+            sequential = self.processes == 1 or len(jobs) <= 1
+            finished = map(run_job, jobs) if sequential else self.run_in_workers(jobs, dataset_directory)
+
+            try:
+                for completed, result in enumerate(finished, start=1):
+                    results[result.index] = result
+                    if self.progress:
+                        self.progress(result, completed, len(jobs))
+            finally:
+                if not sequential:
+                    finished.close() # Stops the workers without waiting for their jobs if we're leaving early (exception or Ctrl-C)
+        finally:
+            mda.DatasetSession.default_directory = previous_directory
+
+        return results
+
+    def create_executor(self, workers, dataset_directory):
+        """
+        Worker processes that inherit the session dataset by forking where possible, otherwise each loads it once when it starts.
+        """
+
+        if "fork" in multiprocessing.get_all_start_methods():
+            return concurrent.futures.ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"), initializer=start_forked_worker)
+        return concurrent.futures.ProcessPoolExecutor(workers, initializer=load_worker_dataset, initargs=(dataset_directory, self.arrow_store))
+
+    def run_in_workers(self, jobs, dataset_directory, processes=None, retry_lost=True):
+        """
+        Run jobs on worker processes, yielding each result as soon as its job finishes.
+
+        A worker process can die without raising anything (a Kaleido segfault, the OOM killer, os._exit). multiprocessing.Pool would replace it
+        and wait forever for the lost job, a ProcessPoolExecutor fails every job it was given with BrokenProcessPool instead.
+        Only as many jobs as there are workers are sent at a time, so the jobs lost are the ones that were running, and the rest carry on with a new executor.
+        Lost jobs are run again one at a time at the end, so only the job that kills its worker is reported as failed.
+
+        Args:
+            jobs (list): (index, ChartJob) tuples
+            dataset_directory (str): Session dataset directory, loaded by workers that aren't forked
+            processes (int, optional): Number of worker processes. Defaults to self.processes.
+            retry_lost (bool, optional): If True, jobs lost to a dead worker are run again one at a time, otherwise they're reported as failed. Defaults to True.
+        """
+
+        processes = processes or self.processes
+        pending = list(reversed(jobs)) # Popped from the end, so jobs start in the order they were added
+        lost = []
+        while pending:
+            workers = min(processes, len(pending))
+            executor = self.create_executor(workers, dataset_directory)
+            running = {}
+            broken = False
+            try:
+                while running or (pending and not broken):
+                    while pending and not broken and len(running) < workers:
+                        indexed_job = pending.pop()
+                        try:
+                            running[executor.submit(run_job, indexed_job)] = indexed_job
+                        except concurrent.futures.process.BrokenProcessPool: # A worker died since the last result
+                            pending.append(indexed_job)
+                            broken = True
+
+                    done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        indexed_job = running.pop(future)
+                        if isinstance(future.exception(), concurrent.futures.process.BrokenProcessPool):
+                            broken = True
+                            if retry_lost:
+                                lost.append(indexed_job)
+                                continue
+                        yield future_result(future, indexed_job)
+            except BaseException: # Including GeneratorExit when run() stops early
+                for future in running:
+                    future.cancel()
+                stop_workers(executor)
+                raise
+            executor.shutdown()
+
+        if lost:
+            yield from self.run_in_workers(sorted(lost, key=lambda indexed_job: indexed_job[0]), dataset_directory, processes=1, retry_lost=False)
+
+    @staticmethod
+    def failures(results):
+        """
+        Failed results from run(), with their tracebacks for logging.
+        """
+
+        return [result for result in results if not result.succeeded]
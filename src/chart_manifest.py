@@ -0,0 +1,272 @@
+"""
+Declarative chart manifests.
+
+A manifest lists the charts to generate as data instead of Python calls, eg. in YAML:
+
+    defaults:                  # Added to every chart that takes the argument and doesn't set it
+      color_map: ChartUtils.color_sequence_2_6
+
+    datasets:                  # Named filter chains, filters run in order
+      f9_orbital:
+        filters:
+          - {filter: filter_by_launch_category, args: [[O, D]]}
+          - {filter: filter_by_launch_vehicle_name_simplified, args: [Falcon 9]}
+      f9_orbital_2010:
+        base: f9_orbital       # Starts from the rows of another dataset
+        filters:
+          - {filter: filter_by_launch_date, start_date: "2010-01-01", end_date: cutoff}
+
+    charts:
+      - chart: launches_vs_year_by_orbit     # Function in standard_chart_generation
+        dataset: f9_orbital_2010             # Or inline "filters: [...]"
+        chart_title_prefix: Falcon 9
+        output_prefix: f9
+        launch_vehicle_simplified_name: Falcon 9
+
+Filter steps run on dataset.launch unless they set "on: satcat". "args" are positional arguments, every other key is a keyword argument.
+"cutoff" as a filter argument is replaced with the dataset's last updated date.
+Chart arguments written as "Filters.name" or "ChartUtils.name" are replaced with that filter function or color map.
+
+Filter chains are compiled into a tree of steps (a DAG where each step depends on the one before it).
+Charts that share the first steps of their chains share those nodes, so eg. "orbital Falcon 9 launches" is computed once no matter how many charts start from it.
+Every node is computed once in this process before the charts are rendered in parallel with ChartBatch, forked workers get them for free.
+"""
+
+import inspect
+import json
+import os
+import chart_batch
+from chart_utils import ChartUtils
+from dataframe_filters import Filters
+
+class ChartManifest:
+    """
+    A list of chart specs that can be compiled into shared filter steps and rendered in parallel.
+
+    Usage:
+        manifest = ChartManifest.load("examples/manifests/v2.yaml")
+        print(manifest.describe())
+        results = manifest.run()
+    """
+
+    computed = {} # Node key: filtered McdowellDataset view, for this process
+
+    def __init__(self, manifest):
+        """
+        Args:
+            manifest (dict): Parsed manifest with "charts" and optionally "defaults" and "datasets".
+        """
+
+        self.defaults = manifest.get("defaults") or {}
+        self.datasets = manifest.get("datasets") or {}
+        self.charts = manifest.get("charts") or []
+
+    @staticmethod
+    def load(path):
+        """
+        Load a manifest file. The format is picked from the extension: .json, .toml or .yaml/.yml (requires PyYAML).
+        Args:
+            path (str): Manifest file path
+        """
+
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".json":
+            with open(path, "r", encoding="utf-8") as f:
+                return ChartManifest(json.load(f))
+        if extension == ".toml":
+            try:
+                import tomllib
+            except ImportError: # Python < 3.11
+                try:
+                    import tomli as tomllib
+                except ImportError:
+                    raise ImportError("TOML chart manifests on Python < 3.11 require tomli (pip install mcdowell-dataset-analysis[manifest]), or use .json")
+            with open(path, "rb") as f:
+                return ChartManifest(tomllib.load(f))
+        if extension in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML chart manifests require PyYAML (pip install mcdowell-dataset-analysis[manifest]), or use .json or .toml")
+            with open(path, "r", encoding="utf-8") as f:
+                return ChartManifest(yaml.safe_load(f))
+        raise ValueError(f"Unknown chart manifest format '{extension}', use .json, .toml, .yaml or .yml")
+
+    def dataset_steps(self, name, seen=()):
+        """
+        Full list of filter steps for a named dataset, including the steps of its base datasets.
+        """
+
+        if name not in self.datasets:
+            raise ValueError(f"Chart manifest dataset '{name}' is not defined")
+        if name in seen:
+            raise ValueError(f"Chart manifest dataset '{name}' is its own base")
+
+        dataset = self.datasets[name]
+        steps = self.dataset_steps(dataset["base"], seen + (name,)) if dataset.get("base") else []
+        return steps + [ChartManifest.parse_step(step) for step in dataset.get("filters") or []]
+
+    @staticmethod
+    def parse_step(step):
+        """
+        Turn a filter step from the manifest into (on, filter name, args, kwargs).
+        """
+
+        step = dict(step)
+        name = step.pop("filter")
+        on = step.pop("on", "launch")
+        args = step.pop("args", [])
+        if not isinstance(args, list):
+            args = [args]
+
+        if on not in ("launch", "satcat"):
+            raise ValueError(f"Filter step {name} has on: '{on}', must be 'launch' or 'satcat'")
+        if not hasattr(Filters, name):
+            raise ValueError(f"Unknown filter function '{name}'")
+        return [on, name, args, step]
+
+    @staticmethod
+    def step_key(steps):
+        """
+        Key for the node at the end of a list of steps, equal steps in the same order give the same key.
+        """
+
+        return json.dumps(steps, sort_keys=True, default=str)
+
+    @staticmethod
+    def resolve_references(value):
+        """
+        Replace "Filters.name" and "ChartUtils.name" strings with the objects they name, in lists and dicts too.
+        """
+
+        if isinstance(value, list):
+            return [ChartManifest.resolve_references(item) for item in value]
+        if isinstance(value, dict):
+            return {key: ChartManifest.resolve_references(item) for key, item in value.items()}
+        if isinstance(value, str):
+            for prefix, namespace in (("Filters.", Filters), ("ChartUtils.", ChartUtils)):
+                if value.startswith(prefix):
+                    if not hasattr(namespace, value[len(prefix):]):
+                        raise ValueError(f"Unknown reference '{value}' in chart manifest")
+                    return getattr(namespace, value[len(prefix):])
+        return value
+
+    def compile(self):
+        """
+        Compile the charts into shared filter nodes and chart jobs.
+
+        Returns:
+            tuple(dict, list ChartJob):
+                nodes: node key: {"steps": steps up to and including this node, "charts": number of charts that use it}, in dependency order.
+                jobs: One ChartJob per chart.
+        """
+
+        import standard_chart_generation # Imported here since it imports mcdowell_dataset_analysis, which imports this module
+
+        nodes = {}
+        jobs = []
+
+        for index, spec in enumerate(self.charts):
+            spec = dict(spec)
+            chart = spec.pop("chart", None)
+            dataset_name = spec.pop("dataset", None)
+            inline_filters = spec.pop("filters", None) or []
+
+            function = getattr(standard_chart_generation, chart, None) if chart else None
+            if not callable(function):
+                raise ValueError(f"Chart {index} in manifest: unknown chart function '{chart}'")
+            parameters = inspect.signature(function).parameters
+
+            # Defaults only go to charts that take that argument
+            spec = {**{key: value for key, value in self.defaults.items() if key in parameters}, **spec}
+
+            steps = self.dataset_steps(dataset_name) if dataset_name else []
+            steps = steps + [ChartManifest.parse_step(step) for step in inline_filters]
+            if steps and "dataset" not in parameters:
+                raise ValueError(f"Chart {index} in manifest: {chart} doesn't take a dataset argument so it can't use filters")
+
+            # Every prefix of the chain is a node, charts with the same first steps share them
+            for length in range(1, len(steps) + 1):
+                key = ChartManifest.step_key(steps[:length])
+                nodes.setdefault(key, {"steps": steps[:length], "charts": 0})
+                nodes[key]["charts"] += 1
+
+            kwargs = ChartManifest.resolve_references(spec)
+            name = " ".join(str(part) for part in [chart, kwargs.get("output_prefix"), kwargs.get("output_suffix")] if part is not None)
+            jobs.append(chart_batch.ChartJob(render_chart, {"chart": chart, "steps": steps, "chart_kwargs": kwargs}, name))
+
+        return nodes, jobs
+
+    def describe(self):
+        """
+        Text view of the compiled filter tree, one line per node with how many charts share it.
+        """
+
+        nodes, jobs = self.compile()
+        lines = [f"{len(jobs)} charts, {len(nodes)} shared filter steps"]
+        for node in nodes.values():
+            on, name, args, kwargs = node["steps"][-1]
+            arguments = ", ".join([json.dumps(arg, default=str) for arg in args] + [f"{key}={json.dumps(value, default=str)}" for key, value in kwargs.items()])
+            lines.append(f"{'  ' * len(node['steps'])}{on}: {name}({arguments}) - {node['charts']} charts")
+        return "\n".join(lines)
+
+    def run(self, processes=None, progress=chart_batch.print_progress):
+        """
+        Compute every shared filter node once, then render all charts in parallel.
+        Args:
+            processes (int, optional): Worker processes, see ChartBatch. Defaults to the number of CPUs.
+            progress (function, optional): Progress callback, see ChartBatch. Defaults to print_progress.
+
+        Returns:
+            list ChartJobResult: One result per chart, in manifest order.
+        """
+
+        nodes, jobs = self.compile()
+
+        # Compute nodes before the pool forks so workers inherit them instead of computing their own
+        for node in nodes.values():
+            compute_steps(node["steps"])
+
+        batch = chart_batch.ChartBatch(processes=processes, progress=progress)
+        batch.jobs = jobs
+        try:
+            return batch.run()
+        finally:
+            ChartManifest.computed.clear()
+
+def compute_steps(steps):
+    """
+    Filtered view of the session dataset after a list of steps. Each node is computed once per process from the node before it.
+    """
+
+    import mcdowell_dataset_analysis as mda # Imported here since mcdowell_dataset_analysis imports this module
+
+    key = ChartManifest.step_key(steps)
+    if key in ChartManifest.computed:
+        return ChartManifest.computed[key]
+
+    if not steps:
+        dataset = mda.DatasetSession.view()
+    else:
+        dataset = compute_steps(steps[:-1]).view()
+        on, name, args, kwargs = steps[-1]
+        args = [dataset.date_updated if arg == "cutoff" else arg for arg in args]
+        kwargs = {key: dataset.date_updated if value == "cutoff" else value for key, value in kwargs.items()}
+        filtered = getattr(Filters, name)(getattr(dataset, on), *args, **kwargs)
+        setattr(dataset, on, filtered)
+
+    ChartManifest.computed[key] = dataset
+    return dataset
+
+def render_chart(chart, steps, chart_kwargs):
+    """
+    ChartBatch job for one manifest chart: look up its filter node and call the chart function with it.
+    """
+
+    import standard_chart_generation
+
+    function = getattr(standard_chart_generation, chart)
+    if steps:
+        function(**chart_kwargs, dataset=compute_steps(steps))
+    else:
+        function(**chart_kwargs)
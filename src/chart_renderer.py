@@ -0,0 +1,175 @@
+import queue
+import threading
+import plotly.io as pio
+from chart_utils import ChartUtils
+
+try:
+    import kaleido
+except ImportError: # write_image raises its own error about installing kaleido
+    kaleido = None
+
+class ChartRenderer:
+    """
+    Background PNG writer that keeps Kaleido running and renders figures in batches.
+
+    Calling pio.write_image() for every chart starts a render round trip to Kaleido/Chromium each time, which is most of the time spent on a large chart run.
+    While a renderer is running, ChartUtils.write_png() just queues the figure and returns, so the next chart's data is computed while this one is written.
+    A background thread takes everything that's queued and writes it with one pio.write_images() call through a persistent Kaleido server with several render tabs.
+
+    With Kaleido < 1.0 (no write_images or sync server) figures are written one at a time on the background thread, which still overlaps with computing the next chart.
+
+    Usage:
+        with ChartRenderer():
+            scg.generate_launch_vehicle_charts(...) # PNGs are written in the background
+        # All PNGs are written here
+    """
+
+    def __init__(self, renderers=2, batch_size=16, width=1280, height=720, max_queued=None):
+        """
+        Args:
+            renderers (int, optional): Number of Kaleido render tabs, figures in a batch are rendered in parallel across them. Defaults to 2.
+            batch_size (int, optional): Maximum number of figures sent to Kaleido at once. Defaults to 16.
+            width (int, optional): Image width in pixels. Defaults to 1280.
+            height (int, optional): Image height in pixels. Defaults to 720.
+            max_queued (int, optional): Maximum number of figures waiting to be written, submit() blocks when it's reached so figures don't pile up in memory. Defaults to 4 * batch_size.
+        """
+
+        self.renderers = renderers
+        self.batch_size = batch_size
+        self.width = width
+        self.height = height
+        self.queue = queue.Queue(maxsize=max_queued or 4 * batch_size)
+        self.thread = None
+        self.server_started = False
+        self.errors = [] # (output_path, exception) for every figure that failed to write
+        self.callback_errors = [] # (output_path, exception) for every figure that was written but whose on_written raised
+
+    def start(self):
+        """
+        Start the Kaleido server and the writer thread, and send ChartUtils PNGs to this renderer.
+        """
+
+        if self.thread is not None:
+            return
+
+        if kaleido is not None and hasattr(kaleido, "start_sync_server"):
+            kaleido.start_sync_server(n=self.renderers, silence_warnings=True)
+            self.server_started = True
+
+        self.thread = threading.Thread(target=self.write_queued_figures, name="ChartRenderer", daemon=True)
+        self.thread.start()
+        ChartUtils.renderer = self
+
+    def submit(self, fig, output_path, on_written=None):
+        """
+        Queue a figure to be written as a PNG. Returns immediately unless max_queued figures are already waiting, then it waits for the writer thread to catch up.
+        Args:
+            fig (Figure): Plotly figure, shouldn't be modified after it's submitted.
+            output_path (str): PNG path, the directory must already exist.
+            on_written (function, optional): Called with no arguments on the writer thread once the PNG is written.
+        """
+
+        if self.thread is None:
+            raise RuntimeError("ChartRenderer.submit() called before start()")
+        self.queue.put((fig, output_path, on_written))
+
+    def flush(self):
+        """
+        Wait until every queued figure is written.
+
+        Raises:
+            RuntimeError: If any figure failed to write, or its on_written callback raised, since the last flush.
+        """
+
+        self.queue.join()
+        if self.errors or self.callback_errors:
+            errors, self.errors = self.errors, []
+            callback_errors, self.callback_errors = self.callback_errors, []
+            messages = []
+            if errors:
+                messages.append(f"{len(errors)} chart(s) failed to write:\n" + "\n".join(f"{path}: {type(e).__name__}: {e}" for path, e in errors))
+            if callback_errors:
+                messages.append(f"{len(callback_errors)} chart(s) were written but on_written failed:\n" + "\n".join(f"{path}: {type(e).__name__}: {e}" for path, e in callback_errors))
+            raise RuntimeError("\n".join(messages))
+
+    def close(self):
+        """
+        Write all queued figures, stop the writer thread and Kaleido server, and go back to ChartUtils writing PNGs directly.
+        """
+
+        if self.thread is None:
+            return
+
+        try:
+            self.flush()
+        finally:
+            self.queue.put(None) # Tells the writer thread to stop
+            self.thread.join()
+            self.thread = None
+            if ChartUtils.renderer is self:
+                ChartUtils.renderer = None
+            if self.server_started:
+                kaleido.stop_sync_server(silence_warnings=True)
+                self.server_started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def write_queued_figures(self):
+        """
+        Writer thread loop: wait for a figure, take whatever else is queued up to batch_size, write them all at once.
+        """
+
+        while True:
+            batch = [self.queue.get()]
+            while batch[-1] is not None and len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is None
+            figures = [item for item in batch if item is not None]
+            if figures:
+                self.write_batch(figures)
+
+            for _ in batch:
+                self.queue.task_done()
+            if stop:
+                return
+
+    def write_batch(self, figures):
+        """
+        Write a list of (fig, output_path, on_written), in one Kaleido call if possible.
+        If the batch call fails, each figure is retried on its own so one bad figure doesn't lose the rest.
+        on_written is called for each figure after it's written, outside the write so a failing callback doesn't make the figure be written again.
+        """
+
+        written = None
+        if self.server_started and hasattr(pio, "write_images"):
+            try:
+                pio.write_images([fig for fig, _, _ in figures], [path for _, path, _ in figures], format="png", width=self.width, height=self.height)
+                written = figures
+            except Exception as e:
+                print(f"Chart batch of {len(figures)} could not be written, writing them one at a time: {type(e).__name__}: {e}")
+
+        if written is None:
+            written = []
+            for fig, output_path, on_written in figures:
+                try:
+                    pio.write_image(fig, output_path, format="png", width=self.width, height=self.height)
+                except Exception as e:
+                    self.errors.append((output_path, e))
+                    continue
+                written.append((fig, output_path, on_written))
+
+        for _, output_path, on_written in written:
+            if on_written:
+                try:
+                    on_written()
+                except Exception as e:
+                    self.callback_errors.append((output_path, e))
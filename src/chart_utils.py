@@ -1,14 +1,19 @@
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.io as pio
-import copy
 import os
+import dataset_view
+from dataframe_filters import Filters
 
 class ChartUtils:
     """
     This class contains utility functions for working with dataframes and generating charts.
     """
     
+    renderer = None # Running ChartRenderer, PNGs are written directly if None
+    output_cache = None # Running OutputCache, every output is written if None
+    
     orbit_color_map = {
         'LEO': '#ffc000',
         'SSO': "#ffdf80",
@@ -181,7 +186,7 @@ class ChartUtils:
         See Pandas documentation for more details:
         https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.pivot.html
         """
-        pivoted = df.pivot_table(index=index_col, columns=column_col, values=value_col) # pivot_table supports duplicate indexes, unlike pd.pivot
+        pivoted = df.pivot_table(index=index_col, columns=column_col, values=value_col, observed=True) # pivot_table supports duplicate indexes, unlike pd.pivot. observed=True so categorical columns don't add empty columns
         pivoted = pivoted.reset_index().sort_values(by=index_col)
         return pivoted
 
@@ -211,6 +216,11 @@ class ChartUtils:
         Notice that labels are between the bins. The bins variable specifies the edges of the bins.
         """
         
+        if count_values and not bin_column:
+            counts = ChartUtils.count_into_bins(dataframe[value_col], bins, labels)
+            if counts is not None:
+                return counts
+        
         if bin_column:
             dataframe[bin_column] = pd.cut(dataframe[value_col], bins=bins, labels=labels, include_lowest=True)
             binned = dataframe
@@ -220,6 +230,165 @@ class ChartUtils:
             binned = binned.value_counts().reindex(labels)
         return binned
  
+    @staticmethod
+    def bin_indices(values, bins):
+        """
+        Bin of each value, using the same bins as pd.cut(values, bins, include_lowest=True): (edge, next edge], with the lowest edge in the first bin.
+        
+        Bins one integer wide (eg. years, or months as year*12 + month) are just an offset from the first edge,
+        other bins (eg. payload mass ranges) are found with one np.searchsorted over the edges.
+        
+        Args:
+            values (Series): Numeric values, eg. Payload_Mass
+            bins (list): Increasing bin edges, eg. [0, 1000, 2000, 3000]
+            
+        Returns:
+            ndarray int or None: Bin index of each value, -1 for NaN and values outside the bins. None if values or bins aren't numeric (then use pd.cut).
+        """
+        
+        if len(bins) < 2 or pd.api.types.is_bool_dtype(values.dtype) or not (pd.api.types.is_integer_dtype(values.dtype) or pd.api.types.is_float_dtype(values.dtype)):
+            return None
+        try:
+            edges = np.asarray(bins, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+        if not np.all(np.diff(edges) > 0):
+            return None
+        
+        array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        inside = (array >= edges[0]) & (array <= edges[-1]) # Also False for NaN
+        
+        if np.all(np.diff(edges) == 1) and edges[0] == np.floor(edges[0]):
+            index = np.ceil(np.where(inside, array, edges[0])) - edges[0] - 1
+        else:
+            index = np.searchsorted(edges, np.where(inside, array, edges[0]), side="left") - 1
+        
+        return np.where(inside, np.maximum(index, 0), -1).astype(np.int64)
+    
+    @staticmethod
+    def count_into_bins(values, bins, labels):
+        """
+        Same result as count_values_into_bins(count_values=True) but with bin_indices() and np.bincount instead of pd.cut and value_counts.
+        
+        Returns:
+            Series or None: Count per label, or None if values or bins aren't numeric (then use pd.cut)
+        """
+        
+        index = ChartUtils.bin_indices(values, bins)
+        if index is None or len(labels) != len(bins) - 1:
+            return None
+        counts = np.bincount(index[index >= 0], minlength=len(labels))
+        return pd.Series(counts, index=pd.Index(labels, name=values.name), name="count")
+    
+    @staticmethod
+    def apply_filter_function(dataset, filter_function, filter_function_parameter, filter_function_additional_parameter=None):
+        """
+        Apply a filter function to a view of the dataset, the dataset itself isn't modified. No more copy.deepcopy() for every filter parameter!
+        
+        Args:
+            dataset (launch, satcat or a view): Dataset to filter
+            filter_function (mda.Filters...): Filter function to be applied
+            filter_function_parameter: Parameter for the filter function, eg. 'LEO'
+            filter_function_additional_parameter (optional): Passed as the third argument to the filter function if not None.
+            
+        Returns:
+            DatasetView: The filtered view
+        """
+        
+        view = dataset.view()
+        if filter_function_additional_parameter is not None: # This is getting ugly
+            filtered = filter_function(view, filter_function_parameter, filter_function_additional_parameter)
+        else:
+            filtered = filter_function(view, filter_function_parameter)  # Apply the filter function
+        
+        # Filters return the new view, custom filter functions that just set view.df don't return anything
+        return filtered if isinstance(filtered, dataset_view.DatasetView) else view
+ 
+    @staticmethod
+    def partition_by_equality_filter(dataset, filter_function, filter_function_parameters_list):
+        """
+        Split a dataset into one view per filter parameter in a single pass, for filters in Filters.equality_filters (orbit, launch vehicle, pad, program, country, etc.)
+        
+        The filter column is factorized once and the row positions of each value are found with one sort,
+        so each parameter is just a lookup instead of another pass over the whole dataset.
+        Gives the same rows in the same order as running the filter once per parameter.
+        
+        Args:
+            dataset (launch, satcat or a view): Dataset to split
+            filter_function (mda.Filters...): Filter function, eg. mda.Filters.filter_by_orbit
+            filter_function_parameters_list (list): List of parameters, eg. ['LEO', 'SSO'] or [['LEO', 'SSO'], ['GTO']]
+            
+        Returns:
+            list DatasetView or None: One view per parameter, or None if the filter can't be done this way (then use apply_filter_function)
+        """
+        
+        split = ChartUtils.equality_filter_codes(dataset, filter_function, filter_function_parameters_list)
+        if split is None:
+            return None
+        view, codes, parameter_codes = split
+        
+        # Row positions grouped by value, a stable sort keeps the original row order within each value
+        order = np.argsort(codes, kind="stable")
+        boundaries = np.searchsorted(codes[order], np.arange(codes.max(initial=-1) + 2))
+        
+        views = []
+        for value_codes in parameter_codes:
+            positions = np.concatenate([order[boundaries[code]:boundaries[code + 1]] for code in value_codes]) if len(value_codes) else np.array([], dtype=np.int64)
+            if len(value_codes) > 1:
+                positions.sort() # Back into the original row order
+            views.append(view.take(positions))
+        return views
+    
+    @staticmethod
+    def equality_filter_codes(dataset, filter_function, filter_function_parameters_list):
+        """
+        Factorize the column behind an equality filter (see Filters.equality_filters) and find which values each filter parameter selects.
+        
+        Returns:
+            tuple or None: (view, integer code of each row (-1 for NaN), list of the codes each parameter selects), or None if the filter can't be done this way
+        """
+        
+        if filter_function not in Filters.equality_filters:
+            return None
+        
+        column, first_character, dataset_type = Filters.equality_filters[filter_function]
+        view = dataset.view()
+        if dataset_type is not None and view.dataset_type != dataset_type:
+            return None # Let the filter itself raise its usual error
+        if not all(type(parameter) == str or pd.api.types.is_list_like(parameter) for parameter in filter_function_parameters_list):
+            return None
+        
+        values = view.column(column)
+        if first_character:
+            values = values.str[0]
+        
+        codes, uniques = pd.factorize(values)
+        uniques = pd.Index(uniques)
+        
+        parameter_codes = []
+        for parameter in filter_function_parameters_list:
+            wanted = [parameter] if type(parameter) == str else list(parameter)
+            value_codes = np.unique(uniques.get_indexer(wanted))
+            parameter_codes.append(value_codes[value_codes >= 0])
+        return view, codes, parameter_codes
+    
+    @staticmethod
+    def filter_dataset_by_each_parameter(dataset, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None):
+        """
+        Apply a filter function once for each parameter, eg. once for each orbit. The dataset itself isn't modified.
+        Uses partition_by_equality_filter() when possible, otherwise apply_filter_function() for each parameter.
+        
+        Returns:
+            list DatasetView: One filtered view per parameter, in the same order
+        """
+        
+        if filter_function_additional_parameter is None:
+            views = ChartUtils.partition_by_equality_filter(dataset, filter_function, filter_function_parameters_list)
+            if views is not None:
+                return views
+        
+        return [ChartUtils.apply_filter_function(dataset, filter_function, parameter, filter_function_additional_parameter) for parameter in filter_function_parameters_list]
+ 
     def bin_dataset_into_dictionary_by_filter_function(dataset, filter_function, filter_function_parameters_list, value_col, bins, bin_labels, keys=None, count_values=True, bin_column=None, filter_function_additional_parameter=None):
         """Filters a dataset by a given filter function and returns a dataframe for each filter function parameter.
         
@@ -245,15 +414,85 @@ class ChartUtils:
         if keys is None:
             keys = filter_function_parameters_list
         output_dict = {}
-        for filter_function_parameter, key in zip(filter_function_parameters_list, keys):
-            new_dataset = copy.deepcopy(dataset)  # Create a copy of the dataframe to avoid modifying the original, bad solution tbh. Deep copy is required bc dataset is part of another class (i think this is why).
-            if filter_function_additional_parameter is not None: # This is getting ugly
-                filter_function(new_dataset, filter_function_parameter, filter_function_additional_parameter)
-            else:
-                filter_function(new_dataset, filter_function_parameter)  # Apply the filter function
-            output_dict[key] = ChartUtils.count_values_into_bins(new_dataset.df, value_col, bins, bin_labels, count_values, bin_column)
+        new_datasets = ChartUtils.filter_dataset_by_each_parameter(dataset, filter_function, filter_function_parameters_list, filter_function_additional_parameter)
+        for new_dataset, key in zip(new_datasets, keys):
+            dataframe = new_dataset.df if bin_column or not count_values else new_dataset.column(value_col).to_frame() # Counting only needs the one column
+            output_dict[key] = ChartUtils.count_values_into_bins(dataframe, value_col, bins, bin_labels, count_values, bin_column)
         return output_dict
 
+    @staticmethod
+    def bin_dataset_into_matrix_by_filter_function(dataset, filter_function, filter_function_parameters_list, value_col, bins, bin_labels, keys=None, sum_col=None, drop_empty=False, filter_function_additional_parameter=None):
+        """
+        Same idea as bin_dataset_into_dictionary_by_filter_function() then combine_dictionary_of_dataframes(), but every series is binned at once
+        and the labels x series matrix is built directly, without a dataframe per series in between.
+
+        Each row's bin is found once with bin_indices(). For equality filters (see partition_by_equality_filter()) the rows aren't even split up,
+        one np.bincount over (filter value, bin) pairs counts every series in a single pass. Other filters bin each filtered view with np.bincount.
+
+        Args:
+            dataset (launch or satcat): Launch or Satcat dataset (notice this isn't the McDowellDataset, so use dataset.launch or dataset.satcat)
+            filter_function (mda.Filters...): Filter function to be applied
+            filter_function_parameters_list (list): List of parameters, eg. ['LEO', 'SSO', ... , 'BEO'] for orbits
+            value_col (str): Column to be used for binning, eg. 'Payload_Mass'.
+            bins (list int): List of bin edges, eg. [0, 1000, 2000, 3000] for payload mass bins.
+            bin_labels (list str): List of bin labels, eg. ['0-1T', '1-2T', '2-3T'] for payload mass bins.
+            keys (list str, optional): Column names if they should be different from filter_function_parameters_list. Defaults to None.
+            sum_col (str, optional): If provided, sums this column in each bin (eg. total 'Payload_Mass') instead of counting rows. Defaults to None.
+            drop_empty (bool, optional): If True, leaves out series with no rows, eg. launch pads that were never used. Defaults to False.
+            filter_function_additional_parameter (any, optional): Additional parameter for the filter function. Defaults to None.
+
+        Returns:
+            Dataframe: One row per bin label (index named value_col) and one column per key. Counts are ints, sums are floats.
+        """
+
+        if keys is None:
+            keys = filter_function_parameters_list
+        keys = list(keys)
+        bin_count = len(bin_labels)
+
+        split = ChartUtils.equality_filter_codes(dataset, filter_function, filter_function_parameters_list) if filter_function_additional_parameter is None else None
+        if split is not None:
+            view, codes, parameter_codes = split
+            index = ChartUtils.bin_indices(view.column(value_col), bins)
+
+        if split is not None and index is not None and len(bin_labels) == len(bins) - 1:
+            weights = np.nan_to_num(view.column(sum_col).to_numpy(dtype=np.float64, na_value=np.nan)) if sum_col else None
+            value_count = int(codes.max(initial=-1)) + 1
+            rows = (codes >= 0) & (index >= 0)
+
+            # One flat bincount over (value code, bin) pairs, then each parameter adds up the rows of the values it selects
+            flat = np.bincount(codes[rows] * bin_count + index[rows], weights=weights[rows] if sum_col else None, minlength=value_count * bin_count)
+            by_value = flat.reshape(value_count, bin_count)
+            row_counts = np.bincount(codes[codes >= 0], minlength=value_count)
+
+            matrix = np.column_stack([by_value[value_codes].sum(axis=0) for value_codes in parameter_codes]) if keys else np.zeros((bin_count, 0))
+            non_empty = [row_counts[value_codes].sum() > 0 for value_codes in parameter_codes]
+        else:
+            columns = []
+            non_empty = []
+            for new_dataset in ChartUtils.filter_dataset_by_each_parameter(dataset, filter_function, filter_function_parameters_list, filter_function_additional_parameter):
+                values = new_dataset.column(value_col)
+                index = ChartUtils.bin_indices(values, bins)
+                if index is None: # Not numeric, fall back to pd.cut
+                    frame = new_dataset.df[[value_col] + ([sum_col] if sum_col and sum_col != value_col else [])].copy()
+                    frame['Bin'] = pd.cut(frame[value_col], bins=bins, labels=bin_labels, include_lowest=True)
+                    grouped = frame.groupby('Bin', observed=False)
+                    column = grouped[sum_col].sum() if sum_col else grouped.size()
+                    columns.append(column.reindex(bin_labels, fill_value=0).to_numpy())
+                else:
+                    inside = index >= 0
+                    weights = np.nan_to_num(new_dataset.column(sum_col).to_numpy(dtype=np.float64, na_value=np.nan))[inside] if sum_col else None
+                    columns.append(np.bincount(index[inside], weights=weights, minlength=bin_count))
+                non_empty.append(len(values) > 0)
+            matrix = np.column_stack(columns) if columns else np.zeros((bin_count, 0))
+
+        if not sum_col:
+            matrix = matrix.astype(np.int64)
+        output_df = pd.DataFrame(matrix, index=pd.Index(bin_labels, name=value_col), columns=keys)
+        if drop_empty:
+            output_df = output_df.loc[:, non_empty]
+        return output_df
+
     def filter_dataset_into_dictionary_by_filter_function(dataset, filter_function, filter_function_parameters_list, keys=None, filter_function_additional_parameter=None):
         """Same as the above function except we don't count into bins in the end, we just give you the raw dataframes.
 
@@ -268,12 +507,8 @@ class ChartUtils:
         if keys is None:
             keys = filter_function_parameters_list
         output_dict = {}
-        for filter_function_parameter, key in zip(filter_function_parameters_list, keys):
-            new_dataset = copy.deepcopy(dataset)  # Create a copy of the dataframe to avoid modifying the original, bad solution tbh. Deep copy is required bc dataset is part of another class (i think this is why).
-            if filter_function_additional_parameter is not None: # This is getting ugly
-                filter_function(new_dataset, filter_function_parameter, filter_function_additional_parameter)
-            else:
-                filter_function(new_dataset, filter_function_parameter)  # Apply the filter function
+        new_datasets = ChartUtils.filter_dataset_by_each_parameter(dataset, filter_function, filter_function_parameters_list, filter_function_additional_parameter)
+        for new_dataset, key in zip(new_datasets, keys):
             output_dict[key] = new_dataset.df
         return output_dict
 
@@ -304,16 +539,13 @@ class ChartUtils:
         if keys is None:
             keys = groups
         output_dict = {}
-        for group in groups:
-            new_dataset = copy.deepcopy(dataset)
-            if filter_function_additional_parameter is not None: # This is getting ugly
-                filter_function(new_dataset, group, filter_function_additional_parameter)
-            else:
-                filter_function(new_dataset, group)  # Apply the filter function
+        new_datasets = ChartUtils.filter_dataset_by_each_parameter(dataset, filter_function, groups, filter_function_additional_parameter)
+        for group, new_dataset in zip(groups, new_datasets):
             if count_values:
-                counts = new_dataset.df.groupby(groupby_col).size()
+                values = new_dataset.column(groupby_col) # Counting only needs the one column
+                counts = values.groupby(values, observed=True).size()
             else:
-                counts = new_dataset.df.groupby(groupby_col)
+                counts = new_dataset.df.groupby(groupby_col, observed=True)
             output_dict[group] = counts.rename(group)
         return output_dict
  
@@ -383,7 +615,7 @@ class ChartUtils:
             df_copy = df.copy()
             
             # Group by the specified column and count occurrences for each value
-            daily_counts = df_copy.groupby(column_name).size().reset_index(name='Daily_Count')
+            daily_counts = df_copy.groupby(column_name, observed=True).size().reset_index(name='Daily_Count')
             
             # Create a complete range from min to max to fill missing values with 0
             min_value = daily_counts[column_name].min()
@@ -410,8 +642,110 @@ class ChartUtils:
         
         return cumulative_series
 
+    @staticmethod
+    def cumulative_counts_on_dense_axis(values_dict, index_name=None, fill_method='none', max_points=None):
+        """
+        Cumulative count of every series on one shared dense axis, eg. cumulative payloads for each constellation vs days since its first launch.
+        Gives the same values as create_cumulative_series_by_column() then combine_cumulative_series(), but in NumPy:
+        each series is one np.bincount over the axis and one np.cumsum, instead of a groupby, a merge and a concat per series.
+
+        Args:
+            values_dict (dict): Series name: values to count (integers like days since first launch, or dates which are counted per day).
+            index_name (str, optional): Name of the axis, eg. 'Time_Since_First_Payload'. Defaults to None.
+            fill_method (str, optional): What each series shows after its last value, see combine_cumulative_series():
+                - 'none': NaN (lines end cleanly)
+                - 'forward': Its final count
+                - 'zero': 0
+                Before its first value a series is NaN, or 0 with 'zero'. Defaults to 'none'.
+            max_points (int, optional): If the axis is longer than this, downsample it for plotting with downsample_cumulative_series(). Defaults to None.
+
+        Returns:
+            Dataframe: One row per axis value (every integer or every day from the lowest to the highest value of any series), one float column per series.
+        """
+
+        positions = {}
+        is_dates = False
+        for key, values in values_dict.items():
+            values = pd.Series(values).dropna()
+            if pd.api.types.is_datetime64_any_dtype(values.dtype):
+                is_dates = True
+                array = values.to_numpy(dtype="datetime64[D]").astype(np.int64) # Days since 1970
+            else:
+                array = values.to_numpy(dtype=np.float64)
+                if not np.all(array == np.floor(array)):
+                    raise ValueError(f"cumulative_counts_on_dense_axis() needs integer or date values, series '{key}' has fractional values")
+                array = array.astype(np.int64)
+            positions[key] = array
+
+        non_empty = [array for array in positions.values() if len(array)]
+        start = min(int(array.min()) for array in non_empty) if non_empty else 0
+        end = max(int(array.max()) for array in non_empty) if non_empty else -1
+        length = end - start + 1
+
+        matrix = np.full((length, len(positions)), np.nan)
+        for column, array in enumerate(positions.values()):
+            if not len(array):
+                if fill_method == 'zero':
+                    matrix[:, column] = 0
+                continue
+            counts = np.cumsum(np.bincount(array - start, minlength=length)).astype(np.float64)
+            first, last = int(array.min()) - start, int(array.max()) - start
+            if fill_method != 'zero':
+                counts[:first] = np.nan
+            if fill_method == 'none':
+                counts[last + 1:] = np.nan
+            elif fill_method == 'zero':
+                counts[last + 1:] = 0
+            matrix[:, column] = counts # 'forward' keeps the cumsum, which stays at the final count
+
+        if is_dates:
+            index = pd.DatetimeIndex(np.arange(start, end + 1).astype("datetime64[D]"), name=index_name)
+        else:
+            index = pd.Index(np.arange(start, end + 1), name=index_name)
+        output_df = pd.DataFrame(matrix, index=index, columns=list(positions.keys()))
+
+        if max_points is not None:
+            output_df = ChartUtils.downsample_cumulative_series(output_df, max_points)
+        return output_df
+
+    @staticmethod
+    def downsample_cumulative_series(dataframe, max_points):
+        """
+        Keep about max_points rows of a dataframe of cumulative series for plotting, eg. every 10th day of a 20 year daily axis.
+        Cumulative counts only ever go up, so evenly spaced rows keep the shape of the lines.
+        The first and last rows and the last row of every series are always kept so lines still start and end at the right values.
+
+        Args:
+            dataframe (Dataframe): Cumulative series as columns, eg. from cumulative_counts_on_dense_axis()
+            max_points (int): Approximate number of rows to keep
+
+        Returns:
+            Dataframe: The kept rows
+        """
+
+        length = len(dataframe)
+        if max_points is None or length <= max_points:
+            return dataframe
+
+        step = int(np.ceil(length / max(max_points, 1)))
+        keep = np.zeros(length, dtype=bool)
+        keep[::step] = True
+        keep[-1] = True
+
+        values = dataframe.to_numpy(dtype=np.float64, na_value=np.nan)
+        has_value = ~np.isnan(values)
+        for column in range(values.shape[1]):
+            if has_value[:, column].any():
+                keep[length - 1 - np.argmax(has_value[::-1, column])] = True # Last row with a value
+        return dataframe[keep]
+
     # Histograms are designed for continuous data, while bar charts are for discrete data.
     def plot_histogram(dataframe, title, subtitle, x_label, y_label, output_path, color_map=None, barmode='stack', bargap=0):
+        fingerprint = ChartUtils.output_fingerprint(locals()) # Before any other local variables are created
+        if ChartUtils.output_is_current(output_path, fingerprint):
+            print(f"\r(3/3) {os.path.basename(output_path)} unchanged      ")
+            return
+
         fig = px.histogram(dataframe,
                     x=dataframe.index,
                     y=dataframe.columns,
@@ -459,7 +793,7 @@ class ChartUtils:
         )
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        pio.write_image(fig, output_path, format='png', width=1280, height=720)
+        ChartUtils.write_png(fig, output_path, fingerprint)
         
         ChartUtils.log_and_save_df("png", os.path.basename(output_path))
     
@@ -480,6 +814,11 @@ class ChartUtils:
             x_tick_step_size (int): tick step size
         """
         
+        fingerprint = ChartUtils.output_fingerprint(locals()) # Before any other local variables are created
+        if ChartUtils.output_is_current(output_path, fingerprint):
+            print(f"\r(3/3) {os.path.basename(output_path)} unchanged      ")
+            return
+
         fig = px.bar(dataframe,
                      x=dataframe.index,
                      y=dataframe.columns,
@@ -530,7 +869,7 @@ class ChartUtils:
         )
         
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        pio.write_image(fig, output_path, format='png', width=1280, height=720)
+        ChartUtils.write_png(fig, output_path, fingerprint)
         
         ChartUtils.log_and_save_df("png", os.path.basename(output_path))
     
@@ -551,6 +890,11 @@ class ChartUtils:
             x_axis_type (string): Use 'date' if you want it formatted correctly as a date. Otherwise, None or don't use it.
         """
         
+        fingerprint = ChartUtils.output_fingerprint(locals()) # Before any other local variables are created
+        if ChartUtils.output_is_current(output_path, fingerprint):
+            print(f"\r(3/3) {os.path.basename(output_path)} unchanged      ")
+            return
+
         df = dataframe.copy()
         df[x_col] = pd.to_datetime(df[x_col]) if x_axis_type == 'date' else df[x_col]  # Convert x_col to datetime if x_axis_type is 'date'
         if y_scaling_factor != 1:
@@ -606,7 +950,7 @@ class ChartUtils:
         )
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        pio.write_image(fig, output_path, format='png', width=1280, height=720)
+        ChartUtils.write_png(fig, output_path, fingerprint)
         
         ChartUtils.log_and_save_df("png", os.path.basename(output_path))
     
@@ -629,6 +973,11 @@ class ChartUtils:
             y_axis_type (string, optional): 'linear' or 'log' for y-axis scaling
         """
         
+        fingerprint = ChartUtils.output_fingerprint(locals()) # Before any other local variables are created
+        if ChartUtils.output_is_current(output_path, fingerprint):
+            print(f"\r(3/3) {os.path.basename(output_path)} unchanged      ")
+            return
+
         df = dataframe.copy()
         if x_axis_type == 'date':
             df[x_col] = pd.to_datetime(df[x_col])
@@ -689,18 +1038,128 @@ class ChartUtils:
         )
         
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        pio.write_image(fig, output_path, format='png', width=1280, height=720)
+        ChartUtils.write_png(fig, output_path, fingerprint)
         
         ChartUtils.log_and_save_df("png", os.path.basename(output_path))
     
+    def plot_heatmap(dataframe, x_col, y_col, value_col, title, subtitle, x_label, y_label, output_path, color_scale='Viridis', log_color=False):
+        """
+        Create a heatmap using Plotly Express, eg. objects in orbit by inclination band (x) and altitude band (y).
+        Args:
+            dataframe (Pandas dataframe): Long (sparse) dataframe with one row per non-empty cell, eg. one date of Satcat.shell_occupancy()
+            x_col (string): Column with the x-axis category of each cell
+            y_col (string): Column with the y-axis category of each cell
+            value_col (string): Column with the value of each cell, cells that aren't in the dataframe are 0
+            title (string): Chart title
+            subtitle (string): Chart subtitle
+            x_label (string): Label for x-axis
+            y_label (string): Label for y-axis
+            output_path (string): Path to save the plot
+            color_scale (string or list, optional): Plotly continuous color scale. Defaults to 'Viridis'.
+            log_color (bool, optional): Color by log10(value + 1), so a few very crowded cells don't wash out the rest. Defaults to False.
+        """
+
+        fingerprint = ChartUtils.output_fingerprint(locals()) # Before any other local variables are created
+        if ChartUtils.output_is_current(output_path, fingerprint):
+            print(f"\r(3/3) {os.path.basename(output_path)} unchanged      ")
+            return
+
+        # Dense grid with y going up the chart, categorical columns keep their empty categories (observed=False)
+        grid = dataframe.pivot_table(index=y_col, columns=x_col, values=value_col, aggfunc='sum', fill_value=0, observed=False)
+        values = np.log10(grid.to_numpy(dtype=np.float64) + 1) if log_color else grid.to_numpy()
+
+        fig = px.imshow(
+            values,
+            x=[str(x) for x in grid.columns],
+            y=[str(y) for y in grid.index],
+            origin='lower',
+            aspect='auto',
+            color_continuous_scale=color_scale,
+            title=f'<b>{title}</b><br><sup>{subtitle}</sup>',
+            labels={'x': x_label, 'y': y_label, 'color': f'log10({value_col} + 1)' if log_color else value_col},
+        )
+
+        fig.update_layout(
+            font=dict(family='Arial, sans-serif', size=20, color="#000000"),
+            title=dict(font=dict(size=40, family='Arial, sans-serif', color="#000000"), x=0.025, xanchor="left"),
+            plot_bgcolor="white",
+            paper_bgcolor="white",
+            xaxis=dict(
+                linecolor="#000000",
+                tickangle=45,
+                title_font=dict(size=24, family="Arial, sans-serif"),
+                title_text=x_label,
+            ),
+            yaxis=dict(
+                linecolor="#000000",
+                title_font=dict(size=24, family="Arial, sans-serif"),
+                title_text=y_label,
+            ),
+        )
+
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        ChartUtils.write_png(fig, output_path, fingerprint)
+
+        ChartUtils.log_and_save_df("png", os.path.basename(output_path))
+
+    @staticmethod
+    def write_png(fig, output_path, fingerprint=None):
+        """
+        Write a figure as a 1280x720 PNG. If a ChartRenderer is running, the figure is queued and written in the background instead.
+        Args:
+            fig (Figure): Plotly figure
+            output_path (str): PNG path, the directory must already exist
+            fingerprint (str, optional): From output_fingerprint(), recorded in the output cache once the PNG is written.
+        """
+        
+        if ChartUtils.renderer is not None:
+            ChartUtils.renderer.submit(fig, output_path, on_written=lambda: ChartUtils.record_output(output_path, fingerprint))
+        else:
+            pio.write_image(fig, output_path, format='png', width=1280, height=720)
+            ChartUtils.record_output(output_path, fingerprint)
+    
+    @staticmethod
+    def output_fingerprint(parameters):
+        """
+        Fingerprint of everything that goes into an output file, see OutputCache. None if no OutputCache is running.
+        Args:
+            parameters (dict): eg. locals() at the start of a plot function
+        """
+        
+        if ChartUtils.output_cache is None:
+            return None
+        return ChartUtils.output_cache.fingerprint(parameters)
+    
+    @staticmethod
+    def output_is_current(output_path, fingerprint):
+        """
+        True if the output file was already written from the same inputs and can be skipped.
+        """
+        
+        return fingerprint is not None and ChartUtils.output_cache is not None and ChartUtils.output_cache.is_current(output_path, fingerprint)
+    
+    @staticmethod
+    def record_output(output_path, fingerprint):
+        if fingerprint is not None and ChartUtils.output_cache is not None:
+            ChartUtils.output_cache.record(output_path, fingerprint)
+    
     def log_and_save_df(log_type, output_name, output_prefix=None, save_dataframe=None):
+        if log_type in ("dataframe", "csv"):
+            fingerprint = ChartUtils.output_fingerprint(locals())
+        
         if log_type == "dataframe":
-            os.makedirs(f'examples/outputs/raw_dataframes/{output_prefix}', exist_ok=True)
-            save_dataframe.to_csv(f'examples/outputs/raw_dataframes/{output_prefix}/raw_dataframe_{output_name}.csv', index=False)
+            output_path = f'examples/outputs/raw_dataframes/{output_prefix}/raw_dataframe_{output_name}.csv'
+            if not ChartUtils.output_is_current(output_path, fingerprint):
+                os.makedirs(f'examples/outputs/raw_dataframes/{output_prefix}', exist_ok=True)
+                save_dataframe.to_csv(output_path, index=False)
+                ChartUtils.record_output(output_path, fingerprint)
             print(f"\r(1/3) {output_name} dataframe saved", end="")
         elif log_type == "csv":
-            os.makedirs(f'examples/outputs/csv/{output_prefix}/', exist_ok=True)
-            save_dataframe.to_csv(f'examples/outputs/csv/{output_prefix}/{output_name}.csv', index=True)
+            output_path = f'examples/outputs/csv/{output_prefix}/{output_name}.csv'
+            if not ChartUtils.output_is_current(output_path, fingerprint):
+                os.makedirs(f'examples/outputs/csv/{output_prefix}/', exist_ok=True)
+                save_dataframe.to_csv(output_path, index=True)
+                ChartUtils.record_output(output_path, fingerprint)
             print(f"\r(2/3) {output_name} csv saved      ", end="")
         elif log_type == "png":
             print(f"\r(3/3) {output_name} saved      ")
@@ -1,15 +1,76 @@
 import pandas as pd
 import dataset_satcat
 import dataset_launch
+import dataset_view
     
 class Filters:
     """
     This class contains all functions required for filtering the datasets. This includes filtering by date, launch vehicle, launch site, etc.
+    
+    Filters work on a Launch or Satcat dataset (filtered in place) or a view of one (dataset.launch.view(), a new filtered view is returned).
+    Every filter returns the filtered dataset, so view = Filters.filter_by_orbit(view, "LEO") works for both.
     """
 
     def __init__(self):
         pass
 
+    def dataset_type(dataset_class):
+        """
+        Get the class (Launch or Satcat) of a dataset. Works for views too, use this instead of type(dataset_class).
+        """
+        
+        if isinstance(dataset_class, dataset_view.DatasetView):
+            return dataset_class.dataset_type
+        return type(dataset_class)
+
+    def column(dataset_class, column):
+        """
+        Get a column of a dataset. For views this only takes the selected rows of that one column, instead of creating the whole dataframe.
+        """
+        
+        return dataset_class.column(column) # Launch, Satcat and DatasetView all have column(), which derives the column first if the dataset was loaded with only some columns
+
+    def apply_condition(dataset_class, condition):
+        """
+        Keep only the rows where condition is True. Every filter ends with this.
+        
+        For a view (dataset.launch.view()), a new view is returned and the original is left as is.
+        For a Launch or Satcat dataset, the dataset is filtered in place (like it always has been) and returned.
+        Args:
+            dataset_class: launch, satcat or a view of either
+            condition: Boolean Series with one value per row, missing values count as False
+        """
+        
+        if isinstance(dataset_class, dataset_view.DatasetView):
+            return dataset_class.select(condition)
+        
+        if isinstance(condition, pd.Series) and condition.dtype != bool:
+            condition = condition.where(condition.notna(), False).astype(bool) # Missing values don't match, same as DatasetView.select()
+        dataset_class.df = dataset_class.df[condition]
+        return dataset_class
+
+    def filter_column_by_range(dataset_class, column, min_value=None, max_value=None):
+        """
+        Remove all rows where the column is not in the given range (inclusive range).
+        Args:
+            dataset_class: launch or satcat
+            column: The column to filter by.
+            min_value (optional): Minimum value (inclusive). Defaults to None.
+            max_value (optional): Maximum value (inclusive). Defaults to None.
+        """
+        
+        if min_value is None and max_value is None:
+            return dataset_class
+        
+        values = Filters.column(dataset_class, column)
+        condition = True
+        if min_value is not None:
+            condition = condition & (values >= min_value)
+        if max_value is not None:
+            condition = condition & (values <= max_value)
+        
+        return Filters.apply_condition(dataset_class, condition)
+
     def filter_column_by_contains(dataset_class, contains_pattern, column, case=False, negate=False):
         """
         Filter a DataFrame by a column containing a specific pattern.
@@ -27,12 +88,12 @@ class Filters:
         
         condition = False
         for pattern in contains_pattern:
-            condition = condition | dataset_class.df[column].str.contains(pattern, case=case, na=False)
+            condition = condition | Filters.column(dataset_class, column).str.contains(pattern, case=case, na=False)
             
         if negate:
             condition = ~condition
             
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_column_by_exact(dataset_class, exact_pattern, column, case=False, negate=False):
         """
@@ -52,12 +113,12 @@ class Filters:
         # Use regex for exact match
         condition = False
         for pattern in exact_pattern:
-            condition = condition | dataset_class.df[column].str.contains(f"^{pattern}$", case=case, na=False, regex=True)
+            condition = condition | Filters.column(dataset_class, column).str.contains(f"^{pattern}$", case=case, na=False, regex=True)
             
         if negate:
             condition = ~condition
             
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_mission(dataset_class, pattern, column="Mission", case=False, negate=False):
         """
@@ -65,14 +126,14 @@ class Filters:
         Used to filter by mission type (eg. if you want all Starlink launches)
         """
         
-        if (type(dataset_class) != dataset_launch.Launch):
+        if (Filters.dataset_type(dataset_class) != dataset_launch.Launch):
             raise ValueError("Launch dataset expected by filter_by_mission(). Cannot sort by mission in satcat dataset.")
         
-        condition = dataset_class.df[column].str.contains(pattern, case=case, na=False, regex=True)
+        condition = Filters.column(dataset_class, column).str.contains(pattern, case=case, na=False, regex=True)
         if negate:
             condition = ~condition
             
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_flight(dataset_class, pattern, column="Flight", case=False, negate=False):
         """
@@ -80,14 +141,14 @@ class Filters:
         Used to filter by flight number (eg. if you want all Starlink flights)
         """
         
-        if (type(dataset_class) != dataset_launch.Launch):
+        if (Filters.dataset_type(dataset_class) != dataset_launch.Launch):
             raise ValueError("Launch dataset expected by filter_by_flight(). Cannot sort by flight in satcat dataset.")
         
-        condition = dataset_class.df[column].str.contains(pattern, case=case, na=False, regex=True)
+        condition = Filters.column(dataset_class, column).str.contains(pattern, case=case, na=False, regex=True)
         if negate:
             condition = ~condition
             
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_Object_Name(dataset_class, pattern, column="PLName", case=False, negate=False):
         """
@@ -95,14 +156,14 @@ class Filters:
         Used to filter by objects of the same series, eg. all Starlink satellites
         """
         
-        if (type(dataset_class) != dataset_satcat.Satcat):
+        if (Filters.dataset_type(dataset_class) != dataset_satcat.Satcat):
             raise ValueError("Satcat dataset expected by filter_by_Object_Name(). Cannot sort by object name in launch dataset.")
         
-        condition = dataset_class.df[column].str.contains(pattern, case=case, na=False, regex=True)
+        condition = Filters.column(dataset_class, column).str.contains(pattern, case=case, na=False, regex=True)
         if negate:
             condition = ~condition
             
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_launch_category(dataset_class, launch_categories, negate=False):
         """
@@ -124,19 +185,19 @@ class Filters:
         Source: https://planet4589.org/space/gcat/web/launch/lcols.html  
         """
         
-        if (type(dataset_class) != dataset_launch.Launch):
+        if (Filters.dataset_type(dataset_class) != dataset_launch.Launch):
             raise ValueError("Launch dataset expected by filter_by_launch_category(). Cannot sort by launch category in satcat dataset.")
         
         if (type(launch_categories) == str):
             launch_categories = [launch_categories]
         
-        condition = dataset_class.df["LaunchCode"].str[0].isin(launch_categories)
+        condition = Filters.column(dataset_class, "LaunchCode").str[0].isin(launch_categories)
         if negate:
             condition = ~condition
         
         # vectorized operation to filter the DataFrame
         # Faster than a for loop for some reason, kind vibe coding here tbh
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
         
     def filter_by_launch_success_fraction(dataset_class, launch_success_fractions, negate=False):
         """
@@ -152,17 +213,17 @@ class Filters:
         Source: https://planet4589.org/space/gcat/web/launch/lcols.html
         """
         
-        if (type(dataset_class) != dataset_launch.Launch):
+        if (Filters.dataset_type(dataset_class) != dataset_launch.Launch):
             raise ValueError("Launch dataset expected by filter_by_launch_success_fraction(). Cannot sort by launch success fraction in satcat dataset.")
         
         if (type(launch_success_fractions) == str):
             launch_success_fractions = [launch_success_fractions]
         
-        condition = dataset_class.df["Launch_Code"].str[1].isin(launch_success_fractions)
+        condition = Filters.column(dataset_class, "Launch_Code").str[1].isin(launch_success_fractions)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_launch_vehicle_name_simplified(dataset_class, launch_vehicles, negate=False):
         """
@@ -175,11 +236,11 @@ class Filters:
         if (type(launch_vehicles) == str):
             launch_vehicles = [launch_vehicles]
         
-        condition = dataset_class.df["Launch_Vehicle_Simplified"].isin(launch_vehicles)
+        condition = Filters.column(dataset_class, "Launch_Vehicle_Simplified").isin(launch_vehicles)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_launch_vehicle_name_raw(dataset_class, launch_vehicles, negate=False):
         """
@@ -193,11 +254,11 @@ class Filters:
         if (type(launch_vehicles) == str):
             launch_vehicles = [launch_vehicles]
         
-        condition = dataset_class.df["LV_Type"].isin(launch_vehicles)
+        condition = Filters.column(dataset_class, "LV_Type").isin(launch_vehicles)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
         
     def filter_by_launch_vehicle_family(dataset_class, launch_vehicle_families, negate=False):
         """
@@ -212,11 +273,11 @@ class Filters:
         if (type(launch_vehicle_families) == str):
             launch_vehicle_families = [launch_vehicle_families]
         
-        condition = dataset_class.df["Launch_Vehicle_Family"].isin(launch_vehicle_families)
+        condition = Filters.column(dataset_class, "Launch_Vehicle_Family").isin(launch_vehicle_families)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_launch_site_raw(dataset_class, launch_sites, negate=False):
         """
@@ -229,11 +290,11 @@ class Filters:
         if (type(launch_sites) == str):
             launch_sites = [launch_sites]
         
-        condition = dataset_class.df["Launch_Site"].isin(launch_sites)
+        condition = Filters.column(dataset_class, "Launch_Site").isin(launch_sites)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_launch_pad_raw(dataset_class, launch_pads, negate=False):
         """
@@ -246,11 +307,11 @@ class Filters:
         if (type(launch_pads) == str):
             launch_pads = [launch_pads]
 
-        condition = dataset_class.df["Launch_Pad"].isin(launch_pads)
+        condition = Filters.column(dataset_class, "Launch_Pad").isin(launch_pads)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_sat_type_coarse(dataset_class, sat_types, negate=False):
         """
@@ -260,19 +321,19 @@ class Filters:
             negate: If True, remove all launches that are in the given launch categories. Defaults to False.
         """
 
-        if (type(dataset_class) != dataset_satcat.Satcat):
+        if (Filters.dataset_type(dataset_class) != dataset_satcat.Satcat):
             raise ValueError("satcat dataset expected by filter_by_sat_type_coarse(). Cannot sort by sat type in launch dataset.")
         
         if (type(sat_types) == str):
             sat_types = [sat_types]
         
-        condition = dataset_class.df["Type"].str[0].isin(sat_types)
+        condition = Filters.column(dataset_class, "Type").str[0].isin(sat_types)
         if negate:
             condition = ~condition
         
         # vectorized operation to filter the DataFrame
         # Faster than a for loop for some reason, kind vibe coding here tbh - nvm I've learned now python is not a real language
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
     
     def filter_by_payload_category_raw(dataset_class, payload_categories, negate=False):
         """
@@ -282,16 +343,16 @@ class Filters:
             negate: If True, remove all launches that are in the given payload types. Defaults to False.
         """
         
-        if (type(dataset_class) != dataset_satcat.Satcat):
+        if (Filters.dataset_type(dataset_class) != dataset_satcat.Satcat):
             raise ValueError("satcat dataset expected by filter_by_payload_category_raw(). Cannot sort by sat type in launch dataset.")
         
         if (type(payload_categories) == str):
             payload_categories = [payload_categories]
         
-        condition = dataset_class.df["Payload_Category"].isin(payload_categories)
+        condition = Filters.column(dataset_class, "Payload_Category").isin(payload_categories)
         if negate:
             condition = ~condition
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
     
     def filter_by_simple_payload_category(dataset_class, payload_categories, negate=False):
         """
@@ -301,17 +362,17 @@ class Filters:
             negate: If True, remove all launches that are in the given payload types. Defaults to False.
         """
         
-        if (type(dataset_class) != dataset_satcat.Satcat):
+        if (Filters.dataset_type(dataset_class) != dataset_satcat.Satcat):
             raise ValueError("satcat dataset expected by filter_by_simple_payload_type(). Cannot sort by sat type in launch dataset.")
         
         if (type(payload_categories) == str):
             payload_categories = [payload_categories]
         
-        condition = dataset_class.df["Simple_Payload_Category"].isin(payload_categories)
+        condition = Filters.column(dataset_class, "Simple_Payload_Category").isin(payload_categories)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
         
     def filter_by_payload_program_raw(dataset_class, payload_programs, negate=False):
         """
@@ -321,19 +382,19 @@ class Filters:
             negate: If True, remove all launches that are in the given payload programs. Defaults to False.
         """
         
-        if (type(dataset_class) != dataset_satcat.Satcat):
+        if (Filters.dataset_type(dataset_class) != dataset_satcat.Satcat):
             raise ValueError("satcat dataset expected by filter_by_payload_program_raw(). Cannot sort by sat type in launch dataset.")
         
         if (type(payload_programs) == str):
             payload_programs = [payload_programs]
         
-        condition = dataset_class.df["Payload_Program"].isin(payload_programs)
+        condition = Filters.column(dataset_class, "Payload_Program").isin(payload_programs)
         if negate:
             condition = ~condition
         
         # vectorized operation to filter the DataFrame
         # Faster than a for loop for some reason, kind vibe coding here tbh
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
         
     def filter_by_launch_date(dataset_class, start_date=None, end_date=None):
         """
@@ -346,11 +407,7 @@ class Filters:
         start_date = pd.to_datetime(start_date)
         end_date = pd.to_datetime(end_date)
         
-        if start_date is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Launch_Date"] >= start_date]
-        
-        if end_date is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Launch_Date"] <= end_date]
+        return Filters.filter_column_by_range(dataset_class, "Launch_Date", start_date, end_date)
 
     def filter_by_separation_date(dataset_class, start_date=None, end_date=None):
         """
@@ -360,17 +417,13 @@ class Filters:
             end_date: End date to filter by. eg. "2020-01-01"
         """
         
-        if (type(dataset_class) != dataset_satcat.Satcat):
+        if (Filters.dataset_type(dataset_class) != dataset_satcat.Satcat):
             raise ValueError("satcat dataset expected by filter_by_separation_date(). Cannot sort by separation date in launch dataset.")
         
         start_date = pd.to_datetime(start_date)
         end_date = pd.to_datetime(end_date)
         
-        if start_date is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Separation_Date"] >= start_date]
-        
-        if end_date is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Separation_Date"] <= end_date]
+        return Filters.filter_column_by_range(dataset_class, "Separation_Date", start_date, end_date)
 
     def filter_by_decay_date(dataset_class, start_date=None, end_date=None):
         """
@@ -380,17 +433,13 @@ class Filters:
             end_date: End date to filter by. eg. "2020-01-01"
         """
         
-        if (type(dataset_class) != dataset_satcat.Satcat):
+        if (Filters.dataset_type(dataset_class) != dataset_satcat.Satcat):
             raise ValueError("satcat dataset  expected by filter_by_decay_date(). Cannot sort by decay date in launch dataset.")
         
         start_date = pd.to_datetime(start_date)
         end_date = pd.to_datetime(end_date)
         
-        if start_date is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Decay_Date"] >= start_date]
-        
-        if end_date is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Decay_Date"] <= end_date]
+        return Filters.filter_column_by_range(dataset_class, "Decay_Date", start_date, end_date)
 
     def filter_by_orbit_canonical_date(dataset_class, start_date=None, end_date=None):
         """
@@ -400,17 +449,13 @@ class Filters:
             end_date: End date to filter by. eg. "2020-01-01"
         """
         
-        if (type(dataset_class) != dataset_satcat.Satcat):
+        if (Filters.dataset_type(dataset_class) != dataset_satcat.Satcat):
             raise ValueError("satcat dataset class expected by filter_by_orbit_canonical_date(). Cannot sort by orbit canonical date in launch dataset.")
         
         start_date = pd.to_datetime(start_date)
         end_date = pd.to_datetime(end_date)
         
-        if start_date is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Orbit_Canonical_Date"] >= start_date]
-        
-        if end_date is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Orbit_Canonical_Date"] <= end_date]
+        return Filters.filter_column_by_range(dataset_class, "Orbit_Canonical_Date", start_date, end_date)
     
     def filter_by_mass(dataset_class, min_mass=None, max_mass=None):
         """
@@ -422,14 +467,10 @@ class Filters:
         """
         
         mass_col = "Payload_Mass"
-        if (type(dataset_class) == dataset_satcat.Satcat):
+        if (Filters.dataset_type(dataset_class) == dataset_satcat.Satcat):
             mass_col = "Mass"
             
-        if min_mass is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df[mass_col] >= min_mass]
-        
-        if max_mass is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df[mass_col] <= max_mass]
+        return Filters.filter_column_by_range(dataset_class, mass_col, min_mass, max_mass)
             
     def filter_by_orbit_raw(dataset_class, orbits, negate=False):
         """
@@ -444,11 +485,11 @@ class Filters:
         if type(orbits) == str:
             orbits = [orbits]
         
-        condition = dataset_class.df["OpOrbit"].isin(orbits)
+        condition = Filters.column(dataset_class, "OpOrbit").isin(orbits)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_orbit(dataset_class, orbits, negate=False):
         """
@@ -462,11 +503,11 @@ class Filters:
         if type(orbits) == str:
             orbits = [orbits]
         
-        condition = dataset_class.df["Simple_Orbit"].isin(orbits)
+        condition = Filters.column(dataset_class, "Simple_Orbit").isin(orbits)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_apogee(dataset_class, apogee_range=None):
         """
@@ -479,11 +520,7 @@ class Filters:
         min_apogee = apogee_range[0] if apogee_range is not None else None
         max_apogee = apogee_range[1] if apogee_range is not None else None
         
-        if min_apogee is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Apogee"] >= min_apogee]
-        
-        if max_apogee is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Apogee"] <= max_apogee]
+        return Filters.filter_column_by_range(dataset_class, "Apogee", min_apogee, max_apogee)
     
     def filter_by_perigee(dataset_class, min_perigee=None, max_perigee=None):
         """
@@ -494,11 +531,7 @@ class Filters:
             max_perigee (float, optional): Maximum perigee (inclusive). Defaults to None.
         """
         
-        if min_perigee is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Perigee"] >= min_perigee]
-        
-        if max_perigee is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Perigee"] <= max_perigee]
+        return Filters.filter_column_by_range(dataset_class, "Perigee", min_perigee, max_perigee)
 
     def filter_by_inclination(dataset_class, min_inclination=None, max_inclination=None):
         """
@@ -509,11 +542,7 @@ class Filters:
             max_inclination (float, optional): Maximum inclination (inclusive). Defaults to None.
         """
         
-        if min_inclination is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Inc"] >= min_inclination]
-        
-        if max_inclination is not None:
-            dataset_class.df = dataset_class.df[dataset_class.df["Inc"] <= max_inclination]
+        return Filters.filter_column_by_range(dataset_class, "Inc", min_inclination, max_inclination)
 
     def filter_by_manufacturer(dataset_class, manufacturers, negate=False):
         """
@@ -524,17 +553,17 @@ class Filters:
             negate: If True, remove all launches that are in the given manufacturers. Defaults to False.
         """
         
-        if (type(dataset_class) != dataset_satcat.Satcat):
+        if (Filters.dataset_type(dataset_class) != dataset_satcat.Satcat):
             raise ValueError("satcat dataset expected by filter_by_manufacturer(). Cannot sort by manufacturer in launch dataset.")
         
         if (type(manufacturers) == str):
             manufacturers = [manufacturers]
         
-        condition = dataset_class.df["Manufacturer"].isin(manufacturers)
+        condition = Filters.column(dataset_class, "Manufacturer").isin(manufacturers)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
         
     def filter_by_state_code(dataset_class, state_codes, negate=False):
         """
@@ -548,11 +577,11 @@ class Filters:
         if (type(state_codes) == str):
             state_codes = [state_codes]
         
-        condition = dataset_class.df["State"].isin(state_codes)
+        condition = Filters.column(dataset_class, "State").isin(state_codes)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
 
     def filter_by_country(dataset_class, countries, negate=False):
         """
@@ -566,11 +595,11 @@ class Filters:
         if (type(countries) == str):
             countries = [countries]
         
-        condition = dataset_class.df["Country"].isin(countries)
+        condition = Filters.column(dataset_class, "Country").isin(countries)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
         
     def filter_by_launch_site(dataset_class, launch_sites, negate=False):
         """
@@ -585,11 +614,11 @@ class Filters:
         if (type(launch_sites) == str):
             launch_sites = [launch_sites]
         
-        condition = dataset_class.df["Launch_Site_Parent"].isin(launch_sites)
+        condition = Filters.column(dataset_class, "Launch_Site_Parent").isin(launch_sites)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
+        return Filters.apply_condition(dataset_class, condition)
         
     def filter_by_launch_site_name(dataset_class, launch_site_names, negate=False):
         """
@@ -606,8 +635,31 @@ class Filters:
         if (type(launch_site_names) == str):
             launch_site_names = [launch_site_names]
         
-        condition = dataset_class.df["Launch_Site_Name"].isin(launch_site_names)
+        condition = Filters.column(dataset_class, "Launch_Site_Name").isin(launch_site_names)
         if negate:
             condition = ~condition
         
-        dataset_class.df = dataset_class.df[condition]
\ No newline at end of file
+        return Filters.apply_condition(dataset_class, condition)
+
+# Filters that keep the rows where a column (or the first character of a column) is one of the given values: (column, first character only, required dataset type)
+# ChartUtils.filter_dataset_by_each_parameter() uses this to split a dataset by every parameter in one pass, instead of running the filter once per parameter.
+# Only used when negate is left as False.
+Filters.equality_filters = {
+    Filters.filter_by_launch_category: ("LaunchCode", True, dataset_launch.Launch),
+    Filters.filter_by_launch_vehicle_name_simplified: ("Launch_Vehicle_Simplified", False, None),
+    Filters.filter_by_launch_vehicle_name_raw: ("LV_Type", False, None),
+    Filters.filter_by_launch_vehicle_family: ("Launch_Vehicle_Family", False, None),
+    Filters.filter_by_launch_site_raw: ("Launch_Site", False, None),
+    Filters.filter_by_launch_pad_raw: ("Launch_Pad", False, None),
+    Filters.filter_by_sat_type_coarse: ("Type", True, dataset_satcat.Satcat),
+    Filters.filter_by_payload_category_raw: ("Payload_Category", False, dataset_satcat.Satcat),
+    Filters.filter_by_simple_payload_category: ("Simple_Payload_Category", False, dataset_satcat.Satcat),
+    Filters.filter_by_payload_program_raw: ("Payload_Program", False, dataset_satcat.Satcat),
+    Filters.filter_by_orbit_raw: ("OpOrbit", False, None),
+    Filters.filter_by_orbit: ("Simple_Orbit", False, None),
+    Filters.filter_by_manufacturer: ("Manufacturer", False, dataset_satcat.Satcat),
+    Filters.filter_by_state_code: ("State", False, None),
+    Filters.filter_by_country: ("Country", False, None),
+    Filters.filter_by_launch_site: ("Launch_Site_Parent", False, None),
+    Filters.filter_by_launch_site_name: ("Launch_Site_Name", False, None),
+}
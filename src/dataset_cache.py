@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import shutil
+
+class DatasetCache:
+    """
+    On-disk cache of the fully processed launch and satcat dataframes.
+
+    Building McdowellDataset means parsing every tsv and running all of the preprocessing and join steps, which is slow.
+    This class stores the final dataframes as Feather (Arrow IPC) files so the next load is a memory-mapped read instead.
+
+    The cache is keyed by a hash of the contents of every source tsv plus the library version.
+    If any tsv is updated (eg. by update_datasets.py) or the library changes, the key changes and the old entry is thrown away.
+
+    Feather requires pyarrow. If pyarrow is not installed the cache just does nothing and everything is loaded from the tsv files.
+    """
+
+    # Bump this if the layout of the cache directory changes
+    cache_format_version = 1
+
+    # Every file that affects the processed dataframes, including the translation tables
+    source_files = ["launch.tsv", "auxcat.tsv", "satcat.tsv", "psatcat.tsv", "lv.tsv", "sites.tsv", "orgs.tsv"]
+
+    def __init__(self, dataset_directory="./datasets", cache_directory=None, library_version=""):
+        """
+        Args:
+            dataset_directory (str): Directory containing the McDowell tsv files.
+            cache_directory (str, optional): Where to store cached dataframes. Defaults to "{dataset_directory}/.cache".
+            library_version (str, optional): Version string of the library, part of the cache key.
+        """
+
+        self.dataset_directory = dataset_directory
+        self.cache_directory = cache_directory or f"{dataset_directory}/.cache"
+        self.library_version = library_version
+        self.key = None
+
+    @staticmethod
+    def hash_files(file_paths, hasher=None):
+        """
+        Hash the contents of a list of files. Missing files are hashed as missing so adding one later changes the key.
+
+        Args:
+            file_paths (list str): Paths of the files to hash.
+            hasher (hashlib hash, optional): Hash object to update. Defaults to a new sha256.
+        """
+
+        hasher = hasher or hashlib.sha256()
+        for file_path in file_paths:
+            hasher.update(os.path.basename(file_path).encode("utf-8"))
+            if not os.path.exists(file_path):
+                hasher.update(b"missing")
+                continue
+            with open(file_path, "rb") as file:
+                for chunk in iter(lambda: file.read(1 << 20), b""):
+                    hasher.update(chunk)
+        return hasher
+
+    @staticmethod
+    def library_fingerprint():
+        """
+        Hash of the library's own source files.
+
+        Editable installs (pip install -e .) don't bump the version number when the preprocessing code changes, so hash the code too.
+        """
+
+        library_directory = os.path.dirname(os.path.abspath(__file__))
+        file_paths = sorted(os.path.join(library_directory, name) for name in os.listdir(library_directory) if name.endswith(".py"))
+        return DatasetCache.hash_files(file_paths).hexdigest()
+
+    def compute_key(self):
+        """
+        Compute the cache key from the source tsv contents and the library version.
+        """
+
+        hasher = hashlib.sha256()
+        hasher.update(f"{DatasetCache.cache_format_version}|{self.library_version}|{DatasetCache.library_fingerprint()}".encode("utf-8"))
+        DatasetCache.hash_files([f"{self.dataset_directory}/{name}" for name in DatasetCache.source_files], hasher)
+        self.key = hasher.hexdigest()[:32]
+        return self.key
+
+    def entry_directory(self):
+        if self.key is None:
+            self.compute_key()
+        return f"{self.cache_directory}/{self.key}"
+
+    def load(self):
+        """
+        Load the cached dataframes for the current source files.
+
+        Returns:
+            tuple(dict, dict) or None: (dataframes by name, metadata) or None if there is no valid cache entry.
+        """
+
+        entry_directory = self.entry_directory()
+        metadata_path = f"{entry_directory}/metadata.json"
+        if not os.path.exists(metadata_path):
+            return None
+
+        try:
+            import pyarrow.feather as feather
+
+            with open(metadata_path, "r", encoding="utf-8") as file:
+                metadata = json.load(file)
+
+            # memory_map avoids a copy of the file into memory before it's converted to pandas
+            dataframes = {
+                name: feather.read_table(f"{entry_directory}/{name}.feather", memory_map=True).to_pandas()
+                for name in metadata["dataframes"]
+            }
+        except (ImportError, OSError, ValueError, KeyError) as error: # Broken or half written cache entry, just rebuild it
+            print(f"Dataset cache could not be read, rebuilding: {error}")
+            return None
+
+        return dataframes, metadata
+
+    def save(self, dataframes, metadata=None):
+        """
+        Save processed dataframes for the current source files and remove any stale cache entries.
+
+        Args:
+            dataframes (dict): Dictionary of name -> dataframe, eg. {"launch": launch.df, "satcat": satcat.df}
+            metadata (dict, optional): Extra json serializable values to store alongside the dataframes (eg. date_updated).
+        """
+
+        try:
+            import pyarrow.feather as feather
+        except ImportError:
+            return # No pyarrow, no cache
+
+        entry_directory = self.entry_directory()
+        temp_directory = f"{entry_directory}.tmp{os.getpid()}"
+        os.makedirs(temp_directory, exist_ok=True)
+
+        try:
+            for name, df in dataframes.items():
+                # Uncompressed so it can be memory-mapped when read back
+                feather.write_feather(df.reset_index(drop=True), f"{temp_directory}/{name}.feather", compression="uncompressed")
+
+            metadata = dict(metadata or {})
+            metadata["dataframes"] = list(dataframes.keys())
+            metadata["library_version"] = self.library_version
+            with open(f"{temp_directory}/metadata.json", "w", encoding="utf-8") as file:
+                json.dump(metadata, file)
+
+            # Write to a temp directory then rename, so a crash never leaves a half written entry behind
+            shutil.rmtree(entry_directory, ignore_errors=True)
+            os.replace(temp_directory, entry_directory)
+        except (OSError, ValueError, TypeError) as error: # ValueError and TypeError cover pyarrow conversion errors
+            print(f"Dataset cache could not be written: {error}")
+            shutil.rmtree(temp_directory, ignore_errors=True)
+            return
+
+        self.remove_stale_entries()
+
+    def remove_stale_entries(self):
+        """
+        Delete every cache entry except the current one.
+        """
+
+        for name in os.listdir(self.cache_directory):
+            path = f"{self.cache_directory}/{name}"
+            if name != self.key and ".tmp" not in name and os.path.isdir(path) and os.path.exists(f"{path}/metadata.json"):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def clear(self):
+        """
+        Delete the whole cache directory.
+        """
+
+        shutil.rmtree(self.cache_directory, ignore_errors=True)
@@ -1,44 +1,231 @@
 import pandas as pd
-from pyparsing import col
 import translations
+import dataset_view
 import custom_launch_types
+import vague_dates
+import dataset_profile
+import tsv_reader
+from derived_columns import ColumnDerivation, DerivedColumns
+
+# Column derivations, see Launch.column_derivations
+# Each adds its columns to df, a dataframe of the launch dataset (launch.df or a view's df)
+
+def strip_launch_tag(launch, df):
+    df["Launch_Tag"] = df["Launch_Tag"].astype(str).str.upper().str.strip()
+
+def strip_lv_type(launch, df):
+    df["LV_Type"] = df["LV_Type"].astype(str).str.strip()
+
+def parse_launch_dates(launch, df):
+    # Convert Mcdowell's vague date format to pandas datetime format
+    # Launch_Date is kept to the day so grouping by date works as before, Launch_Datetime keeps the time of day
+    with dataset_profile.DatasetProfile.measure("parse launch dates") as stage:
+        df["Launch_Datetime"], df["Launch_Date_Precision"] = vague_dates.parse_vague_dates(df["Launch_Date"])
+        df["Launch_Date"] = df["Launch_Datetime"].dt.normalize()
+        stage.rows = len(df)
+
+def add_simple_orbit(launch, df):
+    df["Simple_Orbit"] = df["Category"].str.split(" ").str[1].str.strip() # Extract orbit from category eg. "Sat SSO SD 0"
+    df["Simple_Orbit"] = df["Simple_Orbit"].where(df["Simple_Orbit"].isin(launch.translation.launch_category_to_simple_orbit.keys()), float("nan")) # If raw orbit not present in dictionary keys, NaN
+    df["Simple_Orbit"] = df["Simple_Orbit"].replace(launch.translation.launch_category_to_simple_orbit) # Translate to simple orbit
+
+def add_v2_payload_category(launch, df):
+    # Yea this is a shitty bodge
+    df["V2_Payload_Category"] = df["Category"].apply(lambda x: 'Test' if 'Test' in str(x) else 'Weapon' if 'Weapon' in str(x) else 'Training' if 'Training' in str(x) else 'Scientific')
+
+def add_launch_vehicle_family(launch, df):
+    df["Launch_Vehicle_Family"] = df["LV_Type"].map(launch.translation.lv_type_to_lv_family) # Translate LV_Type to LV_Family using the translation dictionary
+
+def add_launch_vehicle_simplified(launch, df):
+    df["Launch_Vehicle_Simplified"] = df["LV_Type"].map(lambda x: launch.translation.orbital_lv_name_to_lv_simplified.get(x, x)) # Translate LV_Type to LV_Simplified using the translation dictionary, if key not found, go with LV_Type as the Launch_Vehicle_Simplified
+
+def add_state(launch, df):
+    df["State"] = df["Launch_Site"].map(launch.translation.launch_site_to_state_code) # Translate Launch_Site to State using the translation dictionary
+
+def add_country(launch, df):
+    df["Country"] = df["State"].map(launch.translation.state_code_to_state_name).map(launch.translation.state_name_to_americanized_state_names)
+
+def add_launch_site_parent(launch, df):
+    df["Launch_Site_Parent"] = df["Launch_Site"].map(launch.translation.launch_site_to_launch_site_parent)
+
+def add_launch_site_name(launch, df):
+    df["Launch_Site_Name"] = df["Launch_Site"].map(launch.translation.launch_site_to_launch_site_name) # Translate Launch_Site to Launch_Site_Name using the translation dictionary
+
+def add_payload_mass(launch, df):
+    satcat_df = launch.related.pristine_df # All of satcat, even if it's been filtered
+    
+    payload_masses = (
+        satcat_df
+        .loc[satcat_df['Type'].str.startswith('P', na=False), ['Launch_Tag', 'Mass']] # Keep only payloads from satcat
+        .groupby('Launch_Tag')['Mass'] # Group by launch tag and sum the masses of the payloads
+        .sum()
+    )
+    
+    # Create new column in launch_df for payload mass
+    df['Payload_Mass'] = df['Launch_Tag'].map(payload_masses)
+
+# Launch columns taken from the launch's first payload in satcat (Simple_Payload_Category and Payload_Class are renamed First_*)
+first_payload_columns = ['Orbit_Canonical_Date', 'Perigee', 'Apogee', 'Inc', 'OpOrbit', 'First_Simple_Payload_Category', 'First_Payload_Class']
+
+def add_first_payload_columns(launch, df):
+    satcat_df = launch.related.pristine_df # All of satcat, even if it's been filtered
+    
+    #pick the first payload row for every Launch_Tag
+    first_payload = (
+        satcat_df
+          .loc[satcat_df['Type'].str.startswith('P', na=False), ['Launch_Tag', 'Orbit_Canonical_Date', 'Perigee', 'Apogee', 'Inc', 'OpOrbit', 'Simple_Payload_Category', 'Payload_Class']]
+          .drop_duplicates('Launch_Tag', keep='first')
+          .set_index('Launch_Tag')
+    )
+    
+    # Note that here we make the first payload listed on the launch the simple payload category.
+    first_payload.rename(columns={'Simple_Payload_Category': 'First_Simple_Payload_Category', 'Payload_Class': 'First_Payload_Class'}, inplace=True)
+    
+    # Create new columns in launch_df for canonical orbit data
+    for col in first_payload_columns:
+        mapped = df['Launch_Tag'].map(first_payload[col])
+        if col in df.columns:
+            df[col] = mapped.where(mapped.notna() & (mapped != "-"), df[col])  # Keep original if mapped is NaN or "-" (or other invalid indicators)
+        else:
+            df[col] = mapped
+    
+    # Convert numeric orbit columns to float
+    for col in ['Perigee', 'Apogee', 'Inc']:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+def add_general_launch_payload_type(launch, df):
+    custom_launch_types.add_general_launch_payload_type(df)
 
 class Launch:
     """
     This contains all functions required for using McDowell's launch dataset.
     """
+    
+    # Low cardinality string columns that can be stored as categoricals, see convert_to_categorical()
+    categorical_columns = ["LV_Type", "Launch_Site", "Launch_Pad", "Agency", "Group", "Simple_Orbit", "V2_Payload_Category", "Launch_Vehicle_Family", "Launch_Vehicle_Simplified", "State", "Country", "Launch_Site_Parent", "Launch_Site_Name", "OpOrbit", "First_Simple_Payload_Category", "First_Payload_Class", "General_Launch_Payload_Type"]
+    
+    # Every column derived from launch.tsv (and satcat), with what it depends on. A full load runs them in this order.
+    column_derivations = DerivedColumns([
+        ColumnDerivation(["Launch_Tag"], ["Launch_Tag"], strip_launch_tag, "preprocess"),
+        ColumnDerivation(["LV_Type"], ["LV_Type"], strip_lv_type, "preprocess"),
+        ColumnDerivation(["Launch_Date", "Launch_Datetime", "Launch_Date_Precision"], ["Launch_Date"], parse_launch_dates, "preprocess"),
+        ColumnDerivation(["Simple_Orbit"], ["Category"], add_simple_orbit, "preprocess"),
+        ColumnDerivation(["V2_Payload_Category"], ["Category"], add_v2_payload_category, "preprocess"),
+        ColumnDerivation(["Launch_Vehicle_Family"], ["LV_Type"], add_launch_vehicle_family, "preprocess"),
+        ColumnDerivation(["Launch_Vehicle_Simplified"], ["LV_Type"], add_launch_vehicle_simplified, "preprocess"),
+        ColumnDerivation(["State"], ["Launch_Site"], add_state, "preprocess"),
+        ColumnDerivation(["Country"], ["State"], add_country, "preprocess"),
+        ColumnDerivation(["Launch_Site_Parent"], ["Launch_Site"], add_launch_site_parent, "preprocess"),
+        ColumnDerivation(["Launch_Site_Name"], ["Launch_Site"], add_launch_site_name, "preprocess"),
+        ColumnDerivation(["Payload_Mass"], ["Launch_Tag"], add_payload_mass, "satcat_dependent", related_dependencies=["Launch_Tag", "Type", "Mass"]),
+        ColumnDerivation(first_payload_columns, ["Launch_Tag"] + first_payload_columns, add_first_payload_columns, "satcat_dependent", related_dependencies=["Launch_Tag", "Type", "Orbit_Canonical_Date", "Perigee", "Apogee", "Inc", "OpOrbit", "Simple_Payload_Category", "Payload_Class"]),
+        ColumnDerivation(["General_Launch_Payload_Type"], ["Group", "State", "First_Payload_Class", "Mission"], add_general_launch_payload_type, "custom_launch_types"),
+    ], file_path_attribute="launch_path", related_name="satcat", renamed_columns={"#Launch_Tag": "Launch_Tag"})
 
-    def __init__(self, translation=None, dataset_directory="./datasets"):
+    def __init__(self, translation=None, dataset_directory="./datasets", df=None, auxcat_df=None, date_updated=None, raw_df=None, raw_auxcat_df=None, columns=None):
         """
         Initialize launch tsv file path and load the dataset into a pandas DataFrame.
         
         Launch.tsv column descriptions: https://planet4589.org/space/gcat/web/launch/lcols.html
+        
+        Args:
+            translation (Translation, optional): Translation tables. Defaults to the process wide Translation for dataset_directory.
+            dataset_directory (str, optional): Directory containing launch.tsv and auxcat.tsv. Defaults to "./datasets".
+            df (DataFrame, optional): Already preprocessed launch dataframe (eg. from the dataset cache). If given, launch.tsv is not read or preprocessed.
+            auxcat_df (DataFrame, optional): Raw auxcat dataframe to go with df.
+            date_updated (str, optional): Dataset cutoff date to go with df.
+            raw_df (DataFrame, optional): launch.tsv as read by tsv_reader.read_tsv() (eg. read concurrently by McdowellDataset), preprocessed here instead of reading the file.
+            raw_auxcat_df (DataFrame, optional): auxcat.tsv as read by tsv_reader.read_tsv(), goes with raw_df.
+            columns (list str, optional): Only load these columns (plus Launch_Tag), reading just the tsv columns they need. Other columns are derived when they're first used, see derive_columns().
+                auxcat.tsv isn't read. Columns from satcat need self.related, so load those with McdowellDataset(launch_columns=...). Defaults to None (load everything).
         """
     
         self.dataset_directory = dataset_directory
         self.launch_path = f"{dataset_directory}/launch.tsv"
         self.auxcat_path = f"{dataset_directory}/auxcat.tsv"
-        self.translation = translation or translations.Translation() # beautiful Pythonic syntax!
-        self.date_updated = None
+        self.translation = translation or translations.Translation.get(dataset_directory) # beautiful Pythonic syntax!
+        self.date_updated = date_updated
+        self.projected_columns = columns # None if every column is loaded
+        self.related = None # Satcat dataset the satcat dependent columns come from
+        
+        if df is not None:
+            self.df = df
+            self.auxcat_df = auxcat_df
+            self.snapshot()
+            return
+        
+        if columns is not None:
+            self.date_updated = tsv_reader.read_date_updated(self.launch_path)
+            self.df = Launch.column_derivations.read_columns(self, ["Launch_Tag"])
+            Launch.column_derivations.derivation_of["Launch_Tag"].function(self, self.df) # Cleaned up the same way as a full load
+            self.auxcat_df = None
+            self.snapshot()
+            self.derive_columns(list(columns))
+            return
         
-        self.df = pd.read_csv(self.launch_path, sep="\t", encoding="utf-8", low_memory=False) # load tsv into dataframe
-        self.auxcat_df = pd.read_csv(self.auxcat_path, sep="\t", encoding="utf-8", low_memory=False) # load psatcat tsv into dataframe
+        self.df = raw_df if raw_df is not None else tsv_reader.read_tsv(self.launch_path) # load tsv into dataframe
+        self.auxcat_df = raw_auxcat_df if raw_auxcat_df is not None else tsv_reader.read_tsv(self.auxcat_path) # load auxcat tsv into dataframe
         
-        self.preprocess_launch_df()
+        with dataset_profile.DatasetProfile.measure("preprocess launch") as stage:
+            self.preprocess_launch_df()
+            stage.rows = len(self.df)
+        
+        self.snapshot()
+
+    def view(self):
+        """
+        Read-only view of the current rows. Filters applied to the view return new views and leave this dataset untouched.
+        """
+        return dataset_view.DatasetView(self)
+
+    def column(self, column):
+        """
+        Get a single column, derived first if the dataset was loaded with only some columns. Works on views too: Launch.column(view, "Simple_Orbit")
+        """
+
+        if isinstance(self, dataset_view.DatasetView):
+            return self.column(column)
+        if self.projected_columns is not None:
+            self.derive_columns([column])
+        return self.df[column]
+
+    def derive_columns(self, columns, df=None):
+        """
+        Make sure columns are in df, reading the tsv columns they need and deriving them if they aren't (only for datasets loaded with columns=[...]).
+        Args:
+            columns (list str): Column names, eg. ["Launch_Vehicle_Family", "Payload_Mass"]
+            df (DataFrame, optional): Dataframe of this dataset to add them to, eg. a view's df. Defaults to self.df.
+        """
+
+        Launch.column_derivations.derive(self, columns, df)
 
+    def snapshot(self):
+        """
+        Keep the current df as the pristine dataframe that reload() goes back to, and start filtering a shallow copy of it.
+        McdowellDataset calls this again once the columns joined from the other dataset are added.
+        The pristine dataframe is never modified: filters replace df and adding a column to df doesn't add it to the snapshot,
+        but changing values in place (df.loc[...] = ...) would, so filters shouldn't do that.
+        """
+        
+        self.pristine_df = self.df
+        self.reload()
+    
     def reload(self):
         """ 
-        Undo all filters
+        Undo all filters. O(1), df becomes a shallow copy of the pristine dataframe, nothing is read or processed again.
         """
-        self.__init__(translation=self.translation, dataset_directory=self.dataset_directory)
+        
+        self.df = self.pristine_df.copy(deep=False)
+        self.unfiltered_df = self.df # df until a filter replaces it, see LaunchCube.for_dataset()
     
     def preprocess_launch_df(self):
         """
         Create new columns from existing columns in satcat dataframe to make it more pandas friendly.
         Lots of string manipulation to get the dates into a format that pandas can understand.
+        The columns are listed in Launch.column_derivations.
         """
         
-        self.date_updated = " ".join(self.df.iloc[0, 0].strip().replace("  ", " ").split(" ")[2:5])
+        self.date_updated = tsv_reader.date_updated(self.df)
         
         # Remove second row of tsv, signifies date of last update
         self.df = self.df.drop(index=0).reset_index(drop=True)
@@ -46,38 +233,7 @@ class Launch:
         # Rename column "#Launch_Tag" to "Launch_Tag"
         self.df.rename(columns={"#Launch_Tag": "Launch_Tag"}, inplace=True)
         
-        # Strip Launch_Tags
-        self.df["Launch_Tag"] = self.df["Launch_Tag"].astype(str).str.upper().str.strip()
-        self.df["LV_Type"] = self.df["LV_Type"].astype(str).str.strip()
-        
-        date_cols = ["Launch_Date"]
-        for col in date_cols:
-            # Remove problematic characters from date columns (?, -) and handle NaN
-            self.df[col] = self.df[col].str.strip().fillna("").str.replace(r"[?-]", "", regex=True).str.strip()
-            # Replace double space "  " with single space " " - Sputnik 1 edge case!
-            self.df[col] = self.df[col].str.replace(r"\s{2,}", " ", regex=True).str.strip()
-            # Only include characters before the third space in all date columns (Remove hour/min/sec as unneeded and messes with data frame time formatting)
-            self.df[col] = self.df[col].str.split(" ", n=3).str[:3].str.join(" ").str.strip()
-            # Add " 1" to the end of all dates that only contain year and month (assuming this is all 8 character dates) eg. "2023 Feb" -> "2023 Feb 1"
-            self.df[col] = self.df[col].where(self.df[col].str.len() != 8, self.df[col] + " 1")
-            # Convert Mcdowell's Vague date format to pandas datetime format
-            self.df[col] = pd.to_datetime(self.df[col], format="%Y %b %d", errors="coerce")
-
-        self.df["Simple_Orbit"] = self.df["Category"].str.split(" ").str[1].str.strip() # Extract orbit from category eg. "Sat SSO SD 0"
-        self.df["Simple_Orbit"] = self.df["Simple_Orbit"].where(self.df["Simple_Orbit"].isin(self.translation.launch_category_to_simple_orbit.keys()), float("nan")) # If raw orbit not present in dictionary keys, NaN
-        self.df["Simple_Orbit"] = self.df["Simple_Orbit"].replace(self.translation.launch_category_to_simple_orbit) # Translate to simple orbit
-
-        # Yea this is a shitty bodge
-        self.df["V2_Payload_Category"] = self.df["Category"].apply(lambda x: 'Test' if 'Test' in str(x) else 'Weapon' if 'Weapon' in str(x) else 'Training' if 'Training' in str(x) else 'Scientific')
-
-        self.df["Launch_Vehicle_Family"] = self.df["LV_Type"].map(self.translation.lv_type_to_lv_family) # Translate LV_Type to LV_Family using the translation dictionary
-        self.df["Launch_Vehicle_Simplified"] = self.df["LV_Type"].map(lambda x: self.translation.orbital_lv_name_to_lv_simplified.get(x, x)) # Translate LV_Type to LV_Simplified using the translation dictionary, if key not found, go with LV_Type as the Launch_Vehicle_Simplified
-        
-        self.df["State"] = self.df["Launch_Site"].map(self.translation.launch_site_to_state_code) # Translate Launch_Site to State using the translation dictionary
-        self.df["Country"] = self.df["State"].map(self.translation.state_code_to_state_name).map(self.translation.state_name_to_americanized_state_names)
-        
-        self.df["Launch_Site_Parent"] = self.df["Launch_Site"].map(self.translation.launch_site_to_launch_site_parent)
-        self.df["Launch_Site_Name"] = self.df["Launch_Site"].map(self.translation.launch_site_to_launch_site_name) # Translate Launch_Site to Launch_Site_Name using the translation dictionary
+        Launch.column_derivations.run_stage(self, "preprocess")
 
     def process_satcat_dependent_columns(self, satcat):
         """
@@ -88,40 +244,8 @@ class Launch:
             satcat_df: DataFrame containing the satcat class.
         """
         
-        satcat_df = satcat.df.copy()
-        
-        payload_masses = (
-            satcat_df
-            .loc[satcat_df['Type'].str.startswith('P', na=False)] # Keep only payloads from satcat
-            .groupby('Launch_Tag')['Mass'] # Group by launch tag and sum the masses of the payloads
-            .sum()
-        )
-        
-        # Create new column in launch_df for payload mass
-        self.df['Payload_Mass'] = self.df['Launch_Tag'].map(payload_masses)
-        
-        #pick the first payload row for every Launch_Tag
-        first_payload = (
-            satcat_df
-              .loc[satcat_df['Type'].str.startswith('P', na=False)]
-              .drop_duplicates('Launch_Tag', keep='first')
-              .set_index('Launch_Tag')
-        )
-        
-        # Note that here we make the first payload listed on the launch the simple payload category.
-        first_payload.rename(columns={'Simple_Payload_Category': 'First_Simple_Payload_Category', 'Payload_Class': 'First_Payload_Class'}, inplace=True)
-        
-        # Create new columns in launch_df for canonical orbit data
-        for col in ['Orbit_Canonical_Date', 'Perigee', 'Apogee', 'Inc', 'OpOrbit', 'First_Simple_Payload_Category', 'First_Payload_Class']:
-            mapped = self.df['Launch_Tag'].map(first_payload[col])
-            if col in self.df.columns:
-                self.df[col] = mapped.where(mapped.notna() & (mapped != "-"), self.df[col])  # Keep original if mapped is NaN or "-" (or other invalid indicators)
-            else:
-                self.df[col] = mapped
-        
-        # Convert numeric orbit columns to float
-        for col in ['Perigee', 'Apogee', 'Inc']:
-            self.df[col] = pd.to_numeric(self.df[col], errors="coerce")
+        self.related = satcat
+        Launch.column_derivations.run_stage(self, "satcat_dependent")
         
     def process_auxcat_dependent_columns(self):
         """
@@ -165,5 +289,17 @@ class Launch:
             mapping = second_stage_auxcat.set_index('Launch_Tag')[col] # Create a mapping from Launch_Tag to the column value
             self.df.loc[self.df['Launch_Tag'].isin(mapping.index), col] = self.df['Launch_Tag'].map(mapping) # Update self.df[col] where Launch_Tag exists in mapping
             
+    def convert_to_categorical(self, columns=None):
+        """
+        Store low cardinality string columns as pandas categoricals (integer codes + one copy of each string).
+        Uses several times less memory, and isin() filters compare integer codes instead of strings.
+        Args:
+            columns (list str, optional): Columns to convert. Defaults to Launch.categorical_columns.
+        """
+        
+        for col in columns or Launch.categorical_columns:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype("category")
+            
     def add_custom_launch_types(self):
-        self.df = custom_launch_types.add_general_launch_payload_type(self.df)
\ No newline at end of file
+        Launch.column_derivations.run_stage(self, "custom_launch_types")
\ No newline at end of file
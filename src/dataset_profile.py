@@ -0,0 +1,226 @@
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource # Not available on Windows, peak RSS is just left out there
+except ImportError:
+    resource = None
+
+def peak_rss_mb():
+    """
+    Highest resident memory of this process so far in MB, or None if it can't be measured on this platform.
+    """
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / (1 << 10) # Bytes on macOS, kilobytes on Linux
+
+class DatasetStage:
+    """
+    Timing and memory use of one stage of building a dataset, eg. reading launch.tsv.
+    Used as a context manager by DatasetProfile.stage(), set rows inside the with block.
+    Without a profile it records nothing.
+    """
+
+    def __init__(self, profile, name, depth=0):
+        self.profile = profile
+        self.name = name
+        self.depth = depth # Stages run inside other stages (eg. date parsing inside preprocessing) have depth 1 and up
+        self.rows = None # Rows in the stage's output dataframe, if it has one
+        self.wall_time = None # Seconds
+        self.cpu_time = None # Seconds of CPU time of the thread that ran the stage
+        self.thread = threading.current_thread().name
+        self.peak_rss_mb = None # Process peak RSS after the stage
+        self.peak_rss_increase_mb = None # How much the stage raised the process peak RSS, 0 if it stayed under an earlier peak
+        self.traced_peak_mb = None # Peak Python allocations during the stage above what was allocated when it started, only with trace_memory (on Python 3.8, the peak since tracing started)
+        self.traced_change_mb = None # Allocations still held after the stage minus when it started, only with trace_memory
+        self.traced_child_peak = 0
+
+    def __enter__(self):
+        if self.profile is None:
+            return self
+        self.profile.running().append(self)
+        self.start_rss_mb = peak_rss_mb()
+        if self.profile.trace_memory:
+            self.start_traced = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, "reset_peak"): # Python 3.9+, before that the peak is the highest since tracing started
+                tracemalloc.reset_peak()
+        self.start_cpu_time = time.thread_time()
+        self.start_wall_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        if self.profile is None:
+            return
+        self.end_wall_time = time.perf_counter()
+        self.wall_time = self.end_wall_time - self.start_wall_time
+        self.cpu_time = time.thread_time() - self.start_cpu_time
+
+        if self.profile.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, self.traced_child_peak) # Stages inside this one reset the peak, so take theirs into account
+            self.traced_peak_mb = (peak - self.start_traced) / (1 << 20)
+            self.traced_change_mb = (current - self.start_traced) / (1 << 20)
+
+        self.peak_rss_mb = peak_rss_mb()
+        if self.peak_rss_mb is not None:
+            self.peak_rss_increase_mb = self.peak_rss_mb - self.start_rss_mb
+
+        running = self.profile.running()
+        running.remove(self)
+        if self.profile.trace_memory and running:
+            parent = running[-1]
+            parent.traced_child_peak = max(parent.traced_child_peak, peak)
+        self.profile.stages.append(self)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "thread": self.thread,
+            "rows": self.rows,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_rss_mb": self.peak_rss_mb,
+            "peak_rss_increase_mb": self.peak_rss_increase_mb,
+            "traced_peak_mb": self.traced_peak_mb,
+            "traced_change_mb": self.traced_change_mb,
+        }
+
+class DatasetProfile:
+    """
+    Wall time, CPU time, memory and row counts for each stage of building a McdowellDataset.
+
+    Stages: translation tables, reading each tsv, preprocessing and date parsing, the psatcat join,
+    satcat and launch dependent columns, custom launch types, and loading or saving the cache.
+
+    Peak RSS is always recorded (it's free). Set trace_memory to also record Python allocations per stage with tracemalloc,
+    which is much more precise but makes loading a few times slower.
+    Stages that run at the same time (tsv files read by a thread pool) each get their own wall and CPU time,
+    but peak RSS and traced peaks are process wide so they overlap between them.
+
+    Usage:
+        dataset = mda.McdowellDataset(profile=True)
+        print(dataset.profile.report())
+        dataset.profile.to_json("load_profile.json")
+    """
+
+    active = None # Profile of the dataset currently being built, Launch and Satcat record their stages in it
+
+    def __init__(self, trace_memory=False):
+        """
+        Args:
+            trace_memory (bool, optional): Record Python allocations per stage with tracemalloc. Defaults to False.
+        """
+
+        self.trace_memory = trace_memory
+        self.stages = [] # Finished DatasetStages, in the order they finished
+        self.running_stages = threading.local() # Stages that have started but not finished, per thread
+        self.started_tracemalloc = False
+
+    def start(self):
+        """
+        Record the stages of everything built from now on in this profile.
+        """
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracemalloc = True
+        DatasetProfile.active = self
+
+    def close(self):
+        if DatasetProfile.active is self:
+            DatasetProfile.active = None
+        if self.started_tracemalloc:
+            tracemalloc.stop()
+            self.started_tracemalloc = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def running(self):
+        """
+        Stages running in the current thread, innermost last
+        """
+
+        if not hasattr(self.running_stages, "stages"):
+            self.running_stages.stages = []
+        return self.running_stages.stages
+
+    def stage(self, name):
+        """
+        Context manager that records one stage, eg. with profile.stage("read launch.tsv") as stage: ...
+        """
+
+        return DatasetStage(self, name, depth=len(self.running()))
+
+    @staticmethod
+    def measure(name):
+        """
+        Record a stage in the active profile. Does nothing (but still returns a DatasetStage to set rows on) if no profile is running.
+        """
+
+        if DatasetProfile.active is None:
+            return DatasetStage(None, name)
+        return DatasetProfile.active.stage(name)
+
+    def ordered_stages(self):
+        """
+        Stages in the order they started. Stages finish inside out, so a stage is listed before the stages run inside it.
+        """
+
+        return sorted(self.stages, key=lambda stage: stage.start_wall_time)
+
+    def total_wall_time(self):
+        """
+        Seconds from the start of the first stage to the end of the last one
+        """
+
+        if not self.stages:
+            return 0.0
+        return max(stage.end_wall_time for stage in self.stages) - min(stage.start_wall_time for stage in self.stages)
+
+    def to_dict(self):
+        return {
+            "total_wall_time": self.total_wall_time(),
+            "trace_memory": self.trace_memory,
+            "pid": os.getpid(),
+            "stages": [stage.to_dict() for stage in self.ordered_stages()],
+        }
+
+    def to_json(self, path=None):
+        """
+        Profile as a JSON string, also written to path if given (eg. to keep with production logs).
+        """
+
+        text = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+
+    def report(self):
+        """
+        Table of the stages as a string, for printing.
+        """
+
+        def number(value, format):
+            return "" if value is None else format.format(value)
+
+        lines = [f"{'stage':<40} {'wall s':>8} {'cpu s':>8} {'rows':>10} {'peak rss mb':>12} {'+rss mb':>8}" + (f" {'traced peak mb':>15}" if self.trace_memory else "")]
+        for stage in self.ordered_stages():
+            line = f"{'  ' * stage.depth + stage.name:<40} {stage.wall_time:>8.3f} {stage.cpu_time:>8.3f} {number(stage.rows, '{:,}'):>10} {number(stage.peak_rss_mb, '{:.0f}'):>12} {number(stage.peak_rss_increase_mb, '{:.0f}'):>8}"
+            if self.trace_memory:
+                line += f" {number(stage.traced_peak_mb, '{:.1f}'):>15}"
+            lines.append(line)
+        lines.append(f"{'total':<40} {self.total_wall_time():>8.3f}")
+        return "\n".join(lines)
@@ -1,44 +1,378 @@
 import pandas as pd
+import numpy as np
 import translations
+import dataset_view
+import vague_dates
+import dataset_profile
+import tsv_reader
+from derived_columns import ColumnDerivation, DerivedColumns
+
+# Column derivations, see Satcat.column_derivations
+# Each adds its columns to df, a dataframe of the satcat dataset (satcat.df or a view's df)
+
+def strip_identifier(column):
+    """
+    Derivation function that upper cases and strips an identifier column, eg. Launch_Tag or JCAT.
+    """
+    def strip(satcat, df):
+        df[column] = df[column].astype(str).str.upper().str.strip()
+    return strip
+
+def parse_dates(column, name):
+    """
+    Derivation function that converts a vague date column (eg. LDate) to {name}_Date, {name}_Datetime and {name}_Date_Precision.
+    *_Date columns are kept to the day so grouping by date works as before, *_Datetime keeps the time of day
+    """
+    def parse(satcat, df):
+        with dataset_profile.DatasetProfile.measure(f"parse satcat {column}") as stage:
+            df[f"{name}_Datetime"], df[f"{name}_Date_Precision"] = vague_dates.parse_vague_dates(df[column])
+            df[column] = df[f"{name}_Datetime"].dt.normalize()
+            df.rename(columns={column: f"{name}_Date"}, inplace=True)
+            stage.rows = len(df)
+    return parse
+
+def to_numeric(column):
+    """
+    Derivation function that converts a column to numbers, NaN for anything that isn't one is filled with 0.
+    """
+    def convert(satcat, df):
+        df[column] = pd.to_numeric(df[column], errors="coerce").fillna(0)
+    return convert
+
+def add_simple_orbit(satcat, df):
+    # Orbits: https://planet4589.org/space/gcat/web/intro/orbits.html
+    df["Simple_Orbit"] = df["OpOrbit"].str.strip()
+    df["Simple_Orbit"] = df["Simple_Orbit"].replace(satcat.translation.opOrbit_to_simple_orbit)
+
+def add_country(satcat, df):
+    df["Country"] = df["State"].map(satcat.translation.state_code_to_state_name).map(satcat.translation.state_name_to_americanized_state_names)
+
+# Columns joined from psatcat.tsv, renamed to avoid confusion with satcat columns
+psatcat_columns = {"Name": "Payload_Name", "Program": "Payload_Program", "Class": "Payload_Class", "Category": "Payload_Category", "Discipline": "Payload_Discipline", "Result": "Payload_Result", "Comment": "Payload_Comment"}
+
+def add_psatcat_columns(satcat, df, psatcat=None):
+    """
+    Args:
+        psatcat (DataFrame, optional): Raw psatcat dataframe. Defaults to satcat.psatcat_df, or just the needed columns of psatcat.tsv if it wasn't loaded.
+    """
+    
+    if psatcat is None:
+        psatcat = satcat.psatcat_df if satcat.psatcat_df is not None else tsv_reader.read_tsv(satcat.psatcat_path, usecols=["#JCAT"] + list(psatcat_columns))
+    psatcat_df = psatcat.copy()
+    
+    # Rename to avoid confusion with satcat columns
+    psatcat_df.rename(columns={"#JCAT": "JCAT", **psatcat_columns}, inplace=True)
+    
+    # Strip JCAT
+    psatcat_df["JCAT"] = psatcat_df["JCAT"].astype(str).str.upper().str.strip()
+    
+    # Left join all the psatcat columns onto satcat by JCAT, keeps all satellites
+    satcat.join_columns(psatcat_df, "JCAT", list(psatcat_columns.values()), df=df)
+
+def add_simple_payload_category(satcat, df):
+    df["Simple_Payload_Category"] = df["Payload_Category"].str.strip()
+    df["Simple_Payload_Category"] = df["Simple_Payload_Category"].replace(satcat.translation.payload_category_to_simple_payload_category)
+
+# Columns joined from the satcat object's launch, State and Country are renamed Launch_State and Launch_Country
+launch_columns = ["LV_Type", "Agency", "Launch_Site", "Launch_Pad", "Launch_Vehicle_Family", "Launch_Vehicle_Simplified", "Launch_Site_Parent", "Launch_Site_Name", "Launch_State", "Launch_Country"]
+
+def add_launch_columns(satcat, df):
+    # For every satellite, get the corresponding launch vehicle from the launch_df by using the Launch_Tag column
+    launch_df = satcat.related.pristine_df[["Launch_Tag", "LV_Type", "Agency", "Launch_Site", "Launch_Pad", "Launch_Vehicle_Family", "Launch_Vehicle_Simplified", "Launch_Site_Parent", "Launch_Site_Name", "State", "Country"]]
+    launch_df = launch_df.rename(columns={"State": "Launch_State", "Country": "Launch_Country"})
+    
+    # Left join to keep all satellites, fill with empty string for unmatched launches
+    satcat.join_columns(launch_df, "Launch_Tag", launch_columns, fill_value="", df=df)
+
+satcat_date_columns = {"LDate": "Launch", "SDate": "Separation", "DDate": "Decay", "ODate": "Orbit_Canonical"}
+satcat_numeric_columns = ["Mass", "DryMass", "TotMass", "Length", "Diameter", "Span", "Perigee", "Apogee", "Inc"]
 
 class Satcat:
     """
     This contains all functions required for using McDowell's satellite catalog dataset.
     """
+    
+    # Low cardinality string columns that can be stored as categoricals, see convert_to_categorical()
+    categorical_columns = ["Type", "State", "Owner", "Manufacturer", "Bus", "Motor", "OpOrbit", "Simple_Orbit", "Country", "Payload_Program", "Payload_Category", "Payload_Discipline", "Payload_Result", "Simple_Payload_Category", "LV_Type", "Agency", "Launch_Site", "Launch_Pad", "Launch_Vehicle_Family", "Launch_Vehicle_Simplified", "Launch_Site_Parent", "Launch_Site_Name", "Launch_State", "Launch_Country"]
+    
+    # Every column derived from satcat.tsv (and psatcat, launch), with what it depends on. A full load runs them in this order.
+    column_derivations = DerivedColumns(
+        [ColumnDerivation([column], [column], strip_identifier(column), "preprocess") for column in ["Launch_Tag", "Piece", "JCAT"]] +
+        [ColumnDerivation([f"{name}_Date", f"{name}_Datetime", f"{name}_Date_Precision"], [column], parse_dates(column, name), "preprocess") for column, name in satcat_date_columns.items()] +
+        [ColumnDerivation([column], [column], to_numeric(column), "preprocess") for column in satcat_numeric_columns] + [
+            ColumnDerivation(["Simple_Orbit"], ["OpOrbit"], add_simple_orbit, "preprocess"),
+            ColumnDerivation(["Country"], ["State"], add_country, "preprocess"),
+            ColumnDerivation(list(psatcat_columns.values()), ["JCAT"], add_psatcat_columns, "psatcat"),
+            ColumnDerivation(["Simple_Payload_Category"], ["Payload_Category"], add_simple_payload_category, "psatcat"),
+            ColumnDerivation(launch_columns, ["Launch_Tag"], add_launch_columns, "launch_dependent", related_dependencies=["Launch_Tag", "LV_Type", "Agency", "Launch_Site", "Launch_Pad", "Launch_Vehicle_Family", "Launch_Vehicle_Simplified", "Launch_Site_Parent", "Launch_Site_Name", "State", "Country"]),
+        ],
+        file_path_attribute="satcat_path", related_name="launch", renamed_columns={"#JCAT": "JCAT"},
+    )
 
-    def __init__(self, translation=None, dataset_directory="./datasets"):
+    def __init__(self, translation=None, dataset_directory="./datasets", df=None, psatcat_df=None, date_updated=None, raw_df=None, raw_psatcat_df=None, columns=None):
         """
         Load the raw satcat dataset into a pandas DataFrame.
         
         satcat.tsv column descriptions: https://planet4589.org/space/gcat/web/cat/cols.html
+        
+        Args:
+            translation (Translation, optional): Translation tables. Defaults to the process wide Translation for dataset_directory.
+            dataset_directory (str, optional): Directory containing satcat.tsv and psatcat.tsv. Defaults to "./datasets".
+            df (DataFrame, optional): Already preprocessed satcat dataframe (eg. from the dataset cache). If given, satcat.tsv is not read or preprocessed.
+            psatcat_df (DataFrame, optional): Raw psatcat dataframe to go with df.
+            date_updated (str, optional): Dataset cutoff date to go with df.
+            raw_df (DataFrame, optional): satcat.tsv as read by tsv_reader.read_tsv() (eg. read concurrently by McdowellDataset), preprocessed here instead of reading the file.
+            raw_psatcat_df (DataFrame, optional): psatcat.tsv as read by tsv_reader.read_tsv(), goes with raw_df.
+            columns (list str, optional): Only load these columns (plus JCAT), reading just the tsv columns they need. Other columns are derived when they're first used, see derive_columns().
+                psatcat.tsv is only read if a Payload_* column is needed. Columns from launch need self.related, so load those with McdowellDataset(satcat_columns=...). Defaults to None (load everything).
         """
         
         self.dataset_directory = dataset_directory
         self.satcat_path = f"{dataset_directory}/satcat.tsv"
         self.psatcat_path = f"{dataset_directory}/psatcat.tsv"
-        self.translation = translation or translations.Translation()
-        self.date_updated = None
-        
-        self.df = pd.read_csv(self.satcat_path, sep="\t", encoding="utf-8", low_memory=False) # load satcat tsv into dataframe
-        self.psatcat_df = pd.read_csv(self.psatcat_path, sep="\t", encoding="utf-8", low_memory=False) # load psatcat tsv into dataframe
-        
-        self.preprocess_satcat_df()
-        
-        self.process_psatcat_dependent_columns(self.psatcat_df)
+        self.translation = translation or translations.Translation.get(dataset_directory)
+        self.date_updated = date_updated
+        self.projected_columns = columns # None if every column is loaded
+        self.related = None # Launch dataset the launch dependent columns come from
+        
+        if df is not None:
+            self.df = df
+            self.psatcat_df = psatcat_df
+            self.snapshot()
+            return
+        
+        if columns is not None:
+            self.date_updated = tsv_reader.read_date_updated(self.satcat_path)
+            self.df = Satcat.column_derivations.read_columns(self, ["JCAT"])
+            Satcat.column_derivations.derivation_of["JCAT"].function(self, self.df) # Cleaned up the same way as a full load
+            self.psatcat_df = None
+            self.snapshot()
+            self.derive_columns(list(columns))
+            return
+        
+        self.df = raw_df if raw_df is not None else tsv_reader.read_tsv(self.satcat_path) # load satcat tsv into dataframe
+        self.psatcat_df = raw_psatcat_df if raw_psatcat_df is not None else tsv_reader.read_tsv(self.psatcat_path) # load psatcat tsv into dataframe
+        
+        with dataset_profile.DatasetProfile.measure("preprocess satcat") as stage:
+            self.preprocess_satcat_df()
+            stage.rows = len(self.df)
+        
+        with dataset_profile.DatasetProfile.measure("psatcat join") as stage:
+            self.process_psatcat_dependent_columns(self.psatcat_df)
+            stage.rows = len(self.df)
+        
+        self.snapshot()
+
+    def view(self):
+        """
+        Read-only view of the current rows. Filters applied to the view return new views and leave this dataset untouched.
+        """
+        return dataset_view.DatasetView(self)
+
+    def population_over_time(self, group_by=None, freq="D", start_date=None, end_date=None, groups=None):
+        """
+        Number of objects in orbit on each date, optionally split by a column (eg. Simple_Orbit, Owner, Payload_Program).
+
+        An object is in orbit from the end of its Launch_Date until its Decay_Date (no Decay_Date means still in orbit).
+        Every launch is a +1 event and every decay a -1 event. The events are sorted by (group, date) once,
+        and the population of every group on every date is the number of launch events minus decay events up to that date, found with np.searchsorted.
+        That's O(n log n) for n objects, no matter how many dates and groups there are, instead of filtering satcat by date for every point.
+
+        Filter first to count only some objects, eg. payloads with Filters.filter_by_sat_type_coarse(view, "P").
+        Works on views too: Satcat.population_over_time(view, ...)
+
+        Args:
+            group_by (str, optional): Column to split by, one output column per value. Defaults to None (one "In_Orbit" column).
+            freq (str, optional): Pandas date frequency of the output, eg. "D" for daily, "MS" for the start of each month, "YS" for each year. Defaults to "D".
+            start_date (str, optional): First date, eg. "1957-10-01". Defaults to the first launch.
+            end_date (str, optional): Last date. Defaults to the last launch or decay.
+            groups (list, optional): Only these values of group_by, in this order. Defaults to every value, sorted.
+
+        Returns:
+            Dataframe: Index "Date" (end of day population), one int column per group.
+        """
+
+        launch_days, decay_days, launched, decayed = Satcat.lifetimes(self)
+
+        if group_by is None:
+            codes = np.zeros(len(launch_days), dtype=np.int64)
+            names = ["In_Orbit"]
+        else:
+            values = Satcat.column(self, group_by)
+            if groups is None:
+                codes, names = pd.factorize(values, sort=True)
+                names = list(names)
+            else:
+                names = list(groups)
+                codes = pd.Index(names).get_indexer(values)
+            launched &= codes >= 0 # NaN and values not in groups aren't counted
+            decayed &= codes >= 0
+
+        if start_date is None or end_date is None:
+            event_days = np.concatenate([launch_days[launched], decay_days[decayed]])
+            if len(event_days) == 0:
+                return pd.DataFrame(columns=names, index=pd.DatetimeIndex([], name="Date"), dtype=np.int64)
+            start_date = start_date if start_date is not None else np.datetime64(int(event_days.min()), "D")
+            end_date = end_date if end_date is not None else np.datetime64(int(event_days.max()), "D")
+        dates = pd.date_range(pd.to_datetime(start_date), pd.to_datetime(end_date), freq=freq, name="Date")
+        date_days = dates.to_numpy(dtype="datetime64[D]").astype(np.int64)
+
+        # Sort events by (group, day) with one combined key: group * offset + days since the first day, so groups don't overlap
+        first_day = min([date_days.min(initial=0), launch_days[launched].min(initial=0)])
+        offset = np.int64(1) << 32
+        launch_keys = np.sort(codes[launched] * offset + (launch_days[launched] - first_day))
+        decay_keys = np.sort(codes[decayed] * offset + (decay_days[decayed] - first_day))
+
+        group_keys = np.arange(len(names), dtype=np.int64)[:, None] * offset
+        query_keys = group_keys + (date_days - first_day)[None, :]
+        launches_so_far = np.searchsorted(launch_keys, query_keys, side="right") - np.searchsorted(launch_keys, group_keys, side="left")
+        decays_so_far = np.searchsorted(decay_keys, query_keys, side="right") - np.searchsorted(decay_keys, group_keys, side="left")
+
+        return pd.DataFrame((launches_so_far - decays_so_far).T, index=dates, columns=names)
+
+    def shell_occupancy(self, altitude_bins, inclination_bins, freq="YS", start_date=None, end_date=None, dates=None, altitude="Mean"):
+        """
+        Number of objects in orbit in each altitude band x inclination band on each date, eg. how crowded the 500-550 km, 50-55 deg shell was every year.
+
+        Each object's altitude and inclination band is found once with ChartUtils.bin_indices() and its launch and decay are turned into the range of dates it's in orbit for.
+        Then one np.bincount of +1 (first date in orbit) and -1 (first date after decay) per (date, cell) and a cumsum over the dates gives the whole date x altitude x inclination cube.
+        Orbits are the ones in satcat (Perigee, Apogee, Inc), objects without one (0 km) are outside any bins starting above 0.
+
+        Filter first to count only some objects, eg. payloads with Filters.filter_by_sat_type_coarse(view, "P"). Works on views too: Satcat.shell_occupancy(view, ...)
+
+        Args:
+            altitude_bins (list): Altitude band edges in km, eg. list(range(200, 2050, 50))
+            inclination_bins (list): Inclination band edges in degrees, eg. list(range(0, 185, 5))
+            freq (str, optional): Pandas date frequency, see population_over_time(). Defaults to "YS" (the start of each year).
+            start_date (str, optional): First date. Defaults to the first launch.
+            end_date (str, optional): Last date. Defaults to the last launch or decay.
+            dates (list, optional): Exact dates to use instead of freq, start_date and end_date. Defaults to None.
+            altitude (str, optional): "Perigee", "Apogee" or "Mean" (average of the two). Defaults to "Mean".
+
+        Returns:
+            Dataframe: Sparse cube, one row per non-empty (Date, Altitude_Band, Inclination_Band) with its Count.
+                The band columns are categoricals with every band in order, so empty bands still show up when pivoting (observed=False).
+        """
+
+        from chart_utils import ChartUtils # Imported here since chart_utils imports this module (through dataframe_filters)
+
+        if altitude == "Mean":
+            altitudes = (Satcat.column(self, "Perigee") + Satcat.column(self, "Apogee")) / 2
+        elif altitude in ("Perigee", "Apogee"):
+            altitudes = Satcat.column(self, altitude)
+        else:
+            raise ValueError(f"altitude must be 'Perigee', 'Apogee' or 'Mean', not '{altitude}'")
+
+        altitude_band = ChartUtils.bin_indices(altitudes, altitude_bins)
+        inclination_band = ChartUtils.bin_indices(Satcat.column(self, "Inc"), inclination_bins)
+        if altitude_band is None or inclination_band is None:
+            raise ValueError("shell_occupancy() needs increasing numeric altitude_bins and inclination_bins")
+
+        altitude_labels = [f"{low:g}-{high:g}" for low, high in zip(altitude_bins[:-1], altitude_bins[1:])]
+        inclination_labels = [f"{low:g}-{high:g}" for low, high in zip(inclination_bins[:-1], inclination_bins[1:])]
+        cell_count = len(altitude_labels) * len(inclination_labels)
+
+        launch_days, decay_days, launched, decayed = Satcat.lifetimes(self)
+        launched &= (altitude_band >= 0) & (inclination_band >= 0)
+
+        if dates is not None:
+            dates = pd.DatetimeIndex(pd.to_datetime(list(dates)), name="Date").sort_values()
+        else:
+            if start_date is None or end_date is None:
+                event_days = np.concatenate([launch_days[launched], decay_days[decayed & launched]])
+                if len(event_days) == 0:
+                    event_days = np.array([0])
+                start_date = start_date if start_date is not None else np.datetime64(int(event_days.min()), "D")
+                end_date = end_date if end_date is not None else np.datetime64(int(event_days.max()), "D")
+            dates = pd.date_range(pd.to_datetime(start_date), pd.to_datetime(end_date), freq=freq, name="Date")
+        date_days = dates.to_numpy(dtype="datetime64[D]").astype(np.int64)
+        date_count = len(date_days)
+
+        # Index of the first date each object is in orbit on, and the first date it isn't anymore
+        first = np.searchsorted(date_days, launch_days, side="left")
+        last = np.where(decayed, np.searchsorted(date_days, decay_days, side="left"), date_count)
+        in_orbit = launched & (first < last)
+
+        cells = altitude_band[in_orbit] * len(inclination_labels) + inclination_band[in_orbit]
+        changes = np.bincount(first[in_orbit] * cell_count + cells, minlength=(date_count + 1) * cell_count)
+        changes -= np.bincount(last[in_orbit] * cell_count + cells, minlength=(date_count + 1) * cell_count)
+        cube = np.cumsum(changes.reshape(date_count + 1, cell_count), axis=0)[:date_count]
+
+        date_index, cell_index = np.nonzero(cube)
+        return pd.DataFrame({
+            "Date": dates[date_index],
+            "Altitude_Band": pd.Categorical.from_codes(cell_index // len(inclination_labels), categories=altitude_labels, ordered=True),
+            "Inclination_Band": pd.Categorical.from_codes(cell_index % len(inclination_labels), categories=inclination_labels, ordered=True),
+            "Count": cube[date_index, cell_index],
+        })
+
+    def lifetimes(self):
+        """
+        Launch and decay day of every object (days since 1970), for population_over_time() and shell_occupancy().
+        Works on views too: Satcat.lifetimes(view)
+
+        Returns:
+            tuple(ndarray int, ndarray int, ndarray bool, ndarray bool): launch days, decay days, has a launch date, has a decay date (and a launch date).
+                Decay days are never before the launch day.
+        """
+
+        launch_dates = Satcat.column(self, "Launch_Date")
+        decay_dates = Satcat.column(self, "Decay_Date")
+        launch_days = launch_dates.to_numpy(dtype="datetime64[D]").astype(np.int64)
+        decay_days = decay_dates.to_numpy(dtype="datetime64[D]").astype(np.int64)
+        launched = launch_dates.notna().to_numpy()
+        decayed = decay_dates.notna().to_numpy() & launched
+        decay_days = np.where(decayed, np.maximum(decay_days, launch_days), 0) # Decay can't be before launch
+        return launch_days, decay_days, launched, decayed
+
+    def column(self, column):
+        """
+        Get a single column, derived first if the dataset was loaded with only some columns. Works on views too: Satcat.column(view, "Inc") only takes the view's rows of that column.
+        """
+
+        if isinstance(self, dataset_view.DatasetView):
+            return self.column(column)
+        if self.projected_columns is not None:
+            self.derive_columns([column])
+        return self.df[column]
 
+    def derive_columns(self, columns, df=None):
+        """
+        Make sure columns are in df, reading the tsv columns they need and deriving them if they aren't (only for datasets loaded with columns=[...]).
+        Args:
+            columns (list str): Column names, eg. ["Simple_Orbit", "Payload_Program"]
+            df (DataFrame, optional): Dataframe of this dataset to add them to, eg. a view's df. Defaults to self.df.
+        """
+
+        Satcat.column_derivations.derive(self, columns, df)
+
+    def snapshot(self):
+        """
+        Keep the current df as the pristine dataframe that reload() goes back to, and start filtering a shallow copy of it.
+        McdowellDataset calls this again once the columns joined from the other dataset are added.
+        The pristine dataframe is never modified: filters replace df and adding a column to df doesn't add it to the snapshot,
+        but changing values in place (df.loc[...] = ...) would, so filters shouldn't do that.
+        """
+        
+        self.pristine_df = self.df
+        self.reload()
+    
     def reload(self):
         """ 
-        Undo all filters
+        Undo all filters. O(1), df becomes a shallow copy of the pristine dataframe, nothing is read or processed again.
         """
-        self.__init__(translation=self.translation, dataset_directory=self.dataset_directory)
+        
+        self.df = self.pristine_df.copy(deep=False)
+        self.unfiltered_df = self.df # df until a filter replaces it, see LaunchCube.for_dataset()
 
     def preprocess_satcat_df(self):
         """
         Create new columns from existing columns in satcat dataframe to make it more pandas friendly.
         Lots of string manipulation to get the dates into a format that pandas can understand.
+        The columns are listed in Satcat.column_derivations.
         """
         
-        self.date_updated = " ".join(self.df.iloc[0, 0].strip().replace("  ", " ").split(" ")[2:5])
+        self.date_updated = tsv_reader.date_updated(self.df)
         
         # Remove second row of tsv, signifies date of last update
         self.df = self.df.drop(index=0).reset_index(drop=True)
@@ -46,44 +380,7 @@ class Satcat:
         # Rename column "#Launch_Tag" to "Launch_Tag"
         self.df.rename(columns={"#JCAT": "JCAT"}, inplace=True)
         
-        # Strip Launch_Tags & Piece & JCAT
-        self.df["Launch_Tag"] = self.df["Launch_Tag"].astype(str).str.upper().str.strip()
-        self.df["Piece"] = self.df["Piece"].astype(str).str.upper().str.strip()
-        self.df["JCAT"] = self.df["JCAT"].astype(str).str.upper().str.strip()
-        
-        date_cols = ["LDate", "SDate", "DDate", "ODate"]
-        for col in date_cols:
-            # Remove problematic characters from date columns (?, -) and handle NaN
-            self.df[col] = self.df[col].str.strip().fillna("").str.replace(r"[?-]", "", regex=True).str.strip()
-            # Replace double space "  " with single space " " - Sputnik 1 edge case!
-            self.df[col] = self.df[col].str.replace(r"\s{2,}", " ", regex=True).str.strip()
-            # Only include characters before the third space in all date columns (Remove hour/min/sec as unneeded and messes with data frame time formatting)
-            self.df[col] = self.df[col].str.split(" ", n=3).str[:3].str.join(" ").str.strip()
-            # Add " 1" to the end of all dates that only contain year and month (assuming this is all 8 character dates) eg. "2023 Feb" -> "2023 Feb 1"
-            self.df[col] = self.df[col].where(self.df[col].str.len() != 8, self.df[col] + " 1")
-            # Convert Mcdowell's Vague date format to pandas datetime format
-            self.df[col] = pd.to_datetime(self.df[col], format="%Y %b %d", errors="coerce")
-        
-        # Rename date columns
-        self.df.rename(columns={"LDate": "Launch_Date", "SDate": "Separation_Date", "DDate": "Decay_Date", "ODate": "Orbit_Canonical_Date"}, inplace=True)
-
-        # Convert numeric fields to int or float and handle NaN
-        self.df["Mass"] = pd.to_numeric(self.df["Mass"], errors="coerce").fillna(0)
-        self.df["DryMass"] = pd.to_numeric(self.df["DryMass"], errors="coerce").fillna(0)
-        self.df["TotMass"] = pd.to_numeric(self.df["TotMass"], errors="coerce").fillna(0)
-        self.df["Length"] = pd.to_numeric(self.df["Length"], errors="coerce").fillna(0)
-        self.df["Diameter"] = pd.to_numeric(self.df["Diameter"], errors="coerce").fillna(0)
-        self.df["Span"] = pd.to_numeric(self.df["Span"], errors="coerce").fillna(0)
-        self.df["Perigee"] = pd.to_numeric(self.df["Perigee"], errors="coerce").fillna(0)
-        self.df["Apogee"] = pd.to_numeric(self.df["Apogee"], errors="coerce").fillna(0)
-        self.df["Inc"] = pd.to_numeric(self.df["Inc"], errors="coerce").fillna(0)
-        
-        # Create Simple Orbit Column
-        # Orbits: https://planet4589.org/space/gcat/web/intro/orbits.html
-        self.df["Simple_Orbit"] = self.df["OpOrbit"].str.strip()
-        self.df["Simple_Orbit"] = self.df["Simple_Orbit"].replace(self.translation.opOrbit_to_simple_orbit)
-        
-        self.df["Country"] = self.df["State"].map(self.translation.state_code_to_state_name).map(self.translation.state_name_to_americanized_state_names)
+        Satcat.column_derivations.run_stage(self, "preprocess")
     
     def process_psatcat_dependent_columns(self, psatcat):
         """
@@ -101,60 +398,50 @@ class Satcat:
         Psatcat column descriptions: https://planet4589.org/space/gcat/web/cat/pscols.html
         """
         
-        psatcat_df = psatcat.copy()
-        
-        # Rename to avoid confusion with satcat columns
-        psatcat_df.rename(columns={"#JCAT": "JCAT", "Name": "Payload_Name", "Program": "Payload_Program", "Class": "Payload_Class", "Category": "Payload_Category", "Discipline": "Payload_Discipline", "Result": "Payload_Result", "Comment": "Payload_Comment"}, inplace=True)
-        
-        # Strip JCAT
-        psatcat_df["JCAT"] = psatcat_df["JCAT"].astype(str).str.upper().str.strip()
-        
-        # Merge satcat_df with psatcat_df to get Name, using left join to keep all satellites
-        self.df = self.df.merge(
-            psatcat_df[["JCAT", "Payload_Name"]],
-            on="JCAT",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            psatcat_df[["JCAT", "Payload_Program"]],
-            on="JCAT",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            psatcat_df[["JCAT", "Payload_Class"]],
-            on="JCAT",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            psatcat_df[["JCAT", "Payload_Category"]],
-            on="JCAT",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            psatcat_df[["JCAT", "Payload_Discipline"]],
-            on="JCAT",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            psatcat_df[["JCAT", "Payload_Result"]],
-            on="JCAT",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            psatcat_df[["JCAT", "Payload_Comment"]],
-            on="JCAT",
-            how="left"
-        )
-        
-        self.df["Simple_Payload_Category"] = self.df["Payload_Category"].str.strip()
-        self.df["Simple_Payload_Category"] = self.df["Simple_Payload_Category"].replace(self.translation.payload_category_to_simple_payload_category)
+        add_psatcat_columns(self, self.df, psatcat)
+        add_simple_payload_category(self, self.df)
+        
+    
+    def join_columns(self, right_df, key, columns, fill_value=None, df=None):
+        """
+        Left join columns from another dataframe onto satcat_df by a key column.
+        
+        Same result as a chain of self.df.merge(right_df[[key, col]], on=key, how="left") calls, but the key index is built once
+        and each column is added with a single take instead of copying the whole satcat dataframe for every merge.
+        If key is duplicated in right_df, the first row is used (a merge would duplicate satcat rows).
+        
+        Args:
+            right_df: DataFrame to take the columns from
+            key: Column name to join on, present in both dataframes. eg. "JCAT"
+            columns: List of column names in right_df to add to satcat_df
+            fill_value (optional): Value for unmatched rows and missing values in right_df. Defaults to NaN.
+            df (DataFrame, optional): Dataframe to add the columns to. Defaults to self.df.
+        """
+        
+        df = self.df if df is None else df
+        
+        right_df = right_df[[key] + list(columns)]
+        if not right_df[key].is_unique:
+            right_df = right_df.drop_duplicates(key, keep="first")
+        
+        # Position of each satcat row's key in right_df, -1 if not present
+        positions = pd.Index(right_df[key]).get_indexer(df[key])
+        
+        for col in columns:
+            values = right_df[col] if fill_value is None else right_df[col].fillna(fill_value)
+            df[col] = pd.api.extensions.take(values.to_numpy(), positions, allow_fill=True, fill_value=fill_value)
+    
+    def convert_to_categorical(self, columns=None):
+        """
+        Store low cardinality string columns as pandas categoricals (integer codes + one copy of each string).
+        Uses several times less memory, and isin() filters compare integer codes instead of strings.
+        Args:
+            columns (list str, optional): Columns to convert. Defaults to Satcat.categorical_columns.
+        """
         
+        for col in columns or Satcat.categorical_columns:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype("category")
     
     def process_launch_dependent_columns(self, launch):
         """
@@ -167,83 +454,5 @@ class Satcat:
             launch_df: DataFrame containing the launch class.
         """
         
-        # For every satellite, get the corresponding launch vehicle from the launch_df by using the Launch_Tag column to merge the two dataframes
-        launch_df = launch.df.copy()
-        
-        launch_df.rename(columns={"State": "Launch_State", "Country": "Launch_Country"}, inplace=True)
-        
-        # Merge satcat_df with launch_df to get LV_Type, using left join to keep all satellites
-        self.df = self.df.merge(
-            launch_df[["Launch_Tag", "LV_Type"]],
-            on="Launch_Tag",
-            how="left"
-        )
-        
-        # Merge satcat_df with launch_df to get Agency, using left join to keep all satellites
-        self.df = self.df.merge(
-            launch_df[["Launch_Tag", "Agency"]],
-            on="Launch_Tag",
-            how="left"
-        )
-        
-        # Merge satcat_df with launch_df to get Launch_Site, using left join to keep all satellites
-        self.df = self.df.merge(
-            launch_df[["Launch_Tag", "Launch_Site"]],
-            on="Launch_Tag",
-            how="left"
-        )
-        
-        # Merge satcat_df with launch_df to get Launch_Pad, using left join to keep all satellites
-        self.df = self.df.merge(
-            launch_df[["Launch_Tag", "Launch_Pad"]],
-            on="Launch_Tag",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            launch_df[["Launch_Tag", "Launch_Vehicle_Family"]],
-            on="Launch_Tag",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            launch_df[["Launch_Tag", "Launch_Vehicle_Simplified"]],
-            on="Launch_Tag",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            launch_df[["Launch_Tag", "Launch_Site_Parent"]],
-            on="Launch_Tag",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            launch_df[["Launch_Tag", "Launch_Site_Name"]],
-            on="Launch_Tag",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            launch_df[["Launch_Tag", "Launch_State"]],
-            on="Launch_Tag",
-            how="left"
-        )
-        
-        self.df = self.df.merge(
-            launch_df[["Launch_Tag", "Launch_Country"]],
-            on="Launch_Tag",
-            how="left"
-        )
-        
-        # Fill NaN with empty string for unmatched launches
-        self.df["LV_Type"] = self.df["LV_Type"].fillna("")
-        self.df["Agency"] = self.df["Agency"].fillna("")
-        self.df["Launch_Site"] = self.df["Launch_Site"].fillna("")
-        self.df["Launch_Pad"] = self.df["Launch_Pad"].fillna("")
-        self.df["Launch_Vehicle_Family"] = self.df["Launch_Vehicle_Family"].fillna("")
-        self.df["Launch_Vehicle_Simplified"] = self.df["Launch_Vehicle_Simplified"].fillna("")
-        self.df["Launch_Site_Parent"] = self.df["Launch_Site_Parent"].fillna("")
-        self.df["Launch_Site_Name"] = self.df["Launch_Site_Name"].fillna("")
-        self.df["Launch_State"] = self.df["Launch_State"].fillna("")
-        self.df["Launch_Country"] = self.df["Launch_Country"].fillna("")
+        self.related = launch
+        Satcat.column_derivations.run_stage(self, "launch_dependent")
@@ -0,0 +1,141 @@
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+
+class DatasetStore:
+    """
+    Processed dataframes in Arrow IPC files that any number of processes can open memory-mapped, so they all share one copy of the data.
+
+    DatasetCache also stores Arrow files, but reading them converts every string column to Python objects, so each process that loads
+    the cache gets its own copy of the dataset (several hundred MB at full size). Worker processes either did that or got a pickled copy.
+
+    Here the files are written so that opening them copies nothing:
+    - Strings are stored as Arrow large_string and opened as pandas "string[pyarrow]" columns, which keep pointing into the file.
+    - Dates are stored as timestamps with NaT kept as a value instead of a null, and NaN floats as NaN values, so they open as numpy arrays over the file.
+    - Files are uncompressed and written as one chunk per column.
+    Opening is just reading the file footers, and the data is paged in from the OS page cache on first use, shared by every process that has it open.
+    Categoricals (compact=True) still copy their codes, 1 or 2 bytes per row.
+
+    The chart functions give the same results with "string[pyarrow]" columns, the only difference is missing strings are pd.NA instead of NaN.
+
+    Requires pyarrow.
+
+    Usage:
+        dataset.export_arrow("./datasets/.arrow") # Once, in the parent process
+        dataset = McdowellDataset(arrow_store="./datasets/.arrow") # In each worker, takes milliseconds
+    """
+
+    # Bump this if the layout of the store changes
+    store_format_version = 1
+
+    def __init__(self, directory):
+        """
+        Args:
+            directory (str): Directory the Arrow files and metadata.json are in.
+        """
+
+        self.directory = directory
+
+    @staticmethod
+    def to_arrow(df):
+        """
+        Convert a dataframe to an Arrow table that DatasetStore.to_pandas() can open without copying, see the class docstring.
+        """
+
+        import pyarrow as pa
+
+        arrays = []
+        for column in df.columns:
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                array = pa.array(values)
+            elif values.dtype == object or isinstance(values.dtype, pd.StringDtype):
+                try:
+                    array = pa.array(values, type=pa.large_string(), from_pandas=True)
+                except (pa.ArrowInvalid, pa.ArrowTypeError): # Not all strings, let Arrow pick the type (opened with a copy)
+                    array = pa.array(values, from_pandas=True)
+            elif isinstance(values.dtype, np.dtype) and values.dtype.kind == "M":
+                unit = np.datetime_data(values.dtype)[0]
+                array = pa.array(values.to_numpy().view(np.int64)).view(pa.timestamp(unit)) # NaT stays int64 min, which is NaT again when opened
+            else:
+                array = pa.array(values.to_numpy(), from_pandas=False) # NaN stays a value instead of a null
+            arrays.append(array)
+        return pa.Table.from_arrays(arrays, names=[str(column) for column in df.columns])
+
+    @staticmethod
+    def to_pandas(table):
+        """
+        Convert a table written by DatasetStore.to_arrow() to a dataframe whose columns point into the table's buffers.
+        """
+
+        import pyarrow as pa
+
+        # split_blocks keeps one block per column, otherwise pandas would copy columns of the same dtype into one 2D array
+        return table.to_pandas(split_blocks=True, types_mapper={pa.large_string(): pd.StringDtype("pyarrow")}.get)
+
+    def save(self, dataframes, metadata=None):
+        """
+        Write dataframes to the store, replacing what's there.
+        Processes that already have the old files open keep reading them (on Linux and macOS).
+
+        Args:
+            dataframes (dict): Dictionary of name -> dataframe, eg. {"launch": launch.df, "satcat": satcat.df}. None values are skipped.
+            metadata (dict, optional): Extra json serializable values to store alongside the dataframes (eg. date_updated).
+        """
+
+        import pyarrow as pa
+
+        temp_directory = f"{os.path.abspath(self.directory)}.tmp{os.getpid()}"
+        shutil.rmtree(temp_directory, ignore_errors=True)
+        os.makedirs(temp_directory)
+
+        try:
+            names = []
+            for name, df in dataframes.items():
+                if df is None:
+                    continue
+                table = DatasetStore.to_arrow(df.reset_index(drop=True))
+                with pa.OSFile(f"{temp_directory}/{name}.arrow", "wb") as file:
+                    with pa.ipc.new_file(file, table.schema) as writer:
+                        writer.write_table(table, max_chunksize=max(len(df), 1)) # One chunk per column
+                names.append(name)
+
+            metadata = dict(metadata or {})
+            metadata["dataframes"] = names
+            metadata["store_format_version"] = DatasetStore.store_format_version
+            with open(f"{temp_directory}/metadata.json", "w", encoding="utf-8") as file:
+                json.dump(metadata, file)
+
+            # Write to a temp directory then rename, so a crash never leaves a half written store behind
+            shutil.rmtree(self.directory, ignore_errors=True)
+            os.replace(temp_directory, self.directory)
+        except Exception:
+            shutil.rmtree(temp_directory, ignore_errors=True)
+            raise
+
+    def load(self):
+        """
+        Open the stored dataframes memory-mapped.
+
+        Returns:
+            tuple(dict, dict): (dataframes by name, metadata)
+        """
+
+        import pyarrow as pa
+
+        with open(f"{self.directory}/metadata.json", "r", encoding="utf-8") as file:
+            metadata = json.load(file)
+        if metadata.get("store_format_version") != DatasetStore.store_format_version:
+            raise ValueError(f"{self.directory} was written by a different version of DatasetStore, export it again")
+
+        dataframes = {}
+        for name in metadata["dataframes"]:
+            # The memory map stays open as long as the dataframe's columns reference it
+            table = pa.ipc.open_file(pa.memory_map(f"{self.directory}/{name}.arrow")).read_all()
+            dataframes[name] = DatasetStore.to_pandas(table)
+        return dataframes, metadata
+
+    def exists(self):
+        return os.path.exists(f"{self.directory}/metadata.json")
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+
+class DatasetView:
+    """
+    Read-only selection of rows from a Launch or Satcat dataset.
+
+    A view holds a reference to the dataframe it was created from and the positions of the selected rows, nothing is copied.
+    Filters applied to a view return a new view with fewer positions instead of overwriting df, so the original dataset is never modified.
+    This means one loaded dataset can be filtered many different ways (eg. once per orbit in ChartUtils) without copy.deepcopy().
+
+    The selected rows are only copied into a new dataframe when .df is accessed.
+
+    Usage:
+        view = dataset.launch.view()
+        view = Filters.filter_by_orbit(view, "LEO")
+        view = Filters.filter_by_launch_date(view, start_date="2020-01-01")
+        view.df # dataframe of LEO launches since 2020
+    """
+
+    def __init__(self, dataset, base_df=None, positions=None):
+        """
+        Args:
+            dataset (Launch, Satcat or DatasetView): Dataset the view is over.
+            base_df (DataFrame, optional): Dataframe the positions index into. Defaults to dataset.df.
+            positions (ndarray int, optional): Row positions in base_df that are selected. Defaults to None (all rows).
+        """
+
+        self.dataset = dataset.dataset if isinstance(dataset, DatasetView) else dataset # Always the underlying Launch or Satcat
+        self.dataset_type = type(self.dataset) # Used by Filters for type checks
+        self.base_df = base_df if base_df is not None else dataset.df
+        self.positions = positions
+        self.materialized_df = None
+
+    @property
+    def translation(self):
+        return self.dataset.translation
+
+    @property
+    def date_updated(self):
+        return self.dataset.date_updated
+
+    @property
+    def df(self):
+        """
+        Dataframe of the selected rows. Created on first access, this is a new dataframe so modifying it doesn't modify the base dataset.
+        """
+
+        if self.materialized_df is None:
+            self.materialized_df = self.base_df.copy() if self.positions is None else self.base_df.take(self.positions)
+        return self.materialized_df
+
+    @df.setter
+    def df(self, df):
+        # Older filter functions do view.df = view.df[condition], after this the view is over the new dataframe
+        self.materialized_df = df
+
+    def __len__(self):
+        if self.materialized_df is not None:
+            return len(self.materialized_df)
+        return len(self.base_df) if self.positions is None else len(self.positions)
+
+    def view(self):
+        """
+        New view of the same rows. Columns added to its df (eg. Launch_Year) don't show up in this view.
+        """
+
+        if self.materialized_df is not None:
+            return DatasetView(self, self.materialized_df)
+        return DatasetView(self, self.base_df, self.positions)
+
+    def column(self, column):
+        """
+        Get a single column of the selected rows without creating the whole dataframe.
+        If the dataset was loaded with only some columns (McdowellDataset(launch_columns=[...])), missing columns are derived first.
+        Args:
+            column (str): Column name, eg. "Simple_Orbit"
+        """
+
+        df = self.materialized_df if self.materialized_df is not None else self.base_df
+        if column not in df.columns and getattr(self.dataset, "projected_columns", None) is not None and (df is self.materialized_df or df is self.dataset.df):
+            self.dataset.derive_columns([column], df=df) # Not for other dataframes, eg. LaunchCube tables
+
+        if self.materialized_df is not None:
+            return self.materialized_df[column]
+        if self.positions is None:
+            return self.base_df[column]
+        return self.base_df[column].take(self.positions)
+
+    def select(self, condition):
+        """
+        Create a new view with only the rows where condition is True.
+        Args:
+            condition (boolean Series or array): One value per row in this view. Missing values count as False.
+        """
+
+        # Missing values (NaN, None, pd.NA) don't match, np.asarray(..., dtype=bool) alone would turn NaN into True
+        if isinstance(condition, pd.Series):
+            condition = condition.to_numpy(dtype=bool, na_value=False)
+        elif isinstance(condition, np.ndarray) and condition.dtype.kind in "fO":
+            condition = np.where(pd.isna(condition), False, condition)
+        condition = np.broadcast_to(np.asarray(condition, dtype=bool), len(self))
+        return self.take(np.flatnonzero(condition))
+
+    def take(self, positions):
+        """
+        Create a new view with only the rows at the given positions.
+        Args:
+            positions (ndarray int): Row positions within this view (0 is the first row of this view, not of the base dataset).
+        """
+
+        if self.materialized_df is not None: # df was accessed or replaced, select from that so added columns are kept
+            return DatasetView(self, self.materialized_df, positions)
+        if self.positions is None:
+            return DatasetView(self, self.base_df, positions)
+        return DatasetView(self, self.base_df, self.positions[positions])
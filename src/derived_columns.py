@@ -0,0 +1,150 @@
+import pandas as pd
+import tsv_reader
+
+class ColumnDerivation:
+    """
+    How to compute some columns of a dataset from other columns, eg. Country from State.
+    """
+
+    def __init__(self, columns, dependencies, function, stage, related_dependencies=()):
+        """
+        Args:
+            columns (list str): Columns the function adds to (or replaces in) the dataframe.
+            dependencies (list str): Columns of the same dataset the function reads. Dependencies that no derivation creates are read from the tsv file.
+                A dependency that is also in columns is the raw tsv column the function replaces, eg. Launch_Date before it's parsed. It's skipped if the tsv doesn't have it.
+            function (function): function(dataset, df) that adds the columns to df. dataset is the Launch or Satcat the df belongs to.
+            stage (str): Loading step that computes it when everything is loaded, eg. "preprocess", see DerivedColumns.run_stage().
+            related_dependencies (list str, optional): Columns of the related dataset (satcat for launch, launch for satcat) the function reads.
+        """
+
+        self.columns = columns
+        self.dependencies = dependencies
+        self.function = function
+        self.stage = stage
+        self.related_dependencies = related_dependencies
+
+class DerivedColumns:
+    """
+    Registry of every column a Launch or Satcat dataset derives from its tsv files, with the columns each one depends on.
+
+    A full load runs every derivation stage by stage (Launch.preprocess_launch_df(), Satcat.process_launch_dependent_columns(), etc.).
+    A projected load (McdowellDataset(launch_columns=[...], satcat_columns=[...])) only reads the tsv columns the requested columns need with usecols
+    and only computes those derivations. Columns that weren't requested are derived the first time they're accessed through
+    Filters.column(), DatasetView.column() or dataset.derive_columns().
+    """
+
+    def __init__(self, derivations, file_path_attribute, related_name, renamed_columns=None):
+        """
+        Args:
+            derivations (list ColumnDerivation): In the order a full load runs them.
+            file_path_attribute (str): Attribute of the dataset with the tsv path, eg. "launch_path".
+            related_name (str): Name of the related dataset, for error messages. eg. "satcat"
+            renamed_columns (dict, optional): tsv header name: column name, eg. {"#Launch_Tag": "Launch_Tag"}.
+        """
+
+        self.derivations = derivations
+        self.file_path_attribute = file_path_attribute
+        self.related_name = related_name
+        self.renamed_columns = renamed_columns or {}
+        self.derivation_of = {column: derivation for derivation in derivations for column in derivation.columns}
+        self.headers = {} # tsv path: column names in the file, after renaming
+
+    def run_stage(self, dataset, stage):
+        """
+        Run every derivation of a loading stage on dataset.df, the way a full load does.
+        """
+
+        for derivation in self.derivations:
+            if derivation.stage == stage:
+                derivation.function(dataset, dataset.df)
+
+    def header(self, file_path):
+        if file_path not in self.headers:
+            self.headers[file_path] = [self.renamed_columns.get(column, column) for column in pd.read_csv(file_path, sep="\t", encoding="utf-8", nrows=0).columns]
+        return self.headers[file_path]
+
+    def plan(self, columns, present, file_columns):
+        """
+        What has to be read and run to add columns to a dataframe that has the present columns.
+
+        Returns:
+            tuple(list str, list ColumnDerivation): tsv columns to read, derivations to run (in registry order).
+        """
+
+        raw_columns = []
+        needed = []
+
+        def visit(column, replaced_by=None):
+            if column in present or column in raw_columns:
+                return
+            derivation = self.derivation_of.get(column)
+            if derivation is None or derivation is replaced_by: # A tsv column
+                if column in file_columns:
+                    raw_columns.append(column)
+                elif derivation is None:
+                    raise KeyError(f"{column} is not a tsv column or a derived column")
+                return
+            if derivation in needed:
+                return
+            needed.append(derivation)
+            for dependency in derivation.dependencies:
+                visit(dependency, derivation)
+
+        for column in columns:
+            visit(column)
+        return raw_columns, [derivation for derivation in self.derivations if derivation in needed]
+
+    def read_columns(self, dataset, columns, index=None):
+        """
+        Read columns of the dataset's tsv, as pandas reads them before any preprocessing.
+        Args:
+            index (Index, optional): Rows to return, the index of a loaded dataframe (row labels are line numbers in the tsv). Defaults to all rows.
+        """
+
+        file_columns = set(columns)
+        raw_df = tsv_reader.read_tsv(getattr(dataset, self.file_path_attribute), usecols=lambda column: self.renamed_columns.get(column, column) in file_columns)
+        raw_df = raw_df.rename(columns=self.renamed_columns)
+        raw_df = raw_df.drop(index=0).reset_index(drop=True) # Second row of the tsv is the date of last update
+        return raw_df if index is None else raw_df.reindex(index)
+
+    def derive(self, dataset, columns, df=None):
+        """
+        Add columns to a dataframe of the dataset (reading tsv columns and running derivations as needed), if they aren't already there.
+        Args:
+            dataset (Launch or Satcat): Dataset the dataframe belongs to.
+            columns (list str): Columns that should be in the dataframe.
+            df (DataFrame, optional): Defaults to dataset.df. A view's dataframe works too, rows are matched by index.
+                The columns are also added to dataset.pristine_df, so they're only derived once.
+
+        Returns:
+            list str: Columns that were read or derived.
+        """
+
+        df = dataset.df if df is None else df
+        missing = [column for column in columns if column not in df.columns]
+        if not missing:
+            return []
+
+        pristine_df = getattr(dataset, "pristine_df", None)
+        if pristine_df is not None and df is not pristine_df:
+            # Derive them for the whole dataset so reload() and other views keep them, then copy them over (aligned by row label)
+            added = self.derive(dataset, missing, pristine_df)
+            with pd.option_context("mode.chained_assignment", None): # df is often a filtered slice (df = df[condition]), adding columns to it is intended
+                for column in dict.fromkeys(missing + added): # Every column a derivation made, so eg. Launch_Date is never parsed without Launch_Datetime
+                    if column not in df.columns and column in pristine_df.columns: # Some raw columns are renamed, eg. ODate to Orbit_Canonical_Date
+                        df[column] = pristine_df[column]
+            return added
+
+        raw_columns, derivations = self.plan(missing, set(df.columns), set(self.header(getattr(dataset, self.file_path_attribute))))
+        if raw_columns:
+            raw_df = self.read_columns(dataset, raw_columns, df.index)
+            for column in raw_columns:
+                df[column] = raw_df[column]
+
+        for derivation in derivations:
+            if derivation.related_dependencies:
+                if getattr(dataset, "related", None) is None:
+                    raise ValueError(f"{derivation.columns} need the {self.related_name} dataset, load them with McdowellDataset(launch_columns=..., satcat_columns=...)")
+                dataset.related.derive_columns(derivation.related_dependencies)
+            derivation.function(dataset, df)
+        return raw_columns + [column for derivation in derivations for column in derivation.columns]
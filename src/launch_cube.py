@@ -0,0 +1,258 @@
+import os
+import numpy as np
+import pandas as pd
+import dataset_view
+from chart_utils import ChartUtils
+from dataframe_filters import Filters
+
+class LaunchCube:
+    """
+    Launch counts and total payload mass, aggregated once by every column the standard launch charts filter or split by.
+
+    Most launch charts are slices of the same few aggregates, eg. "orbital Falcon 9 launches per year by orbit".
+    The cube stores them as two small tables, one row per combination of the dimension columns that actually occurs:
+        period: dimensions x Launch_Year x Launch_Month, with Count and Total_Payload_Mass
+        mass: dimensions x Payload_Mass, with Count and Total_Payload_Mass
+    A chart runs its usual filters on the cube rows instead of on launch.df and adds up Count, so it touches a few thousand rows instead of every launch.
+    Filters that need a column that isn't a dimension (eg. filter_by_mission) can't be answered, those charts fall back to launch.df as usual.
+
+    The tables are saved as Parquet next to the dataset cache entry (requires pyarrow), so they're built once per dataset version.
+
+    Usage:
+        dataset = mda.McdowellDataset(launch_cube=True) # or mda.DatasetSession.get(launch_cube=True)
+        scg.launches_vs_year_by_orbit(...) # Answered from dataset.launch_cube
+
+    Charts answered from the cube don't save a raw dataframe (examples/outputs/raw_dataframes), since that would mean filtering launch.df anyway.
+    """
+
+    # Columns the cube is grouped by, every filter on these (orbit, launch vehicle, payload type, state, pad, etc.) can be answered from it
+    dimensions = ["LaunchCode", "Launch_Vehicle_Simplified", "Launch_Vehicle_Family", "Simple_Orbit", "General_Launch_Payload_Type", "State", "Country", "Launch_Pad"]
+
+    def __init__(self, launch, period_df=None, mass_df=None):
+        """
+        Args:
+            launch (Launch): Launch dataset the cube is built from (unfiltered).
+            period_df (DataFrame, optional): Already built period table, eg. loaded from disk. Defaults to building it from launch.df.
+            mass_df (DataFrame, optional): Already built mass table. Defaults to building it from launch.df.
+        """
+
+        if getattr(launch, "projected_columns", None) is not None and (period_df is None or mass_df is None):
+            launch.derive_columns(LaunchCube.dimensions + ["Launch_Date", "Payload_Mass"]) # Only some columns were loaded
+
+        self.launch = launch
+        self.source_df = launch.pristine_df # Charts only use the cube while the dataset is this dataframe, unfiltered
+        self.period_df = period_df if period_df is not None else LaunchCube.build_period_table(launch.df)
+        self.mass_df = mass_df if mass_df is not None else LaunchCube.build_mass_table(launch.df)
+
+    @staticmethod
+    def build_period_table(launch_df):
+        """
+        Count and total payload mass for every (dimensions, year, month). Launches without a date are left out, no chart can count them.
+        """
+
+        launch_df = launch_df[LaunchCube.dimensions + ["Launch_Date", "Payload_Mass"]]
+        launch_df = launch_df[launch_df["Launch_Date"].notna()]
+        dates = launch_df["Launch_Date"]
+        launch_df = launch_df.assign(Launch_Year=dates.dt.year.astype(np.int64), Launch_Month=(dates.dt.year * 12 + dates.dt.month).astype(np.int64)) # Same month encoding as the month charts
+        return LaunchCube.aggregate(launch_df, LaunchCube.dimensions + ["Launch_Year", "Launch_Month"])
+
+    @staticmethod
+    def build_mass_table(launch_df):
+        """
+        Count for every (dimensions, payload mass), Total_Payload_Mass is Payload_Mass x Count.
+        """
+
+        return LaunchCube.aggregate(launch_df[LaunchCube.dimensions + ["Payload_Mass"]], LaunchCube.dimensions + ["Payload_Mass"])
+
+    @staticmethod
+    def aggregate(launch_df, columns):
+        """
+        Group launches by columns (NaN is its own group, like an unfiltered launch) into Count and Total_Payload_Mass.
+        """
+
+        grouped = launch_df.groupby(columns, dropna=False, observed=True, sort=True)
+        table = grouped.size().rename("Count").to_frame()
+        if "Payload_Mass" in columns:
+            table["Total_Payload_Mass"] = table.index.get_level_values("Payload_Mass") * table["Count"]
+        else:
+            table["Total_Payload_Mass"] = grouped["Payload_Mass"].sum()
+        table = table.reset_index()
+
+        # Plain strings instead of categoricals (from compact=True) so the Parquet files are the same either way
+        for column in LaunchCube.dimensions:
+            if isinstance(table[column].dtype, pd.CategoricalDtype):
+                table[column] = table[column].astype(object)
+        return table
+
+    @staticmethod
+    def load_or_build(launch, cache=None):
+        """
+        Load the cube for a launch dataset from the dataset cache entry, or build it (and save it there if possible).
+        Args:
+            launch (Launch): Unfiltered launch dataset
+            cache (DatasetCache, optional): The dataset's cache, the cube is stored in its current entry. Defaults to None (build in memory only).
+        """
+
+        if cache is None:
+            return LaunchCube(launch)
+
+        paths = {table: f"{cache.entry_directory()}/launch_cube_{table}.parquet" for table in ("period", "mass")}
+        try:
+            return LaunchCube(launch, pd.read_parquet(paths["period"]), pd.read_parquet(paths["mass"]))
+        except (ImportError, OSError, ValueError): # No pyarrow, not built yet, or a broken file
+            pass
+
+        cube = LaunchCube(launch)
+        if os.path.isdir(cache.entry_directory()): # Only next to a saved dataset cache entry, so it's removed with it when the dataset changes
+            try:
+                for table, path in paths.items():
+                    temp_path = f"{path}.tmp{os.getpid()}"
+                    getattr(cube, f"{table}_df").to_parquet(temp_path, index=False)
+                    os.replace(temp_path, path)
+            except (ImportError, OSError, ValueError, TypeError) as error:
+                print(f"Launch cube could not be written: {error}")
+        return cube
+
+    @staticmethod
+    def for_dataset(dataset):
+        """
+        The dataset's launch cube if it has one and its launch dataset hasn't been filtered, otherwise None (then filter launch.df as usual).
+        Args:
+            dataset (McdowellDataset): Dataset or view of it, eg. from DatasetSession.view()
+        """
+
+        cube = getattr(dataset, "launch_cube", None)
+        if cube is None:
+            return None
+
+        launch = dataset.launch
+        if isinstance(launch, dataset_view.DatasetView):
+            unfiltered = launch.positions is None and launch.materialized_df is None and launch.base_df is launch.dataset.unfiltered_df and launch.dataset.pristine_df is cube.source_df
+        else:
+            unfiltered = launch is cube.launch and launch.df is launch.unfiltered_df and launch.pristine_df is cube.source_df
+        return cube if unfiltered else None
+
+    def view(self, table):
+        """
+        View over the rows of a cube table that launch filters can be applied to, eg. Filters.filter_by_orbit(cube.view("period"), "LEO")
+        Args:
+            table (str): "period" or "mass"
+        """
+
+        return dataset_view.DatasetView(self.launch, base_df=getattr(self, f"{table}_df"))
+
+    def has_columns_for(self, table, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None):
+        """
+        Whether a cube table has every column a chart's filter function needs.
+
+        Equality filters (Filters.equality_filters) and filter_column_by_exact() name their column. Any other filter is run on no rows of the table,
+        a KeyError means it needs a column that isn't a dimension. This is the only KeyError that means "use launch.df instead",
+        errors while computing the chart itself aren't caught so bugs aren't hidden behind the slower path.
+        """
+
+        columns = getattr(self, f"{table}_df").columns
+        if filter_function in Filters.equality_filters:
+            return Filters.equality_filters[filter_function][0] in columns
+        if filter_function == Filters.filter_column_by_exact:
+            return filter_function_additional_parameter in columns
+
+        no_rows = self.view(table).take(np.array([], dtype=np.int64))
+        try:
+            for parameter in filter_function_parameters_list:
+                ChartUtils.apply_filter_function(no_rows, filter_function, parameter, filter_function_additional_parameter)
+        except KeyError:
+            return False
+        return True
+
+    def filtered_rows(self, table, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, filter_out_suborbital=True):
+        """
+        Cube rows after the filters every launch chart starts with: orbital and deep space launches, then the launch vehicle or family.
+        """
+
+        rows = self.view(table)
+        if filter_out_suborbital:
+            rows = Filters.filter_by_launch_category(rows, ['O', 'D'])
+        if not all_vehicles:
+            if launch_vehicle_family is not None:
+                rows = Filters.filter_by_launch_vehicle_family(rows, launch_vehicle_family)
+            else:
+                rows = Filters.filter_by_launch_vehicle_name_simplified(rows, launch_vehicle_simplified_name)
+        return rows
+
+    def launches_vs_period(self, period, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, start_year=None, end_year=None, filter_out_suborbital=True):
+        """
+        Number of launches per year or month for each filter parameter, the same dataframe launches_vs_year_by_filter() and launches_vs_month_by_filter() make from launch.df.
+        Args:
+            period (str): "year" or "month"
+            Others: See launches_vs_year_by_filter()
+
+        Returns:
+            tuple(Dataframe, int, int) or None: (output_df, start_year, end_year), or None if a filter uses a column that isn't in the cube.
+        """
+
+        if not self.has_columns_for("period", filter_function, filter_function_parameters_list, filter_function_additional_parameter):
+            return None
+
+        rows = self.filtered_rows("period", launch_vehicle_simplified_name, launch_vehicle_family, all_vehicles, filter_out_suborbital)
+
+        years = rows.column("Launch_Year")
+        if start_year is None:
+            start_year = years.min()
+        if end_year is None:
+            end_year = years.max()
+        rows = rows.select((years >= start_year) & (years <= end_year)) # Same as filter_by_launch_date() from Jan 1 of start_year to Dec 31 of end_year
+
+        if period == "year":
+            value_col = 'Launch_Year'
+            bins = list(range(start_year-1, end_year+1))
+            bin_labels = list(range(start_year, end_year+1))
+        else:
+            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+            value_col = 'Launch_Month'
+            bins = list(range(start_year*12, (end_year+1)*12+1))
+            bin_labels = [f"{month} {year}" for year in range(start_year, end_year+1) for month in months]
+
+        output_df = ChartUtils.bin_dataset_into_matrix_by_filter_function(
+            dataset=rows,
+            filter_function=filter_function,
+            filter_function_parameters_list=filter_function_parameters_list,
+            value_col=value_col,
+            bins=bins,
+            bin_labels=bin_labels,
+            sum_col='Count',
+            filter_function_additional_parameter=filter_function_additional_parameter,
+        )
+
+        return output_df.astype(np.int64), start_year, end_year
+
+    def launches_vs_mass(self, filter_function, filter_function_parameters_list, mass_step_size_kg, mass_suffix, mass_divisor, filter_function_additional_parameter=None, launch_vehicle_simplified_name=None, launch_vehicle_family=None, filter_out_suborbital=True, total_mass=False):
+        """
+        Number of launches (or total payload mass if total_mass) per payload mass range for each filter parameter,
+        the same dataframe launches_vs_mass_by_filter() and total_mass_vs_mass_by_filter() make from launch.df (before dividing by mass_divisor).
+
+        Returns:
+            Dataframe or None: Index of mass range labels (named Payload_Mass), one column per parameter. None if a filter uses a column that isn't in the cube.
+        """
+
+        if not self.has_columns_for("mass", filter_function, filter_function_parameters_list, filter_function_additional_parameter):
+            return None
+
+        rows = self.filtered_rows("mass", launch_vehicle_simplified_name, launch_vehicle_family, False, filter_out_suborbital)
+
+        max_mass = int(rows.column('Payload_Mass').max())
+        bins = list(range(0, max_mass+mass_step_size_kg, mass_step_size_kg))
+        mass_labels = [f"{int(bins[i]/mass_divisor)}-{int(bins[i+1]/mass_divisor)}{mass_suffix}" for i in range(len(bins)-1)]
+
+        output_df = ChartUtils.bin_dataset_into_matrix_by_filter_function(
+            dataset=rows,
+            filter_function=filter_function,
+            filter_function_parameters_list=filter_function_parameters_list,
+            value_col='Payload_Mass',
+            bins=bins,
+            bin_labels=mass_labels,
+            sum_col='Total_Payload_Mass' if total_mass else 'Count',
+            drop_empty=total_mass and filter_function == Filters.filter_by_launch_pad_raw,
+            filter_function_additional_parameter=filter_function_additional_parameter,
+        )
+
+        return output_df if total_mass else output_df.astype(np.int64)
@@ -1,37 +1,313 @@
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 from dataset_launch import Launch
 from dataset_satcat import Satcat
 from dataframe_filters import Filters
 from translations import Translation
 from chart_utils import ChartUtils
+from chart_renderer import ChartRenderer
+from output_cache import OutputCache
+from dataset_cache import DatasetCache
+from dataset_store import DatasetStore
+from chart_batch import ChartBatch, ChartJob
 import standard_chart_generation
+from chart_manifest import ChartManifest
+from launch_cube import LaunchCube
+from dataset_profile import DatasetProfile
+import tsv_reader
+
+__version__ = "0.2.0"
 
 # Expose Launch and Satcat directly in this module's namespace
 # This allows for "import mcdowell_dataset_analysis" to allow for Launch.preprocess_launch_df() to work without having to import Launch
 # Ie. single import instead of the mess you see above
-__all__ = ['Launch', 'Satcat', 'Filters', 'McdowellDataset', 'Translation', 'ChartUtils']
+__all__ = ['Launch', 'Satcat', 'Filters', 'McdowellDataset', 'Translation', 'ChartUtils', 'DatasetCache', 'DatasetSession', 'ChartBatch', 'ChartJob', 'ChartRenderer', 'OutputCache', 'ChartManifest', 'LaunchCube', 'DatasetProfile', 'DatasetStore']
 
 class McdowellDataset:
     """
     This class serves as a wrapper for the Launch and Satcat classes, providing a unified interface for analysis.
     """
     
-    def __init__(self, dataset_directory="./datasets"):
-        self.translation = Translation(dataset_directory=dataset_directory)
+    def __init__(self, dataset_directory="./datasets", use_cache=True, cache_directory=None, compact=False, launch_cube=False, profile=False, read_threads=None, launch_columns=None, satcat_columns=None, arrow_store=None):
+        """
+        Args:
+            dataset_directory (str, optional): Directory containing the McDowell tsv files. Defaults to "./datasets".
+            use_cache (bool, optional): Load the processed dataframes from the on-disk cache if the tsv files haven't changed, and save them there if they have. Defaults to True.
+            cache_directory (str, optional): Where to store the cache. Defaults to "{dataset_directory}/.cache".
+            compact (bool, optional): Store low cardinality string columns (State, LV_Type, Simple_Orbit, etc.) as categoricals. Uses much less memory and makes isin() filters faster. Defaults to False.
+            launch_cube (bool, optional): Load (or build) a LaunchCube of launch counts and payload mass, which the launch vs year/month/mass charts are answered from when they can be. Stored with the cache. Defaults to False.
+            profile (bool or DatasetProfile, optional): Record the time, memory and row count of each loading stage in self.profile. Pass DatasetProfile(trace_memory=True) to also trace Python allocations. Defaults to False.
+            read_threads (int, optional): Threads to read the tsv files with when they aren't cached, 1 reads them one at a time. Defaults to one per file, up to the number of CPUs.
+            launch_columns (list str, optional): Only load these launch columns, eg. ["Launch_Date", "LV_Type"]. Only the tsv columns they need are read and only their derived columns are computed,
+                other columns are derived the first time a filter uses them. Much faster and smaller for small queries, but skips the dataset cache. Defaults to None (every column, unless satcat_columns is given).
+            satcat_columns (list str, optional): Same for satcat. If only one of launch_columns and satcat_columns is given, the other dataset starts with just its key column.
+            arrow_store (str, optional): Directory written by export_arrow(). The processed dataframes are opened memory-mapped from it instead of being loaded,
+                which takes milliseconds and shares one copy of the data between every process that opens it (eg. chart workers). The tsv files aren't read. Defaults to None.
+        """
+        
+        self.profile = (profile if isinstance(profile, DatasetProfile) else DatasetProfile()) if profile else None
+        
+        if self.profile is None:
+            self.load(dataset_directory, use_cache, cache_directory, compact, launch_cube, read_threads, launch_columns, satcat_columns, arrow_store)
+        else:
+            with self.profile:
+                self.load(dataset_directory, use_cache, cache_directory, compact, launch_cube, read_threads, launch_columns, satcat_columns, arrow_store)
+        
+        pd.set_option('display.max_columns', None)
+        pd.set_option('display.max_rows', None)
+    
+    def load(self, dataset_directory, use_cache, cache_directory, compact, launch_cube, read_threads=None, launch_columns=None, satcat_columns=None, arrow_store=None):
+        """
+        Load and process the datasets, see __init__() for the arguments.
+        """
+        
+        self.cache = DatasetCache(dataset_directory, cache_directory, library_version=__version__) if use_cache else None
+        translation_cache_directory = self.cache.cache_directory if self.cache else None # Translation dictionaries are cached with the dataset
+        
+        projected = launch_columns is not None or satcat_columns is not None
+        if projected:
+            self.cache = None # The cache holds whole dataframes, a projected load reads only the columns it needs from the tsv files
         
-        self.launch = Launch(self.translation, dataset_directory=dataset_directory)
-        self.satcat = Satcat(self.translation, dataset_directory=dataset_directory)
+        self.arrow_store = arrow_store
+        stored = None
+        if arrow_store is not None:
+            self.cache = None
+            with DatasetProfile.measure("open arrow store") as stage:
+                stored = DatasetStore(arrow_store).load()
+                stage.rows = len(stored[0]["launch"]) + len(stored[0]["satcat"])
         
-        self.launch.process_satcat_dependent_columns(self.satcat)
-        self.launch.add_custom_launch_types()
+        cached = None
+        if self.cache:
+            with DatasetProfile.measure("load cache") as stage:
+                cached = self.cache.load()
+                stage.rows = len(cached[0]["launch"]) + len(cached[0]["satcat"]) if cached is not None else None
+        if stored is not None:
+            dataframes, metadata = stored
+            self.translation = Translation(dataset_directory, dictionaries=metadata["translation"])
+            self.launch = Launch(self.translation, dataset_directory=dataset_directory, df=dataframes["launch"], auxcat_df=dataframes.get("auxcat"), date_updated=metadata["launch_date_updated"])
+            self.satcat = Satcat(self.translation, dataset_directory=dataset_directory, df=dataframes["satcat"], psatcat_df=dataframes.get("psatcat"), date_updated=metadata["satcat_date_updated"])
+        elif projected:
+            self.translation = Translation.get(dataset_directory, translation_cache_directory)
+            self.launch, self.satcat = McdowellDataset.read_columns(self.translation, dataset_directory, launch_columns or [], satcat_columns or [])
+        elif cached is not None:
+            dataframes, metadata = cached
+            self.translation = Translation.get(dataset_directory, translation_cache_directory)
+            self.launch = Launch(self.translation, dataset_directory=dataset_directory, df=dataframes["launch"], auxcat_df=dataframes["auxcat"], date_updated=metadata["launch_date_updated"])
+            self.satcat = Satcat(self.translation, dataset_directory=dataset_directory, df=dataframes["satcat"], psatcat_df=dataframes["psatcat"], date_updated=metadata["satcat_date_updated"])
+        else:
+            self.translation, self.launch, self.satcat = McdowellDataset.read_tsvs(dataset_directory, translation_cache_directory, read_threads)
+            
+            with DatasetProfile.measure("satcat dependent columns") as stage:
+                self.launch.process_satcat_dependent_columns(self.satcat)
+                stage.rows = len(self.launch.df)
+            with DatasetProfile.measure("custom launch types") as stage:
+                self.launch.add_custom_launch_types()
+                stage.rows = len(self.launch.df)
+            
+            with DatasetProfile.measure("launch dependent columns") as stage:
+                self.satcat.process_launch_dependent_columns(self.launch)
+                stage.rows = len(self.satcat.df)
+            
+            if self.cache:
+                with DatasetProfile.measure("save cache"):
+                    self.cache.save(
+                        {"launch": self.launch.df, "satcat": self.satcat.df, "auxcat": self.launch.auxcat_df, "psatcat": self.satcat.psatcat_df},
+                        {"launch_date_updated": self.launch.date_updated, "satcat_date_updated": self.satcat.date_updated},
+                    )
         
-        self.satcat.process_launch_dependent_columns(self.launch)
+        if compact:
+            with DatasetProfile.measure("convert to categorical"):
+                self.launch.convert_to_categorical()
+                self.satcat.convert_to_categorical()
+        
+        # reload() goes back to the fully processed dataframes
+        self.launch.snapshot()
+        self.satcat.snapshot()
+        
+        if stored is not None and "launch_cube_period" in stored[0]:
+            self.launch_cube = LaunchCube(self.launch, stored[0]["launch_cube_period"], stored[0]["launch_cube_mass"]) # Exported with the dataset, use it even if launch_cube is False
+        elif launch_cube:
+            with DatasetProfile.measure("launch cube") as stage:
+                self.launch_cube = LaunchCube.load_or_build(self.launch, self.cache)
+                stage.rows = len(self.launch_cube.period_df) + len(self.launch_cube.mass_df)
+        else:
+            self.launch_cube = None
         
         self.date_updated = self.launch.date_updated # Take date updated from the launch dataset arbitrarily
+    
+    def export_arrow(self, directory):
+        """
+        Write the processed dataframes (and the launch cube, if loaded) to an Arrow IPC store that McdowellDataset(arrow_store=directory) opens memory-mapped.
+        Replaces whatever is in directory. See DatasetStore.
+        Args:
+            directory (str): eg. "./datasets/.arrow"
+        """
         
-        pd.set_option('display.max_columns', None)
-        pd.set_option('display.max_rows', None)
+        if self.launch.projected_columns is not None or self.satcat.projected_columns is not None:
+            raise ValueError("Only a fully loaded dataset can be exported, load it without launch_columns and satcat_columns")
+        
+        dataframes = {"launch": self.launch.pristine_df, "satcat": self.satcat.pristine_df, "auxcat": self.launch.auxcat_df, "psatcat": self.satcat.psatcat_df}
+        if self.launch_cube is not None:
+            dataframes["launch_cube_period"] = self.launch_cube.period_df
+            dataframes["launch_cube_mass"] = self.launch_cube.mass_df
+        
+        DatasetStore(directory).save(dataframes, {
+            "launch_date_updated": self.launch.date_updated,
+            "satcat_date_updated": self.satcat.date_updated,
+            "translation": {name: getattr(self.translation, name) for name in Translation.generated_dictionaries},
+            "library_version": __version__,
+        })
+    
+    @staticmethod
+    def read_columns(translation, dataset_directory, launch_columns, satcat_columns):
+        """
+        Load only some columns of launch and satcat, see Launch(columns=...).
+        Launch and satcat are linked first so columns that come from the other dataset (eg. Payload_Mass) can be derived.
+        
+        Returns:
+            tuple(Launch, Satcat)
+        """
+        
+        launch = Launch(translation, dataset_directory=dataset_directory, columns=[])
+        satcat = Satcat(translation, dataset_directory=dataset_directory, columns=[])
+        launch.related, satcat.related = satcat, launch
+        
+        launch.projected_columns, satcat.projected_columns = list(launch_columns), list(satcat_columns)
+        launch.derive_columns(launch.projected_columns)
+        satcat.derive_columns(satcat.projected_columns)
+        return launch, satcat
+    
+    @staticmethod
+    def read_tsvs(dataset_directory, translation_cache_directory=None, read_threads=None):
+        """
+        Read and preprocess launch.tsv, auxcat.tsv, satcat.tsv, psatcat.tsv and the translation tables.
+        
+        With more than one thread the files are read at the same time on a thread pool (pandas' C parser releases the GIL for most of a read),
+        and launch and satcat are each preprocessed as soon as their own files are read, so a cold load takes about as long as reading satcat.tsv.
+        If threads can't be started the files are read one at a time.
+        
+        Args:
+            dataset_directory (str): Directory containing the McDowell tsv files.
+            translation_cache_directory (str, optional): Passed to Translation.get().
+            read_threads (int, optional): Size of the thread pool, 1 reads the files one at a time. Defaults to one per file, up to the number of CPUs.
+        
+        Returns:
+            tuple(Translation, Launch, Satcat): Launch and satcat before the steps that join them together.
+        """
+        
+        files = {"launch": "launch.tsv", "auxcat": "auxcat.tsv", "satcat": "satcat.tsv", "psatcat": "psatcat.tsv"}
+        read_threads = read_threads or min(len(files) + 1, os.cpu_count() or 1) # +1 for the translation tables
+        
+        if read_threads > 1:
+            pool = ThreadPoolExecutor(max_workers=read_threads, thread_name_prefix="read_tsvs")
+            futures = []
+            try:
+                translation_future = pool.submit(Translation.get, dataset_directory, translation_cache_directory)
+                futures.append(translation_future)
+                reads = {}
+                for name, file in files.items():
+                    reads[name] = pool.submit(tsv_reader.read_tsv, f"{dataset_directory}/{file}")
+                    futures.append(reads[name])
+            except RuntimeError: # Can't start new threads
+                for future in futures: # shutdown(cancel_futures=True) needs Python 3.9
+                    future.cancel()
+                pool.shutdown()
+                read_threads = 1
+        
+        if read_threads <= 1:
+            translation = Translation.get(dataset_directory, translation_cache_directory)
+            return translation, Launch(translation, dataset_directory=dataset_directory), Satcat(translation, dataset_directory=dataset_directory)
+        
+        with pool:
+            def ready(*names):
+                return translation_future.done() and all(reads[name].done() for name in names)
+            
+            # Preprocess launch and satcat on the pool as soon as their files are read, .result() raises here if a read failed
+            launch_future = satcat_future = None
+            for _ in as_completed([translation_future, *reads.values()]):
+                if launch_future is None and ready("launch", "auxcat"):
+                    launch_future = pool.submit(Launch, translation_future.result(), dataset_directory=dataset_directory, raw_df=reads["launch"].result(), raw_auxcat_df=reads["auxcat"].result())
+                if satcat_future is None and ready("satcat", "psatcat"):
+                    satcat_future = pool.submit(Satcat, translation_future.result(), dataset_directory=dataset_directory, raw_df=reads["satcat"].result(), raw_psatcat_df=reads["psatcat"].result())
+            
+            return translation_future.result(), launch_future.result(), satcat_future.result()
+    
+    def view(self):
+        """
+        Shallow copy of this dataset with launch and satcat replaced by views, so filters applied to it don't modify this dataset.
+        Cheap, no dataframes are copied until a view's .df is accessed.
+        """
+        
+        dataset_view = copy.copy(self)
+        dataset_view.launch = self.launch.view()
+        dataset_view.satcat = self.satcat.view()
+        return dataset_view
     
     def reload(self):
+        """
+        Undo all filters on launch and satcat. Cheap, they go back to their processed dataframes without reading anything.
+        """
+        
         self.launch.reload()
-        self.satcat.reload()
\ No newline at end of file
+        self.satcat.reload()
+
+class DatasetSession:
+    """
+    Loaded datasets shared by everything in this process, so the tsv files (or cache) are only read and joined once.
+    
+    The session's datasets are never filtered directly, chart functions start from DatasetSession.view() which is a cheap view of them.
+    
+    Usage:
+        dataset = DatasetSession.view() # Loads ./datasets on first use
+        dataset.launch = Filters.filter_by_orbit(dataset.launch, "LEO")
+    """
+    
+    datasets = {} # Absolute dataset directory: McdowellDataset
+    default_directory = "./datasets" # Used by get() and view() when no directory is given, eg. set by ChartBatch for the charts it runs
+    
+    def get(dataset_directory=None, **kwargs):
+        """
+        Get the session's dataset for a directory, loading it on first use.
+        Args:
+            dataset_directory (str, optional): Directory containing the McDowell tsv files. Defaults to DatasetSession.default_directory ("./datasets").
+            **kwargs: Passed to McdowellDataset() if the dataset has to be loaded (eg. compact=True).
+        """
+        
+        if dataset_directory is None:
+            dataset_directory = DatasetSession.default_directory
+        key = os.path.abspath(dataset_directory)
+        if key not in DatasetSession.datasets:
+            DatasetSession.datasets[key] = McdowellDataset(dataset_directory, **kwargs)
+        return DatasetSession.datasets[key]
+    
+    def set(dataset, dataset_directory=None):
+        """
+        Use an already loaded dataset as the session's dataset for its directory.
+        Args:
+            dataset (McdowellDataset): Loaded dataset. Shouldn't be filtered afterwards, filter views of it instead.
+            dataset_directory (str, optional): Directory to register it under. Defaults to the dataset's own directory.
+        """
+        
+        key = os.path.abspath(dataset_directory or dataset.launch.dataset_directory)
+        DatasetSession.datasets[key] = dataset
+    
+    def view(dataset=None, dataset_directory=None):
+        """
+        Cheap view of a dataset to filter for one chart.
+        Args:
+            dataset (McdowellDataset, optional): Dataset to view. Defaults to the session's dataset for dataset_directory.
+            dataset_directory (str, optional): Used when dataset is None. Defaults to DatasetSession.default_directory ("./datasets").
+        """
+        
+        if dataset is None:
+            dataset = DatasetSession.get(dataset_directory)
+        return dataset.view()
+    
+    def clear():
+        """
+        Drop all loaded datasets, eg. after the tsv files are updated. The next get() or view() loads them again.
+        """
+        
+        DatasetSession.datasets.clear()
\ No newline at end of file
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import threading
+import pandas as pd
+from chart_utils import ChartUtils
+from dataset_cache import DatasetCache
+
+class OutputCache:
+    """
+    Skip writing chart PNGs and CSVs whose inputs haven't changed since the last run.
+
+    While an OutputCache is running, ChartUtils.plot_*() and log_and_save_df() fingerprint everything that goes into each output file
+    (the dataframe's contents, title, labels, colors, sizes, etc. plus the library source code) and look the path up in a manifest.
+    If the output file exists and was written from the same fingerprint it's left as is, otherwise it's written and the manifest is updated.
+    So regenerating everything after a dataset update only rewrites the charts whose data actually changed.
+
+    The manifest is a JSON lines file that's only ever appended to, so worker processes from ChartBatch can record outputs at the same time.
+    Later lines win, close() rewrites it with one line per output.
+
+    Usage:
+        with OutputCache():
+            scg.generate_launch_vehicle_charts(...) # Unchanged charts are skipped
+    """
+
+    def __init__(self, manifest_path="examples/outputs/output_manifest.jsonl"):
+        """
+        Args:
+            manifest_path (str, optional): Manifest file. Defaults to "examples/outputs/output_manifest.jsonl".
+        """
+
+        self.manifest_path = manifest_path
+        self.entries = {} # Output path: fingerprint
+        self.library_fingerprint = DatasetCache.library_fingerprint() # Changes to the plotting code invalidate every output
+        self.lock = threading.Lock() # ChartRenderer records outputs from its writer thread
+        self.skipped = 0
+        self.written = 0
+
+    def start(self):
+        """
+        Load the manifest and have ChartUtils check outputs against it.
+        """
+
+        self.load()
+        ChartUtils.output_cache = self
+
+    def close(self):
+        """
+        Stop checking outputs and rewrite the manifest with one line per output.
+        """
+
+        if ChartUtils.output_cache is self:
+            ChartUtils.output_cache = None
+        self.compact()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def load(self):
+        """
+        Read the manifest. Missing files and corrupt lines (eg. from a killed run) are ignored, those outputs are just written again.
+        """
+
+        self.entries = {}
+        if not os.path.exists(self.manifest_path):
+            return
+
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    self.entries[entry["path"]] = entry["fingerprint"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+    def compact(self):
+        """
+        Rewrite the manifest with only the latest line for each output.
+        The file is read again first, so outputs recorded by other processes (eg. ChartBatch workers) are kept.
+        """
+
+        with self.lock:
+            self.load()
+            if not self.entries:
+                return
+            temp_path = f"{self.manifest_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for path, fingerprint in sorted(self.entries.items()):
+                    f.write(json.dumps({"path": path, "fingerprint": fingerprint}) + "\n")
+            os.replace(temp_path, self.manifest_path)
+
+    def fingerprint(self, parameters):
+        """
+        Hash everything that goes into an output file.
+        Args:
+            parameters (dict): Parameter name: value, eg. locals() of a plot function. Dataframes and series are hashed by contents, everything else by repr().
+        Returns:
+            str: sha256 hex digest
+        """
+
+        hasher = hashlib.sha256(self.library_fingerprint.encode())
+        for name in sorted(parameters):
+            value = parameters[name]
+            hasher.update(name.encode())
+            if isinstance(value, (pd.DataFrame, pd.Series)):
+                OutputCache.hash_pandas(hasher, value)
+            else:
+                hasher.update(repr(value).encode())
+        return hasher.hexdigest()
+
+    @staticmethod
+    def hash_pandas(hasher, data):
+        """
+        Add a dataframe or series to a hash: its column names, dtypes, index and values.
+        """
+
+        columns = list(data.columns) if isinstance(data, pd.DataFrame) else [data.name]
+        dtypes = list(data.dtypes) if isinstance(data, pd.DataFrame) else [data.dtype]
+        hasher.update(repr((columns, [str(dtype) for dtype in dtypes])).encode())
+        try:
+            row_hashes = pd.util.hash_pandas_object(data, index=True)
+        except TypeError: # Unhashable values in an object column (eg. lists), hash their string form instead
+            row_hashes = pd.util.hash_pandas_object(data.astype(str), index=True)
+        hasher.update(row_hashes.to_numpy().tobytes())
+
+    def is_current(self, output_path, fingerprint):
+        """
+        True if output_path exists and was last written from the same fingerprint.
+        """
+
+        current = self.entries.get(output_path) == fingerprint and os.path.exists(output_path)
+        if current:
+            self.skipped += 1
+        return current
+
+    def record(self, output_path, fingerprint):
+        """
+        Record that output_path was written from fingerprint.
+        """
+
+        with self.lock:
+            self.entries[output_path] = fingerprint
+            self.written += 1
+            os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+            with open(self.manifest_path, "a", encoding="utf-8") as f: # One short append per output, safe with several processes appending
+                f.write(json.dumps({"path": output_path, "fingerprint": fingerprint}) + "\n")
@@ -2,7 +2,7 @@ import mcdowell_dataset_analysis as mda
 from datetime import datetime
 import pandas as pd
 
-def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_prefix, output_prefix, mass_step_size_kg=1000, year_x_tick_step_size=1, month_x_tick_step_size=12, filter_out_suborbital=True):
+def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_prefix, output_prefix, mass_step_size_kg=1000, year_x_tick_step_size=1, month_x_tick_step_size=12, filter_out_suborbital=True, dataset=None):
     """Generate a series of charts for a specific launch vehicle.
 
     Charts:
@@ -23,6 +23,7 @@ def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_p
         year_x_tick_step_size (int, optional): The step size for year ticks on the x-axis. Defaults to 1.
         month_x_tick_step_size (int, optional): The step size for month ticks on the x-axis. Defaults to 12.
         filter_out_suborbital (bool, optional): Whether to filter out suborbital launches. Defaults to True.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to views of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     mass_suffix = "t" if mass_step_size_kg == 1000 else "kg"
@@ -36,6 +37,7 @@ def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_p
         mass_suffix=mass_suffix,
         mass_divisor=mass_divisor,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     total_mass_vs_mass_by_orbit(
@@ -46,6 +48,7 @@ def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_p
         mass_suffix=mass_suffix,
         mass_divisor=mass_divisor,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     launches_vs_mass_by_general_launch_payload_type(
@@ -56,6 +59,7 @@ def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_p
         mass_suffix=mass_suffix,
         mass_divisor=mass_divisor,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     total_mass_vs_mass_by_general_launch_payload_type(
@@ -66,6 +70,7 @@ def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_p
         mass_suffix=mass_suffix,
         mass_divisor=mass_divisor,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     launches_vs_month_by_general_launch_payload_type(
@@ -74,6 +79,7 @@ def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_p
         output_prefix=output_prefix,
         x_tick_step_size=month_x_tick_step_size,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     launches_vs_month_by_orbit(
@@ -82,6 +88,7 @@ def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_p
         output_prefix=output_prefix,
         x_tick_step_size=month_x_tick_step_size,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     launches_vs_year_by_general_launch_payload_type(
@@ -90,6 +97,7 @@ def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_p
         output_prefix=output_prefix,
         x_tick_step_size=year_x_tick_step_size,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     launches_vs_year_by_orbit(
@@ -98,9 +106,10 @@ def generate_launch_vehicle_charts(launch_vehicle_simplified_name, chart_title_p
         output_prefix=output_prefix,
         x_tick_step_size=year_x_tick_step_size,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
-def generate_launch_vehicle_scatter_plots(launch_vehicle_simplified_name, chart_title_prefix, output_prefix, mass_step_size_kg=1000, filter_out_suborbital=True):
+def generate_launch_vehicle_scatter_plots(launch_vehicle_simplified_name, chart_title_prefix, output_prefix, mass_step_size_kg=1000, filter_out_suborbital=True, dataset=None):
     """Generate scatter plots for a specific launch vehicle.
     
     Charts:
@@ -115,6 +124,7 @@ def generate_launch_vehicle_scatter_plots(launch_vehicle_simplified_name, chart_
         output_prefix (str): The prefix for the output file names.
         mass_step_size_kg (int, optional): The step size for mass ranges in kg. Defaults to 1000.
         filter_out_suborbital (bool, optional): Whether to filter out suborbital launches. Defaults to True.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to views of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     mass_suffix = "t" if mass_step_size_kg == 1000 else "kg"
@@ -129,6 +139,7 @@ def generate_launch_vehicle_scatter_plots(launch_vehicle_simplified_name, chart_
         series_title='Orbit',
         color_map=mda.ChartUtils.orbit_color_map,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     launch_value_vs_date_by_filter_scatter(
@@ -144,6 +155,7 @@ def generate_launch_vehicle_scatter_plots(launch_vehicle_simplified_name, chart_
         color_map=mda.ChartUtils.orbit_color_map,
         x_axis_type='date',
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     launch_value_vs_date_by_filter_scatter(
@@ -159,6 +171,7 @@ def generate_launch_vehicle_scatter_plots(launch_vehicle_simplified_name, chart_
         color_map=mda.ChartUtils.orbit_color_map,
         x_axis_type='date',
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     launch_value_vs_date_by_filter_scatter(
@@ -175,9 +188,10 @@ def generate_launch_vehicle_scatter_plots(launch_vehicle_simplified_name, chart_
         y_scaling_factor=mass_multiplier,
         x_axis_type='date',
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
-def generate_launch_vehicle_family_charts(launch_vehicle_simplified_name, chart_title_prefix, output_prefix, mass_step_size_kg=1000, year_x_tick_step_size=1, color_map=mda.ChartUtils.color_sequence_2_8, filter_out_suborbital=True):
+def generate_launch_vehicle_family_charts(launch_vehicle_simplified_name, chart_title_prefix, output_prefix, mass_step_size_kg=1000, year_x_tick_step_size=1, color_map=mda.ChartUtils.color_sequence_2_8, filter_out_suborbital=True, dataset=None):
     """Generate charts for a specific launch vehicle family.
 
     This is used on top of generate_launch_vehicle_charts if you want a charts that break down launches by vehicle, ie. for the multiple vehicles in a family (eg. Ariane 1 to 5).
@@ -190,6 +204,7 @@ def generate_launch_vehicle_family_charts(launch_vehicle_simplified_name, chart_
         year_x_tick_step_size (int, optional): _description_. Defaults to 1.
         color_map (_type_, optional): _description_. Defaults to mda.ChartUtils.color_sequence_2_8.
         filter_out_suborbital (bool, optional): Whether to filter out suborbital launches. Defaults to True.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to views of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     mass_suffix = "t" if mass_step_size_kg == 1000 else "kg"
@@ -208,6 +223,7 @@ def generate_launch_vehicle_family_charts(launch_vehicle_simplified_name, chart_
         mass_suffix=mass_suffix,
         mass_divisor=mass_divisor,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     total_mass_vs_mass_by_filter(
@@ -223,6 +239,7 @@ def generate_launch_vehicle_family_charts(launch_vehicle_simplified_name, chart_
         mass_suffix=mass_suffix,
         mass_divisor=mass_divisor,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     launches_vs_year_by_filter(
@@ -236,10 +253,11 @@ def generate_launch_vehicle_family_charts(launch_vehicle_simplified_name, chart_
         x_tick_step_size=year_x_tick_step_size,
         color_map=color_map,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
 
-def generate_extra_charts(launch_vehicle_simplified_name, chart_title_prefix, output_prefix, mass_step_size_kg=1000, year_x_tick_step_size=1, month_x_tick_step_size=12, color_map=mda.ChartUtils.color_sequence_2_8, filter_out_suborbital=True):
+def generate_extra_charts(launch_vehicle_simplified_name, chart_title_prefix, output_prefix, mass_step_size_kg=1000, year_x_tick_step_size=1, month_x_tick_step_size=12, color_map=mda.ChartUtils.color_sequence_2_8, filter_out_suborbital=True, dataset=None):
     """Generate extra charts.
     
     Charts:
@@ -256,14 +274,14 @@ def generate_extra_charts(launch_vehicle_simplified_name, chart_title_prefix, ou
         month_x_tick_step_size (int, optional): _description_. Defaults to 12.
         color_map (_type_, optional): _description_. Defaults to mda.ChartUtils.color_sequence_2_8.
         filter_out_suborbital (bool, optional): Whether to filter out suborbital launches. Defaults to True.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to views of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     mass_suffix = "t" if mass_step_size_kg == 1000 else "kg"
     mass_divisor = 1000 if mass_step_size_kg == 1000 else 1
     
-    # Get every Launch_Pad (column 11) from launch.tsv, bypassing mda since it's not initialized yet
-    launch_df = pd.read_csv("./datasets/launch.tsv", sep="\t", encoding="utf-8", low_memory=False)
-    launch_sites = launch_df["Launch_Pad"].dropna().unique().tolist()
+    # Every Launch_Pad in the dataset, in the order they first appear
+    launch_sites = mda.DatasetSession.view(dataset).launch.column("Launch_Pad").dropna().unique().tolist()
     
     color_map = mda.ChartUtils.f9_site_color_map if "Falcon 9" in launch_vehicle_simplified_name else color_map
     
@@ -278,6 +296,7 @@ def generate_extra_charts(launch_vehicle_simplified_name, chart_title_prefix, ou
         x_tick_step_size=month_x_tick_step_size,
         color_map=color_map,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     launches_vs_year_by_filter(
@@ -291,6 +310,7 @@ def generate_extra_charts(launch_vehicle_simplified_name, chart_title_prefix, ou
         x_tick_step_size=year_x_tick_step_size,
         color_map=color_map,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
     
     launches_vs_mass_by_filter(
@@ -306,6 +326,7 @@ def generate_extra_charts(launch_vehicle_simplified_name, chart_title_prefix, ou
         mass_suffix=mass_suffix,
         mass_divisor=mass_divisor,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
     total_mass_vs_mass_by_filter(
@@ -321,10 +342,11 @@ def generate_extra_charts(launch_vehicle_simplified_name, chart_title_prefix, ou
         mass_suffix=mass_suffix,
         mass_divisor=mass_divisor,
         filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
 
-def launches_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, mass_step_size_kg=1000, launch_vehicle_simplified_name=None, launch_vehicle_family=None, color_map=None, mass_suffix='t', mass_divisor=100, filter_out_suborbital=True):
+def launches_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, mass_step_size_kg=1000, launch_vehicle_simplified_name=None, launch_vehicle_family=None, color_map=None, mass_suffix='t', mass_divisor=100, filter_out_suborbital=True, dataset=None):
     """Generate a chart showing the number of launches by payload mass range by a given filter function (eg. launch vehicle, launch category, etc.).
     Eg. How many launches were 2-3 tonnes and LEO, how many 6-7 tonnes and GTO, etc.
 
@@ -339,46 +361,49 @@ def launches_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_su
         launch_vehicle_family (str, optional): Family of launch vehicle to filter by. If not none, then filtering will be done by family instead of the launch_vehicle field.
         mass_suffix (str, optional): Suffix for the mass labels (default is 't' for tonnes, use 'kg' if you want). Defaults to 't'.
         mass_divisor (int, optional): Divisor for the mass values in the chart (default is 1000 to convert kg to tonnes). Defaults to 1000.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     output_name = f"{output_prefix}_launches_vs_mass_by_{output_suffix}"
 
     # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
+    dataset = mda.DatasetSession.view(dataset)
 
-    # Filter the base dataset
-    if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])  # Filter for orbital and deep space launches
-    if launch_vehicle_family is not None:
-        mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
-    else:
-        mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
+    # Precomputed counts if the dataset has a launch cube with every column the filters need (see LaunchCube), otherwise None
+    cube = mda.LaunchCube.for_dataset(dataset)
+    output_df = cube.launches_vs_mass(filter_function, filter_function_parameters_list, mass_step_size_kg, mass_suffix, mass_divisor, filter_function_additional_parameter, launch_vehicle_simplified_name, launch_vehicle_family, filter_out_suborbital) if cube is not None else None
 
-    mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
-    
-    max_mass = int(dataset.launch.df['Payload_Mass'].max())
-
-    # Define mass bins and labels
-    bins = list(range(0, max_mass+mass_step_size_kg, mass_step_size_kg)) # +mass_step_size_kg bc. range is exclusive
-    mass_labels = [f"{int(bins[i]/mass_divisor)}-{int(bins[i+1]/mass_divisor)}{mass_suffix}" for i in range(len(bins)-1)]
+    if output_df is None:
+        # Filter the base dataset
+        if filter_out_suborbital:
+            dataset.launch = mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])  # Filter for orbital and deep space launches
+        if launch_vehicle_family is not None:
+            dataset.launch = mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
+        else:
+            dataset.launch = mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
 
-    # Create a dictionary with key orbits and values are dataframes for each orbit showing the number of launches per payload mass range
-    dataframes = mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(
-        dataset=dataset.launch,
-        filter_function=filter_function,
-        filter_function_parameters_list=filter_function_parameters_list,
-        value_col='Payload_Mass',
-        bins=bins,
-        bin_labels=mass_labels,
-        filter_function_additional_parameter=filter_function_additional_parameter,
-    )
-    
-    # remove dataframes with no data or all zeroes, so that launch pad filtering doesn't include literally all pads ever
+        mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
+        
+        max_mass = int(dataset.launch.df['Payload_Mass'].max())
+
+        # Define mass bins and labels
+        bins = list(range(0, max_mass+mass_step_size_kg, mass_step_size_kg)) # +mass_step_size_kg bc. range is exclusive
+        mass_labels = [f"{int(bins[i]/mass_divisor)}-{int(bins[i+1]/mass_divisor)}{mass_suffix}" for i in range(len(bins)-1)]
+
+        # Dataframe with a column for each filter parameter (eg. orbit) and a row for each payload mass range, the number of launches in each
+        output_df = mda.ChartUtils.bin_dataset_into_matrix_by_filter_function(
+            dataset=dataset.launch,
+            filter_function=filter_function,
+            filter_function_parameters_list=filter_function_parameters_list,
+            value_col='Payload_Mass',
+            bins=bins,
+            bin_labels=mass_labels,
+            filter_function_additional_parameter=filter_function_additional_parameter,
+        )
+    
+    # remove columns with all zeroes, so that launch pad filtering doesn't include literally all pads ever
     if filter_function == mda.Filters.filter_by_launch_pad_raw:
-        dataframes = {key: df for key, df in dataframes.items() if not df.empty and df.sum().sum() > 0}
-
-    # Create dictionary with columns that are the orbits and values are the mass ranges
-    output_df = mda.ChartUtils.combine_dictionary_of_dataframes(dataframes)
+        output_df = output_df.loc[:, output_df.sum() > 0]
 
     # Save to CSV
     mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
@@ -394,7 +419,7 @@ def launches_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_su
         bargap=0.1,
     )
     
-def launches_vs_mass_by_orbit(mass_step_size_kg, chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, mass_suffix='t', mass_divisor=1000, filter_out_suborbital=True):
+def launches_vs_mass_by_orbit(mass_step_size_kg, chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, mass_suffix='t', mass_divisor=1000, filter_out_suborbital=True, dataset=None):
     # Wrapper for back compatibility bc I don't want to ctrl f and replace them all
     launches_vs_mass_by_filter(
         chart_title_prefix=chart_title_prefix,
@@ -410,59 +435,55 @@ def launches_vs_mass_by_orbit(mass_step_size_kg, chart_title_prefix, output_pref
         color_map=mda.ChartUtils.orbit_color_map,
         mass_suffix=mass_suffix,
         mass_divisor=mass_divisor,
-        filter_out_suborbital=filter_out_suborbital
+        filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
-def total_mass_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, mass_step_size_kg=1000, launch_vehicle_simplified_name=None, launch_vehicle_family=None, color_map=None, mass_suffix='t', mass_divisor=1000, filter_out_suborbital=True):
+def total_mass_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, mass_step_size_kg=1000, launch_vehicle_simplified_name=None, launch_vehicle_family=None, color_map=None, mass_suffix='t', mass_divisor=1000, filter_out_suborbital=True, dataset=None):
     """
     Generate a chart showing the distribution of total launched mass versus payload mass range by a given filter function (e.g., launch vehicle, launch category, etc.).
     """
     output_name = f"{output_prefix}_total_mass_vs_mass_by_{output_suffix}"
 
     # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
+    dataset = mda.DatasetSession.view(dataset)
 
-    # Filter the base dataset
-    if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])  # Filter for orbital and deep space launches
-    if launch_vehicle_family is not None:
-        mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
-    else:
-        mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
+    # Precomputed masses if the dataset has a launch cube with every column the filters need (see LaunchCube), otherwise None
+    cube = mda.LaunchCube.for_dataset(dataset)
+    total_masses = cube.launches_vs_mass(filter_function, filter_function_parameters_list, mass_step_size_kg, mass_suffix, mass_divisor, filter_function_additional_parameter, launch_vehicle_simplified_name, launch_vehicle_family, filter_out_suborbital, total_mass=True) if cube is not None else None
 
-    mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
+    if total_masses is None:
+        # Filter the base dataset
+        if filter_out_suborbital:
+            dataset.launch = mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])  # Filter for orbital and deep space launches
+        if launch_vehicle_family is not None:
+            dataset.launch = mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
+        else:
+            dataset.launch = mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
 
-    max_mass = int(dataset.launch.df['Payload_Mass'].max())
+        mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
 
-    bins = list(range(0, max_mass + mass_step_size_kg, mass_step_size_kg))
-    mass_labels = [f"{int(bins[i]/mass_divisor)}-{int(bins[i+1]/mass_divisor)}{mass_suffix}" for i in range(len(bins)-1)]
+        max_mass = int(dataset.launch.df['Payload_Mass'].max())
 
-    dataframes = mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(
-        dataset=dataset.launch,
-        filter_function=filter_function,
-        filter_function_parameters_list=filter_function_parameters_list,
-        value_col='Payload_Mass',
-        bins=bins,
-        bin_labels=mass_labels,
-        count_values=False,
-        bin_column='Mass_Range',
-        filter_function_additional_parameter=filter_function_additional_parameter
-    )
-    
-    # remove dataframes with no data or all zeroes, so that launch pad filtering doesn't include literally all pads ever
-    if filter_function == mda.Filters.filter_by_launch_pad_raw:
-        def numeric_sum(df):
-            numeric_cols = df.select_dtypes(include='number').columns
-            return df[numeric_cols].sum().sum() if not df.empty and len(numeric_cols) > 0 else 0
-        dataframes = {key: df for key, df in dataframes.items() if not df.empty and numeric_sum(df) > 0}
-    
-    total_masses = {}
-    for key in dataframes.keys():
-        total_mass = dataframes[key].groupby('Mass_Range', observed=False)['Payload_Mass'].sum()
-        total_mass = total_mass.reindex(mass_labels, fill_value=0)
-        total_masses[key] = total_mass / mass_divisor
+        bins = list(range(0, max_mass + mass_step_size_kg, mass_step_size_kg))
+        mass_labels = [f"{int(bins[i]/mass_divisor)}-{int(bins[i+1]/mass_divisor)}{mass_suffix}" for i in range(len(bins)-1)]
 
-    output_df = mda.ChartUtils.combine_dictionary_of_dataframes(total_masses)
+        # Total payload mass in each mass range for each filter parameter
+        # Launch pads with no launches are left out, so that launch pad filtering doesn't include literally all pads ever
+        total_masses = mda.ChartUtils.bin_dataset_into_matrix_by_filter_function(
+            dataset=dataset.launch,
+            filter_function=filter_function,
+            filter_function_parameters_list=filter_function_parameters_list,
+            value_col='Payload_Mass',
+            bins=bins,
+            bin_labels=mass_labels,
+            sum_col='Payload_Mass',
+            drop_empty=filter_function == mda.Filters.filter_by_launch_pad_raw,
+            filter_function_additional_parameter=filter_function_additional_parameter
+        )
+
+    output_df = total_masses / mass_divisor
+    output_df.index.name = 'Mass_Range'
 
     # Save to CSV
     mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
@@ -478,7 +499,7 @@ def total_mass_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_
         bargap=0.1
     )
     
-def total_mass_vs_mass_by_orbit(mass_step_size_kg, chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, mass_suffix='t', mass_divisor=1000, filter_out_suborbital=True):
+def total_mass_vs_mass_by_orbit(mass_step_size_kg, chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, mass_suffix='t', mass_divisor=1000, filter_out_suborbital=True, dataset=None):
     # Wrapper
     total_mass_vs_mass_by_filter(
         chart_title_prefix=chart_title_prefix,
@@ -494,10 +515,11 @@ def total_mass_vs_mass_by_orbit(mass_step_size_kg, chart_title_prefix, output_pr
         color_map=mda.ChartUtils.orbit_color_map,
         mass_suffix=mass_suffix,
         mass_divisor=mass_divisor,
-        filter_out_suborbital=filter_out_suborbital
+        filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
-def launches_vs_mass_by_general_launch_payload_type(mass_step_size_kg, chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, mass_suffix='t', mass_divisor=1000, filter_out_suborbital=True):
+def launches_vs_mass_by_general_launch_payload_type(mass_step_size_kg, chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, mass_suffix='t', mass_divisor=1000, filter_out_suborbital=True, dataset=None):
     """Generate a chart showing the number of launches by payload mass range by general launch payload type.
     Eg. How many launches were 2-3 tonnes and Starlink, how many 6-7 tonnes and Commercial, etc.
 
@@ -509,59 +531,29 @@ def launches_vs_mass_by_general_launch_payload_type(mass_step_size_kg, chart_tit
         launch_vehicle_family (str, optional): Family of launch vehicle to filter by. If not none, then filtering will be done by family instead of the launch_vehicle field.
         mass_suffix (str, optional): Suffix for the mass labels (default is 't' for tonnes, use 'kg' if you want). Defaults to 't'.
         mass_divisor (int, optional): Divisor for the mass values in the chart (default is 1000 to convert kg to tonnes). Defaults to 1000.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
-    output_name = f"{output_prefix}_launches_vs_mass_by_general_launch_payload_type"
-
-    # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
-
-    # Filter for orbital and deep space launches
-    if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
-    if launch_vehicle_family is not None:
-        mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
-    else:
-        mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
-
-    mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
-    
-    max_mass = int(dataset.launch.df['Payload_Mass'].max())
-
-    # Define payload types and bins
-    general_launch_payload_types = ['Starlink', 'Commercial', 'Chinese Commercial', 'Government', 'Eastern Government', 'Military', 'Eastern Military']
-    bins = list(range(0, max_mass+mass_step_size_kg, mass_step_size_kg))
-    mass_labels = [f"{int(bins[i]/mass_divisor)}-{int(bins[i+1]/mass_divisor)}{mass_suffix}" for i in range(len(bins)-1)]
-
-    # Create a dictionary with key payload types and values are dataframes for each payload type showing the number of launches per payload mass range
-    payload_type_dataframes = mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(
-        dataset=dataset.launch,
+    # Wrapper
+    launches_vs_mass_by_filter(
+        chart_title_prefix=chart_title_prefix,
+        output_prefix=output_prefix,
+        chart_title_suffix='Payload Type',
+        output_suffix='general_launch_payload_type',
         filter_function=mda.Filters.filter_column_by_exact,
-        filter_function_parameters_list=general_launch_payload_types,
-        value_col='Payload_Mass',
-        bins=bins,
-        bin_labels=mass_labels,
-        filter_function_additional_parameter="General_Launch_Payload_Type"
-    )
-
-    # Create dictionary with columns that are the payload types and values are the mass ranges
-    output_df = mda.ChartUtils.combine_dictionary_of_dataframes(payload_type_dataframes)
-
-    # Save to CSV
-    mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
-
-    mda.ChartUtils.plot_bar(
-        output_df,
-        title=f'{chart_title_prefix} Launches vs. Payload Mass by Payload Type',
-        subtitle=f'Christopher Kalitin 2025 - Data Source: Jonathan McDowell - Data Cutoff: {dataset.date_updated}',
-        x_label=f'Payload Mass Range ({mass_suffix})',
-        y_label='Number of Launches',
-        output_path=f'examples/outputs/chart/{output_prefix}/{output_name}.png',
+        filter_function_parameters_list=['Starlink', 'Commercial', 'Chinese Commercial', 'Government', 'Eastern Government', 'Military', 'Eastern Military'],
+        filter_function_additional_parameter="General_Launch_Payload_Type",
+        mass_step_size_kg=mass_step_size_kg,
+        launch_vehicle_simplified_name=launch_vehicle_simplified_name,
+        launch_vehicle_family=launch_vehicle_family,
         color_map=mda.ChartUtils.general_launch_payload_type_color_map,
-        bargap=0.1,
+        mass_suffix=mass_suffix,
+        mass_divisor=mass_divisor,
+        filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
-def total_mass_vs_mass_by_general_launch_payload_type(mass_step_size_kg, chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, mass_suffix='t', mass_divisor=1000, filter_out_suborbital=True):
+def total_mass_vs_mass_by_general_launch_payload_type(mass_step_size_kg, chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, mass_suffix='t', mass_divisor=1000, filter_out_suborbital=True, dataset=None):
     """Generate a chart showing the distribution of total launched mass versus payload mass range by general launch payload type.
     Eg. How much total mass was launched in 2-3 tonnes range for Starlink, how much for Commercial, etc.
 
@@ -573,67 +565,29 @@ def total_mass_vs_mass_by_general_launch_payload_type(mass_step_size_kg, chart_t
         launch_vehicle_family (str, optional): Family of launch vehicle to filter by. If not none, then filtering will be done by family instead of the launch_vehicle field.
         mass_suffix (str, optional): Suffix for the mass labels (default is 't' for tonnes, use 'kg' if you want). Defaults to 't'.
         mass_divisor (int, optional): Divisor for the mass values in the chart (default is 1000 to convert kg to tonnes). Defaults to 1000.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
-    output_name = f"{output_prefix}_total_mass_vs_mass_by_general_launch_payload_type"
-
-    # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
-
-    # Filter for orbital and deep space launches
-    if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
-    if launch_vehicle_family is not None:
-        mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
-    else:
-        mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
-
-    mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
-    
-    max_mass = int(dataset.launch.df['Payload_Mass'].max())
-
-    # Define payload types and bins
-    general_launch_payload_types = ['Starlink', 'Commercial', 'Chinese Commercial', 'Government', 'Eastern Government', 'Military', 'Eastern Military']
-    bins = list(range(0, max_mass+mass_step_size_kg, mass_step_size_kg))
-    mass_labels = [f"{int(bins[i]/mass_divisor)}-{int(bins[i+1]/mass_divisor)}{mass_suffix}" for i in range(len(bins)-1)]
-
-    # Create a dictionary with key payload types and values are dataframes for each payload type showing the total mass per payload mass range
-    payload_type_dataframes = mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(
-        dataset=dataset.launch,
+    # Wrapper
+    total_mass_vs_mass_by_filter(
+        chart_title_prefix=chart_title_prefix,
+        output_prefix=output_prefix,
+        chart_title_suffix='Payload Type',
+        output_suffix='general_launch_payload_type',
         filter_function=mda.Filters.filter_column_by_exact,
-        filter_function_parameters_list=general_launch_payload_types,
-        value_col='Payload_Mass',
-        bins=bins,
-        bin_labels=mass_labels,
+        filter_function_parameters_list=['Starlink', 'Commercial', 'Chinese Commercial', 'Government', 'Eastern Government', 'Military', 'Eastern Military'],
         filter_function_additional_parameter="General_Launch_Payload_Type",
-        count_values=False,
-        bin_column='Mass_Range'
-    )
-
-    payload_type_masses = {}
-    for payload_type_key in payload_type_dataframes.keys():
-        total_mass = payload_type_dataframes[payload_type_key].groupby('Mass_Range', observed=False)['Payload_Mass'].sum()
-        total_mass = total_mass.reindex(mass_labels, fill_value=0)
-        payload_type_masses[payload_type_key] = total_mass/mass_divisor
-
-    output_df = mda.ChartUtils.combine_dictionary_of_dataframes(payload_type_masses)
-
-    # Save to CSV
-    mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
-
-    # Plot stacked bar chart
-    mda.ChartUtils.plot_bar(
-        output_df,
-        title=f'{chart_title_prefix} Net Payload Mass vs Mass Range by Payload Type',
-        subtitle=f'Christopher Kalitin 2025 - Data Source: Jonathan McDowell - Data Cutoff: {dataset.date_updated}',
-        x_label=f'Payload Mass Range ({mass_suffix})',
-        y_label=f'Total Payload Mass ({mass_suffix})',
-        output_path=f'examples/outputs/chart/{output_prefix}/{output_name}.png',
+        mass_step_size_kg=mass_step_size_kg,
+        launch_vehicle_simplified_name=launch_vehicle_simplified_name,
+        launch_vehicle_family=launch_vehicle_family,
         color_map=mda.ChartUtils.general_launch_payload_type_color_map,
-        bargap=0.1
+        mass_suffix=mass_suffix,
+        mass_divisor=mass_divisor,
+        filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
-def launches_vs_month_by_orbit(chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=12, start_year=None, end_year=None, filter_out_suborbital=True):
+def launches_vs_month_by_orbit(chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=12, start_year=None, end_year=None, filter_out_suborbital=True, dataset=None):
     """Generate a chart showing the number of launches by month by orbit.
 
     Args:
@@ -645,74 +599,30 @@ def launches_vs_month_by_orbit(chart_title_prefix, output_prefix, launch_vehicle
         x_tick_step_size (int, optional): Step size for x-axis ticks in months. Defaults to 12 (one year).
         start_year (int, optional): Start year for the data. By default it is the first year of the specified vehicle in the dataset.
         end_year (int, optional): End year for the data (inclusive). By default, the final year of the specified vehicle is used.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
-    # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
-
-    # Filter the base dataset
-    if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
-    if not all_vehicles:
-        if launch_vehicle_family is not None:
-            mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
-        else:
-            mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
-
-    if start_year == None:
-        start_year = dataset.launch.df['Launch_Date'].dt.year.min()
-    if end_year == None:
-        end_year = dataset.launch.df['Launch_Date'].dt.year.max()
-
-    date_end = "present" if end_year == datetime.now().year else  f"{end_year}"
-    output_name = f"{output_prefix}_launches_vs_month_by_orbit_{start_year}_{date_end}"
-
-    # After getting the start and end years, filter the dataset by launch date
-    mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
-    
-    # Encode launch month as year*12 + months to get total months since Jesus instead of years since Jesus
-    dataset.launch.df['Launch_Month'] = dataset.launch.df['Launch_Date'].dt.year*12 + dataset.launch.df['Launch_Date'].dt.month
-    
-    mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
-    
-    orbits = ['LEO', 'SSO', 'MEO', 'GTO', 'GEO', 'HEO', 'BEO']
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-    bin_labels = []
-    for year in range(start_year, end_year+1, 1):
-        for month in months:
-            bin_labels.append(f"{month} {year}")
-
-    # Create a dictionary with key orbits and values are dataframes for each orbit showing the number of launches per year
-    orbit_dataframes = mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(
-        dataset=dataset.launch,
+    # Wrapper
+    launches_vs_month_by_filter(
+        chart_title_prefix=chart_title_prefix,
+        output_prefix=output_prefix,
+        chart_title_suffix='Orbit',
+        output_suffix='orbit',
         filter_function=mda.Filters.filter_by_orbit,
-        filter_function_parameters_list=orbits,
-        value_col='Launch_Month',
-        bins=list(range(start_year*12, (end_year+1)*12+1)), # +1 year bc its exclusive, again +1 to align bins to months for some reason ugh pandas wtf investigate this future Chris
-        bin_labels=bin_labels,
-    )
-
-    # Combine dictionary of dataframes into a single dataframe (by column)
-    output_df = mda.ChartUtils.combine_dictionary_of_dataframes(orbit_dataframes)
-    
-    # Save to CSV
-    mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
-
-    mda.ChartUtils.plot_bar(
-        output_df,
-        title=f'{chart_title_prefix} Launches vs. Month by Orbit',
-        subtitle=f'Christopher Kalitin 2025 - Data Source: Jonathan McDowell - Data Cutoff: {dataset.date_updated}',
-        x_label='Date',
-        y_label='Number of Launches',
-        output_path=f'examples/outputs/chart/{output_prefix}/{output_name}.png',
+        filter_function_parameters_list=['LEO', 'SSO', 'MEO', 'GTO', 'GEO', 'HEO', 'BEO'],
+        filter_function_additional_parameter=None,
+        launch_vehicle_simplified_name=launch_vehicle_simplified_name,
+        launch_vehicle_family=launch_vehicle_family,
+        all_vehicles=all_vehicles,
+        x_tick_step_size=x_tick_step_size,
         color_map=mda.ChartUtils.orbit_color_map,
-        bargap=0.0,
-        x_tick0=0,
-        x_tick_step_size=x_tick_step_size
+        start_year=start_year,
+        end_year=end_year,
+        filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
-    
-def launches_vs_month_by_general_launch_payload_type(chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=12, start_year=None, end_year=None, filter_out_suborbital=True):
+
+def launches_vs_month_by_general_launch_payload_type(chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=12, start_year=None, end_year=None, filter_out_suborbital=True, dataset=None):
     """Generate a chart showing the number of launches by month by general launch payload type.
 
     Args:
@@ -724,75 +634,30 @@ def launches_vs_month_by_general_launch_payload_type(chart_title_prefix, output_
         x_tick_step_size (int, optional): Step size for x-axis ticks in months. Defaults to 12 (one year).
         start_year (int, optional): Start year for the data. By default it is the first year of the specified vehicle in the dataset.
         end_year (int, optional): End year for the data (inclusive). By default, the final year of the specified vehicle is used.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
-    # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
-
-    # Filter the base dataset
-    if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
-    if not all_vehicles:
-        if launch_vehicle_family is not None:
-            mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
-        else:
-            mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
-
-    if start_year == None:
-        start_year = dataset.launch.df['Launch_Date'].dt.year.min()
-    if end_year == None:
-        end_year = dataset.launch.df['Launch_Date'].dt.year.max()
-
-    date_end = "present" if end_year == datetime.now().year else  f"{end_year}"
-    output_name = f"{output_prefix}_launches_vs_month_by_general_launch_payload_type_{start_year}_{date_end}"
-
-    # After getting the start and end years, filter the dataset by launch date
-    mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
-    
-    # Encode launch month as year*12 + months to get total months since Jesus instead of years since Jesus
-    dataset.launch.df['Launch_Month'] = dataset.launch.df['Launch_Date'].dt.year*12 + dataset.launch.df['Launch_Date'].dt.month
-    
-    mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
-    
-    general_launch_payload_Types = ['Starlink', 'Commercial', 'Chinese Commercial', 'Government', 'Eastern Government', 'Military', 'Eastern Military']
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-    bin_labels = []
-    for year in range(start_year, end_year+1, 1):
-        for month in months:
-            bin_labels.append(f"{month} {year}")
-    
-    # Create a dictionary with key orbits and values are dataframes for each orbit showing the number of launches per year
-    orbit_dataframes = mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(
-        dataset=dataset.launch,
+    # Wrapper
+    launches_vs_month_by_filter(
+        chart_title_prefix=chart_title_prefix,
+        output_prefix=output_prefix,
+        chart_title_suffix='Payload Type',
+        output_suffix='general_launch_payload_type',
         filter_function=mda.Filters.filter_column_by_contains,
-        filter_function_parameters_list=general_launch_payload_Types,
-        value_col='Launch_Month',
-        bins=list(range(start_year*12, (end_year+1)*12+1)), # +1 year bc its exclusive, again +1 to align bins to months for some reason ugh pandas wtf investigate this future Chris
-        bin_labels=bin_labels,
-        filter_function_additional_parameter="General_Launch_Payload_Type"
-    )
-    
-    # Combine dictionary of dataframes into a single dataframe (by column)
-    output_df = mda.ChartUtils.combine_dictionary_of_dataframes(orbit_dataframes)
-    
-    # Save to CSV
-    mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
-    
-    mda.ChartUtils.plot_bar(
-        output_df,
-        title=f'{chart_title_prefix} Launches vs. Month by Payload Type',
-        subtitle=f'Christopher Kalitin 2025 - Data Source: Jonathan McDowell - Data Cutoff: {dataset.date_updated}',
-        x_label='Date',
-        y_label='Number of Launches',
-        output_path=f'examples/outputs/chart/{output_prefix}/{output_name}.png',
+        filter_function_parameters_list=['Starlink', 'Commercial', 'Chinese Commercial', 'Government', 'Eastern Government', 'Military', 'Eastern Military'],
+        filter_function_additional_parameter="General_Launch_Payload_Type",
+        launch_vehicle_simplified_name=launch_vehicle_simplified_name,
+        launch_vehicle_family=launch_vehicle_family,
+        all_vehicles=all_vehicles,
+        x_tick_step_size=x_tick_step_size,
         color_map=mda.ChartUtils.general_launch_payload_type_color_map,
-        bargap=0.0,
-        x_tick0=0,
-        x_tick_step_size=x_tick_step_size
+        start_year=start_year,
+        end_year=end_year,
+        filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
-    
-def launches_vs_month_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=12, color_map=None, start_year=None, end_year=None, filter_out_suborbital=True):
+
+def launches_vs_month_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=12, color_map=None, start_year=None, end_year=None, filter_out_suborbital=True, dataset=None):
     """Generate a chart showing the number of launches by month by a specified filter function.
 
     Args:
@@ -809,61 +674,67 @@ def launches_vs_month_by_filter(chart_title_prefix, output_prefix, chart_title_s
         x_tick_step_size (int, optional): Step size for x-axis ticks in months. Defaults to 12 (one year).
         start_year (int, optional): Start year for the data. By default it is the first year of the specified vehicle in the dataset.
         end_year (int, optional): End year for the data (inclusive). By default, the final year of the specified vehicle is used.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
+    dataset = mda.DatasetSession.view(dataset)
 
-    # Filter the base dataset
-    if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
-    if not all_vehicles:
-        if launch_vehicle_family is not None:
-            mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
-        else:
-            mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
+    # Precomputed counts if the dataset has a launch cube with every column the filters need (see LaunchCube), otherwise None
+    cube = mda.LaunchCube.for_dataset(dataset)
+    cube_result = cube.launches_vs_period("month", filter_function, filter_function_parameters_list, filter_function_additional_parameter, launch_vehicle_simplified_name, launch_vehicle_family, all_vehicles, start_year, end_year, filter_out_suborbital) if cube is not None else None
 
-    if start_year == None:
-        start_year = dataset.launch.df['Launch_Date'].dt.year.min()
-    if end_year == None:
-        end_year = dataset.launch.df['Launch_Date'].dt.year.max()
+    if cube_result is not None:
+        output_df, start_year, end_year = cube_result
+    else:
+        # Filter the base dataset
+        if filter_out_suborbital:
+            dataset.launch = mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
+        if not all_vehicles:
+            if launch_vehicle_family is not None:
+                dataset.launch = mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
+            else:
+                dataset.launch = mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
+
+        if start_year == None:
+            start_year = dataset.launch.df['Launch_Date'].dt.year.min()
+        if end_year == None:
+            end_year = dataset.launch.df['Launch_Date'].dt.year.max()
+
+        # After getting the start and end years, filter the dataset by launch date
+        dataset.launch = mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
+        
+        # Encode launch month as year*12 + months to get total months since Jesus instead of years since Jesus
+        dataset.launch.df['Launch_Month'] = dataset.launch.df['Launch_Date'].dt.year*12 + dataset.launch.df['Launch_Date'].dt.month
+        
+        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+        bin_labels = []
+        for year in range(start_year, end_year+1, 1):
+            for month in months:
+                bin_labels.append(f"{month} {year}")
+
+        # Dataframe with a column for each filter parameter (eg. orbit) and a row for each month, the number of launches in each
+        output_df = mda.ChartUtils.bin_dataset_into_matrix_by_filter_function(
+            dataset=dataset.launch,
+            filter_function=filter_function,
+            filter_function_parameters_list=filter_function_parameters_list,
+            value_col='Launch_Month',
+            bins=list(range(start_year*12, (end_year+1)*12+1)),
+            bin_labels=bin_labels,
+            filter_function_additional_parameter=filter_function_additional_parameter,
+        )
+
+    # remove columns with all zeroes, so that launch pad filtering doesn't include literally all pads ever
+    if filter_function == mda.Filters.filter_by_launch_pad_raw:
+        output_df = output_df.loc[:, output_df.sum() > 0]
 
     date_end = "present" if end_year == datetime.now().year else  f"{end_year}"
     output_name = f"{output_prefix}_launches_vs_month_by_{output_suffix}_{start_year}_{date_end}"
 
-    # After getting the start and end years, filter the dataset by launch date
-    mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
-    
-    # Encode launch month as year*12 + months to get total months since Jesus instead of years since Jesus
-    dataset.launch.df['Launch_Month'] = dataset.launch.df['Launch_Date'].dt.year*12 + dataset.launch.df['Launch_Date'].dt.month
-    
-    mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
-    
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-    bin_labels = []
-    for year in range(start_year, end_year+1, 1):
-        for month in months:
-            bin_labels.append(f"{month} {year}")
-
-    # Create a dictionary with key filters and values are dataframes for each filter showing the number of launches per month
-    dataframes = mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(
-        dataset=dataset.launch,
-        filter_function=filter_function,
-        filter_function_parameters_list=filter_function_parameters_list,
-        value_col='Launch_Month',
-        bins=list(range(start_year*12, (end_year+1)*12+1)),
-        bin_labels=bin_labels,
-        filter_function_additional_parameter=filter_function_additional_parameter,
-    )
-
-
-    # remove dataframes with no data or all zeroes, so that launch pad filtering doesn't include literally all pads ever
-    if filter_function == mda.Filters.filter_by_launch_pad_raw:
-        dataframes = {key: df for key, df in dataframes.items() if not df.empty and df.sum().sum() > 0}
-
-    # Combine dictionary of dataframes into a single dataframe (by column)
-    output_df = mda.ChartUtils.combine_dictionary_of_dataframes(dataframes)
+    # The raw dataframe only exists if the chart wasn't answered from the launch cube
+    if cube_result is None:
+        mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
     
     # Save to CSV
     mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
@@ -881,7 +752,7 @@ def launches_vs_month_by_filter(chart_title_prefix, output_prefix, chart_title_s
         x_tick_step_size=x_tick_step_size
     )
     
-def launches_vs_year_by_orbit(chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=1, start_year=None, end_year=None, filter_out_suborbital=True):
+def launches_vs_year_by_orbit(chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=1, start_year=None, end_year=None, filter_out_suborbital=True, dataset=None):
     """Generate a chart showing the number of launches by year by orbit.
 
     Args:
@@ -893,68 +764,30 @@ def launches_vs_year_by_orbit(chart_title_prefix, output_prefix, launch_vehicle_
         x_tick_step_size (int, optional): Step size for x-axis ticks in years. Defaults to 1 (one year).
         start_year (int, optional): Start year for the data. By default it is the first year of the specified vehicle in the dataset.
         end_year (int, optional): End year for the data (inclusive). By default, the final year of the specified vehicle is used.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
-    # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
-
-    # Filter the base dataset
-    if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
-    if not all_vehicles:
-        if launch_vehicle_family is not None:
-            mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
-        else:
-            mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
-
-    if start_year == None:
-        start_year = dataset.launch.df['Launch_Date'].dt.year.min()
-    if end_year == None:
-        end_year = dataset.launch.df['Launch_Date'].dt.year.max()
-
-    date_end = "present" if end_year == datetime.now().year else  f"{end_year}"
-    output_name = f"{output_prefix}_launches_vs_year_by_orbit_{start_year}_{date_end}"
-
-    # After getting the start and end years, filter the dataset by launch date
-    mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
-    
-    # Encode launch month as year*12 + months to get total months since Jesus instead of years since Jesus
-    dataset.launch.df['Launch_Year'] = dataset.launch.df['Launch_Date'].dt.year
-    
-    mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
-    
-    orbits = ['LEO', 'SSO', 'MEO', 'GTO', 'GEO', 'HEO', 'BEO']
-
-    # Create a dictionary with key orbits and values are dataframes for each orbit showing the number of launches per year
-    orbit_dataframes = mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(
-        dataset=dataset.launch,
+    # Wrapper
+    launches_vs_year_by_filter(
+        chart_title_prefix=chart_title_prefix,
+        output_prefix=output_prefix,
+        chart_title_suffix='Orbit',
+        output_suffix='orbit',
         filter_function=mda.Filters.filter_by_orbit,
-        filter_function_parameters_list=orbits,
-        value_col='Launch_Year',
-        bins=list(range(start_year-1, end_year+1)), # +1 year bc its exclusive
-        bin_labels=list(range(start_year, end_year+1)),
-        count_values=True
-    )
-    
-    # Combine dictionary of dataframes into a single dataframe (by column)
-    output_df = mda.ChartUtils.combine_dictionary_of_dataframes(orbit_dataframes)
-    
-    # Save to CSV
-    mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
-    
-    mda.ChartUtils.plot_bar(
-        output_df,
-        title=f'{chart_title_prefix} Launches vs. Year by Orbit',
-        subtitle=f'Christopher Kalitin 2025 - Data Source: Jonathan McDowell - Data Cutoff: {dataset.date_updated}',
-        x_label='Year',
-        y_label='Number of Launches',
-        output_path=f'examples/outputs/chart/{output_prefix}/{output_name}.png',
+        filter_function_parameters_list=['LEO', 'SSO', 'MEO', 'GTO', 'GEO', 'HEO', 'BEO'],
+        filter_function_additional_parameter=None,
+        launch_vehicle_simplified_name=launch_vehicle_simplified_name,
+        launch_vehicle_family=launch_vehicle_family,
+        all_vehicles=all_vehicles,
+        x_tick_step_size=x_tick_step_size,
         color_map=mda.ChartUtils.orbit_color_map,
-        bargap=0.1,
-        x_tick_step_size=x_tick_step_size
+        start_year=start_year,
+        end_year=end_year,
+        filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
-def launches_vs_year_by_general_launch_payload_type(chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=1, start_year=None, end_year=None, filter_out_suborbital=True):
+def launches_vs_year_by_general_launch_payload_type(chart_title_prefix, output_prefix, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=1, start_year=None, end_year=None, filter_out_suborbital=True, dataset=None):
     """Generate a chart showing the number of launches by year by general launch payload type.
 
     Args:
@@ -966,69 +799,30 @@ def launches_vs_year_by_general_launch_payload_type(chart_title_prefix, output_p
         x_tick_step_size (int, optional): Step size for x-axis ticks in years. Defaults to 1 (one year).
         start_year (int, optional): Start year for the data. By default it is the first year of the specified vehicle in the dataset.
         end_year (int, optional): End year for the data (inclusive). By default, the final year of the specified vehicle is used.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
-    # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
-
-    # Filter the base dataset
-    if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
-    if not all_vehicles:
-        if launch_vehicle_family is not None:
-            mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
-        else:
-            mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
-
-    if start_year == None:
-        start_year = dataset.launch.df['Launch_Date'].dt.year.min()
-    if end_year == None:
-        end_year = dataset.launch.df['Launch_Date'].dt.year.max()
-
-    date_end = "present" if end_year == datetime.now().year else  f"{end_year}"
-    output_name = f"{output_prefix}_launches_vs_year_by_general_launch_payload_type_{start_year}_{date_end}"
-
-    # After getting the start and end years, filter the dataset by launch date
-    mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
-    
-    # Encode launch month as year*12 + months to get total months since Jesus instead of years since Jesus
-    dataset.launch.df['Launch_Year'] = dataset.launch.df['Launch_Date'].dt.year
-    
-    mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
-    
-    general_launch_payload_Types = ['Starlink', 'Commercial', 'Chinese Commercial', 'Government', 'Eastern Government', 'Military', 'Eastern Military']
-
-    # Create a dictionary with key orbits and values are dataframes for each orbit showing the number of launches per year
-    orbit_dataframes = mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(
-        dataset=dataset.launch,
+    # Wrapper
+    launches_vs_year_by_filter(
+        chart_title_prefix=chart_title_prefix,
+        output_prefix=output_prefix,
+        chart_title_suffix='Payload Type',
+        output_suffix='general_launch_payload_type',
         filter_function=mda.Filters.filter_column_by_exact,
-        filter_function_parameters_list=general_launch_payload_Types,
-        value_col='Launch_Year',
-        bins=list(range(start_year-1, end_year+1)), # +1 year bc its exclusive
-        bin_labels=list(range(start_year, end_year+1)),
+        filter_function_parameters_list=['Starlink', 'Commercial', 'Chinese Commercial', 'Government', 'Eastern Government', 'Military', 'Eastern Military'],
         filter_function_additional_parameter="General_Launch_Payload_Type",
-        count_values=True
-    )
-    
-    # Combine dictionary of dataframes into a single dataframe (by column)
-    output_df = mda.ChartUtils.combine_dictionary_of_dataframes(orbit_dataframes)
-    
-    # Save to CSV
-    mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
-    
-    mda.ChartUtils.plot_bar(
-        output_df,
-        title=f'{chart_title_prefix} Launches vs. Year by Payload Type',
-        subtitle=f'Christopher Kalitin 2025 - Data Source: Jonathan McDowell - Data Cutoff: {dataset.date_updated}',
-        x_label='Year',
-        y_label='Number of Launches',
-        output_path=f'examples/outputs/chart/{output_prefix}/{output_name}.png',
+        launch_vehicle_simplified_name=launch_vehicle_simplified_name,
+        launch_vehicle_family=launch_vehicle_family,
+        all_vehicles=all_vehicles,
+        x_tick_step_size=x_tick_step_size,
         color_map=mda.ChartUtils.general_launch_payload_type_color_map,
-        bargap=0.1,
-        x_tick_step_size=x_tick_step_size
+        start_year=start_year,
+        end_year=end_year,
+        filter_out_suborbital=filter_out_suborbital,
+        dataset=dataset,
     )
 
-def launches_vs_year_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=1, color_map=None, start_year=None, end_year=None, filter_out_suborbital=True):
+def launches_vs_year_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, launch_vehicle_simplified_name=None, launch_vehicle_family=None, all_vehicles=False, x_tick_step_size=1, color_map=None, start_year=None, end_year=None, filter_out_suborbital=True, dataset=None):
     """Generate a chart showing the number of launches by year by a specified filter function.
 
     Args:
@@ -1043,51 +837,59 @@ def launches_vs_year_by_filter(chart_title_prefix, output_prefix, chart_title_su
         start_year (int, optional): Start year for the data. By default it is the first year of the specified vehicle in the dataset.
         end_year (int, optional): End year for the data (inclusive). By default, the final year of the specified vehicle is used.
         filter_out_suborbital (bool, optional): If True, will filter out suborbital launches. Defaults to True.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
+    dataset = mda.DatasetSession.view(dataset)
 
-    # Filter the base dataset
-    if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
-    if all_vehicles == False:
-        if launch_vehicle_family is not None:
-            mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
-        else:
-            mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
+    # Precomputed counts if the dataset has a launch cube with every column the filters need (see LaunchCube), otherwise None
+    cube = mda.LaunchCube.for_dataset(dataset)
+    cube_result = cube.launches_vs_period("year", filter_function, filter_function_parameters_list, filter_function_additional_parameter, launch_vehicle_simplified_name, launch_vehicle_family, all_vehicles, start_year, end_year, filter_out_suborbital) if cube is not None else None
 
-    if start_year is None:
-        start_year = dataset.launch.df['Launch_Date'].dt.year.min()
-    if end_year is None:
-        end_year = dataset.launch.df['Launch_Date'].dt.year.max()
+    if cube_result is not None:
+        output_df, start_year, end_year = cube_result
+    else:
+        # Filter the base dataset
+        if filter_out_suborbital:
+            dataset.launch = mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
+        if all_vehicles == False:
+            if launch_vehicle_family is not None:
+                dataset.launch = mda.Filters.filter_by_launch_vehicle_family(dataset.launch, launch_vehicle_family)
+            else:
+                dataset.launch = mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.launch, launch_vehicle_simplified_name)
+
+        if start_year is None:
+            start_year = dataset.launch.df['Launch_Date'].dt.year.min()
+        if end_year is None:
+            end_year = dataset.launch.df['Launch_Date'].dt.year.max()
+
+        # After getting the start and end years, filter the dataset by launch date
+        dataset.launch = mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
+
+        dataset.launch.df['Launch_Year'] = dataset.launch.df['Launch_Date'].dt.year
+
+        # Dataframe with a column for each filter parameter (eg. orbit) and a row for each year, the number of launches in each
+        output_df = mda.ChartUtils.bin_dataset_into_matrix_by_filter_function(
+            dataset=dataset.launch,
+            filter_function=filter_function,
+            filter_function_parameters_list=filter_function_parameters_list,
+            value_col='Launch_Year',
+            bins=list(range(start_year-1, end_year+1)),
+            bin_labels=list(range(start_year, end_year+1)),
+            filter_function_additional_parameter=filter_function_additional_parameter
+        )
+
+    # remove columns with all zeroes, so that launch pad filtering doesn't include literally all pads ever
+    if filter_function == mda.Filters.filter_by_launch_pad_raw:
+        output_df = output_df.loc[:, output_df.sum() > 0]
 
     date_end = "present" if end_year == datetime.now().year else  f"{end_year}"
     output_name = f"{output_prefix}_launches_vs_year_by_{output_suffix}_{start_year}_{date_end}"
 
-    # After getting the start and end years, filter the dataset by launch date
-    mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
-
-    dataset.launch.df['Launch_Year'] = dataset.launch.df['Launch_Date'].dt.year
-
-    mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
-
-    dataframes = mda.ChartUtils.bin_dataset_into_dictionary_by_filter_function(
-        dataset=dataset.launch,
-        filter_function=filter_function,
-        filter_function_parameters_list=filter_function_parameters_list,
-        value_col='Launch_Year',
-        bins=list(range(start_year-1, end_year+1)),
-        bin_labels=list(range(start_year, end_year+1)),
-        count_values=True,
-        filter_function_additional_parameter=filter_function_additional_parameter
-    )
-
-    # remove dataframes with no data or all zeroes, so that launch pad filtering doesn't include literally all pads ever
-    if filter_function == mda.Filters.filter_by_launch_pad_raw:
-        dataframes = {key: df for key, df in dataframes.items() if not df.empty and df.sum().sum() > 0}
-
-    output_df = mda.ChartUtils.combine_dictionary_of_dataframes(dataframes)
+    # The raw dataframe only exists if the chart wasn't answered from the launch cube
+    if cube_result is None:
+        mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
 
     # Save to CSV
     mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
@@ -1104,7 +906,7 @@ def launches_vs_year_by_filter(chart_title_prefix, output_prefix, chart_title_su
         x_tick_step_size=x_tick_step_size,
     )
 
-def owner_payloads_vs_year_by_program(chart_title_prefix, output_prefix, owners_list, color_map=None, programing_simplification_dict=None, program_order=None):
+def owner_payloads_vs_year_by_program(chart_title_prefix, output_prefix, owners_list, color_map=None, programing_simplification_dict=None, program_order=None, dataset=None):
     """Generate a chart showing the number of payloads by year by program for specified owners.
 
     Args:
@@ -1113,13 +915,14 @@ def owner_payloads_vs_year_by_program(chart_title_prefix, output_prefix, owners_
         owners (list): List of owners to filter by
         programing_simplification_dict (dict, optional): Dictionary to simplify program names. ("New name": ["Old names", "another old name"]). MultiplDefaults to None.
         color_map (dict, optional): Color map for the programs. Dict or List. Defaults to None.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
+    dataset = mda.DatasetSession.view(dataset)
 
     # Filter the base dataset for set owners
-    mda.Filters.filter_column_by_exact(dataset.satcat, owners_list, "Owner")
+    dataset.satcat = mda.Filters.filter_column_by_exact(dataset.satcat, owners_list, "Owner")
 
     output_name = f"{output_prefix}_payloads_vs_year_by_program"
 
@@ -1170,7 +973,7 @@ def owner_payloads_vs_year_by_program(chart_title_prefix, output_prefix, owners_
         color_map=color_map,
     )
 
-def owner_payloads_vs_year_by_category(chart_title_prefix, output_prefix, owners_list, category, color_map=None):
+def owner_payloads_vs_year_by_category(chart_title_prefix, output_prefix, owners_list, category, color_map=None, dataset=None):
     """Generate a chart showing the number of payloads by year by a specified category (eg. country, launch vehicle, etc.) for specified owners.
 
     Categories:
@@ -1184,6 +987,7 @@ def owner_payloads_vs_year_by_category(chart_title_prefix, output_prefix, owners
         owners_list (list): List of owners to filter by
         category (str): Category to filter by. Eg. "Launch Country", "Launch Vehicle", or "Orbit".
         color_map (dict, optional): Color map for the countries. Dict or List. Defaults to None.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     category_to_column = {
@@ -1194,10 +998,10 @@ def owner_payloads_vs_year_by_category(chart_title_prefix, output_prefix, owners
     
     category_filter_column = category_to_column[category]
     
-    dataset = mda.McdowellDataset("./datasets")
+    dataset = mda.DatasetSession.view(dataset)
 
     # Filter the base dataset for set owners
-    mda.Filters.filter_column_by_exact(dataset.satcat, owners_list, "Owner")
+    dataset.satcat = mda.Filters.filter_column_by_exact(dataset.satcat, owners_list, "Owner")
 
     output_name = f"{output_prefix}_payloads_vs_year_by_{str.lower(category).strip().replace(" ", "_")}"
 
@@ -1234,7 +1038,7 @@ def owner_payloads_vs_year_by_category(chart_title_prefix, output_prefix, owners
         color_map=color_map,
     )
 
-def launch_value_vs_date_by_filter_scatter(chart_title_prefix, output_prefix, value_column, series_column, filter_function, filter_function_parameter, filter_function_additional_parameter=None, x_axis_title_suffix="", value_title=None, series_title=None, color_map=None, x_tick_step_size=None, start_year=None, end_year=None, y_scaling_factor=1, x_axis_type=None, filter_out_suborbital=True):
+def launch_value_vs_date_by_filter_scatter(chart_title_prefix, output_prefix, value_column, series_column, filter_function, filter_function_parameter, filter_function_additional_parameter=None, x_axis_title_suffix="", value_title=None, series_title=None, color_map=None, x_tick_step_size=None, start_year=None, end_year=None, y_scaling_factor=1, x_axis_type=None, filter_out_suborbital=True, dataset=None):
     """
     Plot launches per date with a specified value column (e.g., Apogee, Mass, etc.) and series column (e.g., Launch Pad, Launch Vehicle, etc.) by filtering the dataset with a filter function.
 
@@ -1258,19 +1062,17 @@ def launch_value_vs_date_by_filter_scatter(chart_title_prefix, output_prefix, va
         y_scaling_factor (float, optional): Scaling factor for y-axis values (e.g., 0.001 to convert kg to tonnes). Defaults to 1.
         x_axis_type (str, optional): Type of x-axis ('date' for date formatting, None for linear). Defaults to None.
         filter_out_suborbital (bool, optional): If True, filters out suborbital launches. Defaults to True.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
         
     Interesting note:
     Because we're using raw dates and not a launch date field or something, we can't set x tick step size and get anything that makes sense. It's not a continuous dx in the dataset since some launches are hours apart and some are months.
     """
     
-    dataset = mda.McdowellDataset()
+    dataset = mda.DatasetSession.view(dataset)
     
     if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
-    if filter_function_additional_parameter is not None:
-        filter_function(dataset.launch, filter_function_parameter, filter_function_additional_parameter)
-    else:
-        filter_function(dataset.launch, filter_function_parameter)
+        dataset.launch = mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
+    dataset.launch = mda.ChartUtils.apply_filter_function(dataset.launch, filter_function, filter_function_parameter, filter_function_additional_parameter)
     
     if start_year == None:
         start_year = dataset.launch.df['Launch_Date'].dt.year.min()
@@ -1280,7 +1082,7 @@ def launch_value_vs_date_by_filter_scatter(chart_title_prefix, output_prefix, va
     date_end = "present" if end_year == datetime.now().year else  f"{end_year}"
     output_name = f"{output_prefix}_launches_{value_column.lower()}_vs_date_by_{series_column.lower()}_{start_year}_{date_end}"
     
-    mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31') # After getting the start and end years, filter the dataset by launch date
+    dataset.launch = mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31') # After getting the start and end years, filter the dataset by launch date
     filtered_df = dataset.launch.df
 
     mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, filtered_df)
@@ -1321,7 +1123,7 @@ def launch_value_vs_date_by_filter_scatter(chart_title_prefix, output_prefix, va
         x_axis_type=x_axis_type
     )
     
-def launch_apogee_vs_inclination_by_filter_scatter(chart_title_prefix, output_prefix, series_column, filter_function, filter_function_parameter, filter_function_additional_parameter=None, series_title=None, color_map=None, start_year=None, end_year=None, filter_out_suborbital=True):
+def launch_apogee_vs_inclination_by_filter_scatter(chart_title_prefix, output_prefix, series_column, filter_function, filter_function_parameter, filter_function_additional_parameter=None, series_title=None, color_map=None, start_year=None, end_year=None, filter_out_suborbital=True, dataset=None):
     """
     Plot launches per date with Apogee vs Inclination by filtering the dataset with a filter function.
 
@@ -1334,17 +1136,15 @@ def launch_apogee_vs_inclination_by_filter_scatter(chart_title_prefix, output_pr
         y_scaling_factor (int, optional): Scaling factor for the y-axis values. Defaults to 1.
         start_year (int, optional): Start year for the data. Defaults to None (uses earliest year in dataset).
         end_year (int, optional): End year for the data. Defaults to None (uses latest year in dataset).
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     # Initialize dataset
-    dataset = mda.McdowellDataset()
+    dataset = mda.DatasetSession.view(dataset)
 
     if filter_out_suborbital:
-        mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
-    if filter_function_additional_parameter is not None:
-        filter_function(dataset.launch, filter_function_parameter, filter_function_additional_parameter)
-    else:
-        filter_function(dataset.launch, filter_function_parameter)
+        dataset.launch = mda.Filters.filter_by_launch_category(dataset.launch, ['O', 'D'])
+    dataset.launch = mda.ChartUtils.apply_filter_function(dataset.launch, filter_function, filter_function_parameter, filter_function_additional_parameter)
     
     if start_year == None:
         start_year = dataset.launch.df['Launch_Date'].dt.year.min()
@@ -1354,7 +1154,7 @@ def launch_apogee_vs_inclination_by_filter_scatter(chart_title_prefix, output_pr
     date_end = "present" if end_year == datetime.now().year else  f"{end_year}"
     output_name = f"{output_prefix}_launches_apogee_vs_inc_by_{series_column.lower()}_{start_year}_{date_end}"
     
-    mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31') # After getting the start and end years, filter the dataset by launch date
+    dataset.launch = mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31') # After getting the start and end years, filter the dataset by launch date
     filtered_df = dataset.launch.df
     
     filtered_df = filtered_df[filtered_df['Apogee'] != 0] # Remove 0 values
@@ -1390,7 +1190,7 @@ def launch_apogee_vs_inclination_by_filter_scatter(chart_title_prefix, output_pr
         color_map=color_map,
     )
 
-def payloads_filtered_vs_year_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, initial_filter_functions, initial_filter_function_parameters_list, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, initial_filter_function_additional_parameters=[None], x_tick_step_size=1, color_map=None, start_year=None, end_year=None):
+def payloads_filtered_vs_year_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, initial_filter_functions, initial_filter_function_parameters_list, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, initial_filter_function_additional_parameters=[None], x_tick_step_size=1, color_map=None, start_year=None, end_year=None, dataset=None):
     """Generate a chart showing the number of payloads of a particular filter (eg. filter by simple payload category for earth observation) by year, filtered by a specified filter function.
     
     Args:
@@ -1405,16 +1205,14 @@ def payloads_filtered_vs_year_by_filter(chart_title_prefix, output_prefix, chart
         x_tick_step_size (int, optional): Step size for x-axis ticks in years. Defaults to 1 (one year).
         start_year (int, optional): Start year for the data. By default it is the first year of the specified filter in the dataset.
         end_year (int, optional): End year for the data (inclusive). By default, the final year of the specified filter is used.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
-    dataset = mda.McdowellDataset("./datasets")
+    dataset = mda.DatasetSession.view(dataset)
     
     # Apply initial filters
     for initial_filter_function, initial_filter_parameter, initial_additional_parameter in zip(initial_filter_functions, initial_filter_function_parameters_list, initial_filter_function_additional_parameters):
-        if initial_additional_parameter is not None:
-            initial_filter_function(dataset.satcat, initial_filter_parameter, initial_additional_parameter)
-        else:
-            initial_filter_function(dataset.satcat, initial_filter_parameter)
+        dataset.satcat = mda.ChartUtils.apply_filter_function(dataset.satcat, initial_filter_function, initial_filter_parameter, initial_additional_parameter)
             
     if start_year == None:
         start_year = dataset.satcat.df['Launch_Date'].dt.year.min()
@@ -1425,7 +1223,7 @@ def payloads_filtered_vs_year_by_filter(chart_title_prefix, output_prefix, chart
     output_name = f"{output_prefix}_payloads_vs_year_by_{output_suffix}_{start_year}_{date_end}"
 
     # After getting the start and end years, filter the dataset by launch date
-    mda.Filters.filter_by_launch_date(dataset.satcat, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
+    dataset.satcat = mda.Filters.filter_by_launch_date(dataset.satcat, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
     
     dataset.satcat.df['Launch_Year'] = dataset.satcat.df['Launch_Date'].dt.year
     filtered_df = dataset.satcat.df
@@ -1459,7 +1257,7 @@ def payloads_filtered_vs_year_by_filter(chart_title_prefix, output_prefix, chart
         color_map=color_map,
     )
 
-def payloads_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, mass_step_size_kg=1000, launch_vehicle_simplified_name=None, launch_vehicle_family=None, color_map=None, mass_suffix='t', mass_divisor=100, filter_out_suborbital=True, country=None, max_mass=None):
+def payloads_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_suffix, output_suffix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, mass_step_size_kg=1000, launch_vehicle_simplified_name=None, launch_vehicle_family=None, color_map=None, mass_suffix='t', mass_divisor=100, filter_out_suborbital=True, country=None, max_mass=None, dataset=None):
     """Generate a chart showing the number of payloads by payload mass range by a given filter function (eg. launch vehicle, launch category, etc.).
     Eg. How many payloads were 2-3 tonnes and LEO, how many 6-7 tonnes and GTO, etc.
 
@@ -1474,20 +1272,21 @@ def payloads_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_su
         launch_vehicle_family (str, optional): Family of launch vehicle to filter by. If not none, then filtering will be done by family instead of the launch_vehicle field.
         mass_suffix (str, optional): Suffix for the mass labels (default is 't' for tonnes, use 'kg' if you want). Defaults to 't'.
         mass_divisor (int, optional): Divisor for the mass values in the chart (default is 1000 to convert kg to tonnes). Defaults to 1000.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
     output_name = f"{output_prefix}_payloads_vs_mass_by_{output_suffix}"
 
     # Initialize dataset
-    dataset = mda.McdowellDataset("./datasets")
+    dataset = mda.DatasetSession.view(dataset)
 
-    mda.Filters.filter_by_sat_type_coarse(dataset.satcat, 'P')
+    dataset.satcat = mda.Filters.filter_by_sat_type_coarse(dataset.satcat, 'P')
     if launch_vehicle_family is not None:
-        mda.Filters.filter_by_launch_vehicle_family(dataset.satcat, launch_vehicle_family)
+        dataset.satcat = mda.Filters.filter_by_launch_vehicle_family(dataset.satcat, launch_vehicle_family)
     if launch_vehicle_simplified_name is not None:
-        mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.satcat, launch_vehicle_simplified_name)
+        dataset.satcat = mda.Filters.filter_by_launch_vehicle_name_simplified(dataset.satcat, launch_vehicle_simplified_name)
     if country is not None:
-        mda.Filters.filter_by_country(dataset.satcat, country)
+        dataset.satcat = mda.Filters.filter_by_country(dataset.satcat, country)
 
     mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.satcat.df)
     
@@ -1526,7 +1325,7 @@ def payloads_vs_mass_by_filter(chart_title_prefix, output_prefix, chart_title_su
         bargap=0.1,
     )
     
-def cumulative_payloads_by_filter_vs_date_since_first_payload(chart_title_prefix, output_prefix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, series_names=None, color_map=None, start_year=None, end_year=None, date_column='Launch_Date', y_axis_type='linear', line_width=2, max_cumulative_payloads=None, max_days_since_first=None):
+def cumulative_payloads_by_filter_vs_date_since_first_payload(chart_title_prefix, output_prefix, filter_function, filter_function_parameters_list, filter_function_additional_parameter=None, series_names=None, color_map=None, start_year=None, end_year=None, date_column='Launch_Date', y_axis_type='linear', line_width=2, max_cumulative_payloads=None, max_days_since_first=None, max_points=None, dataset=None):
     """
     Plot cumulative payloads by filter vs date since first payload, with option for multiple series (e.g., OneWeb, Starlink).
     
@@ -1547,9 +1346,11 @@ def cumulative_payloads_by_filter_vs_date_since_first_payload(chart_title_prefix
         line_width (int, optional): Width of the lines. Defaults to 2.
         max_cumulative_payloads (int, optional): Maximum cumulative payload count to display on y-axis.
         max_days_since_first (int, optional): Maximum days since first launch to display on x-axis.
+        max_points (int, optional): Downsample the plotted lines to about this many days, the CSV keeps every day. Defaults to None (plot every day).
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
     """
     
-    dataset = mda.McdowellDataset("./datasets")
+    dataset = mda.DatasetSession.view(dataset)
     
     if start_year == None:
         start_year = dataset.launch.df['Launch_Date'].dt.year.min()
@@ -1563,37 +1364,25 @@ def cumulative_payloads_by_filter_vs_date_since_first_payload(chart_title_prefix
     output_name += "_log" if y_axis_type == 'log' else ""
     
     # After getting the start and end years, filter the dataset by launch date
-    mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
+    dataset.launch = mda.Filters.filter_by_launch_date(dataset.launch, start_date=f'{start_year}-01-01', end_date=f'{end_year}-12-31')
     
     mda.ChartUtils.log_and_save_df("dataframe", output_name, output_prefix, dataset.launch.df)
     
-    dataframes = mda.ChartUtils.filter_dataset_into_dictionary_by_filter_function(
+    new_datasets = mda.ChartUtils.filter_dataset_by_each_parameter(
         dataset.satcat,
-        filter_function=filter_function,
-        filter_function_parameters_list=filter_function_parameters_list,
-        filter_function_additional_parameter=filter_function_additional_parameter
+        filter_function,
+        filter_function_parameters_list,
+        filter_function_additional_parameter
     )
     
-    # Create dict of first payload launch date for each dataframe
-    first_payload_dates = {}
-    for filter_function_parameter in filter_function_parameters_list:
-        first_payload_dates[filter_function_parameter] = dataframes[filter_function_parameter]['Launch_Date'].min()
-        
-    # Create new column of time since first payload in each dataframe
-    for filter_function_parameter in filter_function_parameters_list:
-        first_payload_date = first_payload_dates[filter_function_parameter]
-        dataframes[filter_function_parameter]['Time_Since_First_Payload'] = (
-            dataframes[filter_function_parameter]['Launch_Date'] - first_payload_date
-        ).dt.days
-
-    # Now sum cumulative payloads for each dataframe, versus time_since_first_payload
-    cumulative_dataframes = mda.ChartUtils.create_cumulative_series_by_column(
-        dataframes_dict=dataframes,
-        column_name='Time_Since_First_Payload'
-    )
-    
-    # Combine all series into a single dataframe (use 'none' to avoid lines dropping to zero)
-    output_df = mda.ChartUtils.combine_cumulative_series(cumulative_dataframes, fill_method='none')
+    # Days since the first payload of each series
+    days_since_first = {}
+    for filter_function_parameter, new_dataset in zip(filter_function_parameters_list, new_datasets):
+        launch_dates = new_dataset.column('Launch_Date')
+        days_since_first[filter_function_parameter] = (launch_dates - launch_dates.min()).dt.days
+
+    # Cumulative payloads of every series on one axis of days (use 'none' to avoid lines dropping to zero)
+    output_df = mda.ChartUtils.cumulative_counts_on_dense_axis(days_since_first, index_name='Time_Since_First_Payload', fill_method='none')
     
     # Rename columns using series_names if provided
     if series_names:
@@ -1620,7 +1409,7 @@ def cumulative_payloads_by_filter_vs_date_since_first_payload(chart_title_prefix
     y_columns = output_df.columns[1:].tolist()  # All columns except Time_Since_First_Payload
     
     mda.ChartUtils.plot_line(
-        output_df,
+        mda.ChartUtils.downsample_cumulative_series(output_df, max_points),
         x_col='Time_Since_First_Payload',
         y_cols=y_columns,
         title=f'{chart_title_prefix} Cumulative Sats vs. Days Since First Launch',
@@ -1632,3 +1421,131 @@ def cumulative_payloads_by_filter_vs_date_since_first_payload(chart_title_prefix
         line_width=line_width,
         y_axis_type=y_axis_type,
     )
+
+def objects_in_orbit_vs_date_by_column(chart_title_prefix, output_prefix, group_by=None, groups=None, series_names=None, sat_types=None, freq='MS', color_map=None, start_year=None, end_year=None, y_axis_type='linear', line_width=2, dataset=None):
+    """
+    Plot the number of objects in orbit over time, optionally one line per value of a column (eg. orbit, owner, program).
+    Uses Satcat.population_over_time(), so daily data over 60+ years and many groups is fine.
+
+    Args:
+        chart_title_prefix (str): Chart title prefix. (eg. 'Payloads')
+        output_prefix (str): Output file prefix.
+        group_by (str, optional): Satcat column to split by, eg. 'Simple_Orbit' or 'Owner'. Defaults to None (one line for everything).
+        groups (list, optional): Values of group_by to plot, in this order. Defaults to every value.
+        series_names (list, optional): Names for each group in the legend. Defaults to the group values.
+        sat_types (str or list, optional): Only count these object types, see Filters.filter_by_sat_type_coarse() (eg. 'P' for payloads). Defaults to None (all objects).
+        freq (str, optional): Pandas date frequency of the points, eg. 'D' for daily or 'MS' for monthly. Defaults to 'MS'.
+        color_map (dict or list, optional): Color mapping for series.
+        start_year (int, optional): First year to plot. Defaults to the first launch.
+        end_year (int, optional): Last year to plot (inclusive). Defaults to the current year.
+        y_axis_type (str, optional): 'linear' or 'log' for y-axis scaling.
+        line_width (int, optional): Width of the lines. Defaults to 2.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
+    """
+
+    dataset = mda.DatasetSession.view(dataset)
+
+    if sat_types is not None:
+        dataset.satcat = mda.Filters.filter_by_sat_type_coarse(dataset.satcat, sat_types)
+
+    if start_year == None:
+        start_year = dataset.satcat.column('Launch_Date').dt.year.min()
+    if end_year == None:
+        end_year = datetime.now().year
+
+    date_end = "present" if end_year == datetime.now().year else f"{end_year}"
+    output_name = f"{output_prefix}_in_orbit_vs_date"
+    output_name += f"_by_{group_by.lower()}" if group_by is not None else ""
+    output_name += f"_{start_year}_{date_end}"
+    output_name += "_log" if y_axis_type == 'log' else ""
+
+    # Don't plot past the data cutoff
+    end_date = min(pd.Timestamp(f'{end_year}-12-31'), pd.Timestamp(dataset.date_updated))
+
+    output_df = mda.Satcat.population_over_time(
+        dataset.satcat,
+        group_by=group_by,
+        freq=freq,
+        start_date=f'{start_year}-01-01',
+        end_date=end_date,
+        groups=groups,
+    )
+
+    if series_names:
+        output_df.columns = series_names
+    output_df.reset_index(inplace=True)
+
+    # Save to CSV
+    mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
+
+    mda.ChartUtils.plot_line(
+        output_df,
+        x_col='Date',
+        y_cols=output_df.columns[1:].tolist(),  # All columns except Date
+        title=f'{chart_title_prefix} In Orbit vs. Date' + (f' by {group_by.replace("_", " ")}' if group_by is not None else ''),
+        subtitle=f'Christopher Kalitin 2025 - Data Source: Jonathan McDowell - Data Cutoff: {dataset.date_updated}',
+        x_label='Date',
+        y_label='Number in Orbit',
+        output_path=f'examples/outputs/chart/{output_prefix}/{output_name}.png',
+        color_map=color_map,
+        line_width=line_width,
+        y_axis_type=y_axis_type,
+    )
+
+def shell_occupancy_heatmaps(chart_title_prefix, output_prefix, years=None, sat_types=None, altitude_step_km=50, min_altitude_km=200, max_altitude_km=2000, inclination_step_deg=5, altitude='Mean', log_color=True, dataset=None):
+    """
+    Heatmaps of the number of objects in orbit in each altitude x inclination shell, one per year, from one Satcat.shell_occupancy() cube.
+
+    Args:
+        chart_title_prefix (str): Chart title prefix. (eg. 'Payloads')
+        output_prefix (str): Output file prefix.
+        years (list int, optional): Years to plot, the shells on January 1 of each. Defaults to None (just the data cutoff date).
+        sat_types (str or list, optional): Only count these object types, see Filters.filter_by_sat_type_coarse() (eg. 'P' for payloads). Defaults to None (all objects).
+        altitude_step_km (int, optional): Altitude band size in km. Defaults to 50.
+        min_altitude_km (int, optional): Bottom of the lowest altitude band. Defaults to 200.
+        max_altitude_km (int, optional): Top of the highest altitude band. Defaults to 2000.
+        inclination_step_deg (int, optional): Inclination band size in degrees. Defaults to 5.
+        altitude (str, optional): "Perigee", "Apogee" or "Mean", see Satcat.shell_occupancy(). Defaults to "Mean".
+        log_color (bool, optional): Color by log10(count + 1). Defaults to True.
+        dataset (McdowellDataset, optional): Dataset to chart, filters are applied to a view of it so it isn't modified. Defaults to the shared session dataset (mda.DatasetSession).
+    """
+
+    dataset = mda.DatasetSession.view(dataset)
+
+    if sat_types is not None:
+        dataset.satcat = mda.Filters.filter_by_sat_type_coarse(dataset.satcat, sat_types)
+
+    # One date per chart, the data cutoff is called "present"
+    if years is None:
+        dates = {"present": pd.Timestamp(dataset.date_updated)}
+    else:
+        dates = {f"{year}": pd.Timestamp(f"{year}-01-01") for year in years}
+
+    altitude_bins = list(range(min_altitude_km, max_altitude_km + altitude_step_km, altitude_step_km))
+    inclination_bins = list(range(0, 180 + inclination_step_deg, inclination_step_deg))
+
+    output_df = mda.Satcat.shell_occupancy(
+        dataset.satcat,
+        altitude_bins=altitude_bins,
+        inclination_bins=inclination_bins,
+        dates=list(dates.values()),
+        altitude=altitude,
+    )
+
+    # Save the sparse cube for every date to one CSV
+    output_name = f"{output_prefix}_shell_occupancy_{'_'.join(dates.keys())}"
+    mda.ChartUtils.log_and_save_df("csv", output_name, output_prefix, output_df)
+
+    for date_name, date in dates.items():
+        mda.ChartUtils.plot_heatmap(
+            output_df[output_df['Date'] == date],
+            x_col='Inclination_Band',
+            y_col='Altitude_Band',
+            value_col='Count',
+            title=f'{chart_title_prefix} In Orbit by Altitude and Inclination ({date.date()})',
+            subtitle=f'Christopher Kalitin 2025 - Data Source: Jonathan McDowell - Data Cutoff: {dataset.date_updated}',
+            x_label='Inclination (deg)',
+            y_label=f'{altitude} Altitude (km)',
+            output_path=f'examples/outputs/chart/{output_prefix}/{output_prefix}_shell_occupancy_{date_name}.png',
+            log_color=log_color,
+        )
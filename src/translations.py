@@ -1,5 +1,10 @@
 import csv
+import hashlib
+import json
+import os
 import sys
+from dataset_cache import DatasetCache
+from dataset_profile import DatasetProfile
 
 class Translation:
     """
@@ -732,13 +737,107 @@ class Translation:
         "Zimbabwe": "Zimbabwe"
     }
     
-    def __init__(self, dataset_directory="./datasets"):
+    # Generated dictionaries, these are saved in the translation cache
+    generated_dictionaries = ["lv_type_to_lv_family", "launch_site_to_state_code", "org_to_state_code", "state_code_to_state_name", "launch_site_to_launch_site_parent", "launch_site_to_launch_site_name"]
+    
+    # Reference tables the generated dictionaries are read from
+    source_files = ["lv.tsv", "sites.tsv", "orgs.tsv"]
+    
+    loaded = {} # (dataset directory, cache directory, source file stats): Translation, so each process reads the tables once
+    
+    def __init__(self, dataset_directory="./datasets", dictionaries=None):
+        """
+        Args:
+            dataset_directory (str, optional): Directory containing lv.tsv, sites.tsv and orgs.tsv. Defaults to "./datasets".
+            dictionaries (dict, optional): Already generated dictionaries by name (eg. from the translation cache), the tsv files aren't read if given.
+        """
+        
+        self.tables = {} # File name: ReferenceTable, each file is parsed once no matter how many dictionaries come from it
+        
+        if dictionaries is not None:
+            for name in Translation.generated_dictionaries:
+                setattr(self, name, dictionaries[name])
+            return
+        
         self.generate_lv_type_to_lv_family(dataset_directory=dataset_directory)
         self.generate_launch_site_to_state_code(dataset_directory=dataset_directory)
         self.generate_org_to_state_code(dataset_directory=dataset_directory)
         self.generate_state_code_to_state_name(dataset_directory=dataset_directory)
         self.generate_launch_site_to_launch_site_parent(dataset_directory=dataset_directory)
         self.generate_launch_site_to_launch_site_name(dataset_directory=dataset_directory)
+        
+        self.tables = {} # Only needed while generating, don't keep the raw rows around
+    
+    @staticmethod
+    def get(dataset_directory="./datasets", cache_directory=None):
+        """
+        Translation for a dataset directory, shared by everything in this process.
+        Loaded from the translation cache in cache_directory if the reference tables haven't changed, otherwise generated (and saved there).
+        Args:
+            dataset_directory (str, optional): Directory containing lv.tsv, sites.tsv and orgs.tsv. Defaults to "./datasets".
+            cache_directory (str, optional): Directory to cache the generated dictionaries in, eg. the dataset cache directory. Defaults to None (no disk cache).
+        """
+        
+        file_stats = []
+        for name in Translation.source_files:
+            try:
+                stat = os.stat(f"{dataset_directory}/{name}")
+                file_stats.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                file_stats.append(None)
+        key = (os.path.abspath(dataset_directory), cache_directory and os.path.abspath(cache_directory), tuple(file_stats))
+        
+        if key not in Translation.loaded:
+            with DatasetProfile.measure("translation tables"):
+                Translation.loaded[key] = Translation.load_or_build(dataset_directory, cache_directory)
+        return Translation.loaded[key]
+    
+    @staticmethod
+    def load_or_build(dataset_directory="./datasets", cache_directory=None):
+        """
+        Load the generated dictionaries from the translation cache, or generate them from the tsv files and save them there.
+        The cache file is keyed by the contents of the reference tables and the library source, like the dataset cache.
+        """
+        
+        if cache_directory is None:
+            return Translation(dataset_directory)
+        
+        hasher = hashlib.sha256(DatasetCache.library_fingerprint().encode("utf-8"))
+        key = DatasetCache.hash_files([f"{dataset_directory}/{name}" for name in Translation.source_files], hasher).hexdigest()[:32]
+        cache_path = f"{cache_directory}/translation_{key}.json"
+        
+        try:
+            with open(cache_path, "r", encoding="utf-8") as file:
+                return Translation(dataset_directory, dictionaries=json.load(file))
+        except (OSError, ValueError, KeyError): # Not saved yet or a broken file
+            pass
+        
+        translation = Translation(dataset_directory)
+        try:
+            os.makedirs(cache_directory, exist_ok=True)
+            temp_path = f"{cache_path}.tmp{os.getpid()}"
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({name: getattr(translation, name) for name in Translation.generated_dictionaries}, file)
+            os.replace(temp_path, cache_path)
+            
+            # Remove translation caches of older reference tables
+            for name in os.listdir(cache_directory):
+                if name.startswith("translation_") and name.endswith(".json") and name != os.path.basename(cache_path):
+                    os.remove(f"{cache_directory}/{name}")
+        except OSError as error:
+            print(f"Translation cache could not be written: {error}")
+        return translation
+    
+    def table(self, file_name, dataset_directory="./datasets"):
+        """
+        Parsed reference table, read on first use.
+        Args:
+            file_name (str): eg. "sites.tsv"
+        """
+        
+        if file_name not in self.tables:
+            self.tables[file_name] = ReferenceTable.from_tsv(f"{dataset_directory}/{file_name}")
+        return self.tables[file_name]
 
     def generate_lv_type_to_lv_family(self, dataset_directory = "./datasets"):
         """
@@ -747,13 +846,8 @@ class Translation:
         Launch Vehicle Families Text File: https://planet4589.org/space/gcat/web/lvs/family/index.html
         """
         
-        file_path = f"{dataset_directory}/lv.tsv"
-        
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file, delimiter='\t')
-            reader.__next__() # Skip the index row
-            reader.__next__() # Skip the header row
-            self.lv_type_to_lv_family = {row[0].strip(): row[1].strip() for row in reader}
+        rows = self.table("lv.tsv", dataset_directory).rows
+        self.lv_type_to_lv_family = {row[0].strip(): row[1].strip() for row in rows}
             
     def generate_launch_site_to_state_code(self, dataset_directory = "./datasets"):
         """
@@ -762,13 +856,8 @@ class Translation:
         Launch Sites Text File: https://planet4589.org/space/gcat/data/tables/sites.html
         """
         
-        file_path = f"{dataset_directory}/sites.tsv"
-        
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file, delimiter='\t')
-            reader.__next__() # Skip the index row
-            reader.__next__() # Skip the header row
-            self.launch_site_to_state_code = {row[0].strip(): row[4].strip() for row in reader}
+        rows = self.table("sites.tsv", dataset_directory).rows
+        self.launch_site_to_state_code = {row[0].strip(): row[4].strip() for row in rows}
             
     def generate_org_to_state_code(self, dataset_directory = "./datasets"):
         """
@@ -777,13 +866,8 @@ class Translation:
         Launch Sites Text File: https://planet4589.org/space/gcat/data/tables/orgs.html
         """
         
-        file_path = f"{dataset_directory}/orgs.tsv"
-        
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file, delimiter='\t')
-            reader.__next__() # Skip the index row
-            reader.__next__() # Skip the header row
-            self.org_to_state_code = {row[0].strip(): row[2].strip() for row in reader}
+        rows = self.table("orgs.tsv", dataset_directory).rows
+        self.org_to_state_code = {row[0].strip(): row[2].strip() for row in rows}
             
     def generate_state_code_to_state_name(self, dataset_directory = "./datasets"):
         """
@@ -792,13 +876,8 @@ class Translation:
         Launch Sites Text File: https://planet4589.org/space/gcat/data/tables/orgs.html
         """
         
-        file_path = f"{dataset_directory}/orgs.tsv"
-        
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file, delimiter='\t')
-            reader.__next__() # Skip the index row
-            reader.__next__() # Skip the header row
-            self.state_code_to_state_name = {row[0].strip(): row[7].strip() for row in reader}
+        rows = self.table("orgs.tsv", dataset_directory).rows
+        self.state_code_to_state_name = {row[0].strip(): row[7].strip() for row in rows}
     
     def generate_launch_site_to_launch_site_parent(self, dataset_directory = "./datasets"):
         """
@@ -807,13 +886,8 @@ class Translation:
         Launch Sites Text File: https://planet4589.org/space/gcat/data/tables/sites.html
         """
         
-        file_path = f"{dataset_directory}/sites.tsv"
-        
-        with open(file_path, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file, delimiter='\t')
-            reader.__next__() # Skip the index row
-            reader.__next__() # Skip the header row
-            self.launch_site_to_launch_site_parent = {row[0].strip(): row[7].replace("-","").strip() for row in reader}
+        rows = self.table("sites.tsv", dataset_directory).rows
+        self.launch_site_to_launch_site_parent = {row[0].strip(): row[7].replace("-","").strip() for row in rows}
     
     def generate_launch_site_to_launch_site_name(self, dataset_directory = "./datasets"):
         """
@@ -822,14 +896,27 @@ class Translation:
         Launch Sites Text File: https://planet4589.org/space/gcat/data/tables/sites.html
         """
         
-        file_path = f"{dataset_directory}/sites.tsv"
-        
+        rows = self.table("sites.tsv", dataset_directory).rows
+        # If short name is "-", use default name instead
+        self.launch_site_to_launch_site_name = {
+            row[0].strip(): row[14].strip() if row[14].strip() != "-" else row[8].strip()
+            for row in rows if len(row) > 14
+        }
+
+class ReferenceTable:
+    """
+    One of McDowell's reference tables (lv.tsv, sites.tsv, orgs.tsv) parsed once: the column names and every data row as a tuple of raw strings.
+    """
+    
+    def __init__(self, columns, rows):
+        self.columns = columns # Names from the header row, without the leading "#"
+        self.rows = rows # List of tuples of str, values aren't stripped
+    
+    @staticmethod
+    def from_tsv(file_path):
         with open(file_path, 'r', encoding='utf-8') as file:
             reader = csv.reader(file, delimiter='\t')
-            reader.__next__() # Skip the index row
-            reader.__next__() # Skip the header row
-            # If short name is "-", use default name instead
-            self.launch_site_to_launch_site_name = {
-                row[0].strip(): row[14].strip() if row[14].strip() != "-" else row[8].strip()
-                for row in reader if len(row) > 14
-            }
+            columns = [column.lstrip("#").strip() for column in reader.__next__()] # Header row
+            reader.__next__() # Skip the "# Updated" row
+            rows = [tuple(row) for row in reader]
+        return ReferenceTable(columns, rows)
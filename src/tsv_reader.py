@@ -0,0 +1,30 @@
+import os
+import pandas as pd
+import dataset_profile
+
+def read_tsv(file_path, usecols=None):
+    """
+    Read one of McDowell's tsv files into a raw dataframe, all preprocessing happens afterwards.
+    Safe to call from several threads at once, pandas' C parser releases the GIL for most of the read.
+    Args:
+        usecols (list or function, optional): Only read these columns, see pandas.read_csv(). Defaults to every column.
+    """
+
+    with dataset_profile.DatasetProfile.measure(f"read {os.path.basename(file_path)}") as stage:
+        df = pd.read_csv(file_path, sep="\t", encoding="utf-8", low_memory=False, usecols=usecols)
+        stage.rows = len(df)
+    return df
+
+def date_updated(raw_df):
+    """
+    Dataset cutoff date from the "# Updated" row of a raw tsv dataframe, eg. "2025 Dec 1"
+    """
+
+    return " ".join(raw_df.iloc[0, 0].strip().replace("  ", " ").split(" ")[2:5])
+
+def read_date_updated(file_path):
+    """
+    Dataset cutoff date of a tsv file, only reads its first lines.
+    """
+
+    return date_updated(pd.read_csv(file_path, sep="\t", encoding="utf-8", nrows=1, usecols=[0]))
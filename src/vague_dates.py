@@ -0,0 +1,197 @@
+"""
+Parser for McDowell's vague date format.
+
+Vague dates are written to the precision they're known to, eg.
+"1957 Oct  4 1928:34" (second), "1958 Mar 26 1745" (minute), "1965 Jun 10" (day), "1966 Jul" (month), "1970" (year).
+A trailing "?" marks an uncertain value and "-" means no date.
+
+Vague date format: https://planet4589.org/space/gcat/web/intro/vague.html
+
+The old approach ran 6-7 full string passes per column (strip, replace, collapse spaces, split, length check, to_datetime).
+This reads the fields of each unique string in one pass (fixed byte positions with numpy, regex for the odd ones out)
+and builds datetime64 values from the integer fields with numpy.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+
+# Precision codes, stored as int8 in the *_Date_Precision columns. Higher is more precise.
+PRECISION_NONE = 0 # No date or unparseable
+PRECISION_YEAR = 1
+PRECISION_MONTH = 2
+PRECISION_DAY = 3
+PRECISION_HOUR = 4
+PRECISION_MINUTE = 5
+PRECISION_SECOND = 6
+
+MONTHS = {month: number for number, month in enumerate(["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+
+# Year, month, day, hour (HH or HHh), minute (HHMM), seconds (HHMM:SS or HHMM:SS.s)
+# Anything after the last field that parses is ignored, same as the old parser only looking at the first 3 fields
+VAGUE_DATE_PATTERN = re.compile(
+    r"\s*(\d{4})\??"
+    r"(?:\s+([A-Za-z]{3})\??"
+    r"(?:\s+(\d{1,2})\??"
+    r"(?:\s+(\d{2})(?:h|(\d{2})(?::(\d{2}(?:\.\d+)?))?)\??(?=\s|$))?"
+    r")?)?"
+    r"(?=[\s.]|$)"
+)
+
+def parse_vague_date(date_string):
+    """
+    Parse a single vague date into integer fields.
+
+    Args:
+        date_string (str): eg. "1957 Oct  4 1928:34"
+
+    Returns:
+        tuple: (year, month, day, hour, minute, nanoseconds into the minute, precision) or None if it can't be parsed.
+    """
+
+    if not isinstance(date_string, str):
+        return None
+
+    match = VAGUE_DATE_PATTERN.match(date_string)
+    if match is None:
+        return None
+
+    year, month_name, day, hour, minute, second = match.groups()
+
+    if month_name is None:
+        return (int(year), 1, 1, 0, 0, 0, PRECISION_YEAR)
+
+    month = MONTHS.get(month_name.lower())
+    if month is None:
+        return None
+
+    if day is None:
+        return (int(year), month, 1, 0, 0, 0, PRECISION_MONTH)
+    if hour is None:
+        return (int(year), month, int(day), 0, 0, 0, PRECISION_DAY)
+    if minute is None:
+        return (int(year), month, int(day), int(hour), 0, 0, PRECISION_HOUR)
+    if second is None:
+        return (int(year), month, int(day), int(hour), int(minute), 0, PRECISION_MINUTE)
+    return (int(year), month, int(day), int(hour), int(minute), round(float(second) * 1e9), PRECISION_SECOND)
+
+def parse_fixed_width(strings):
+    """
+    Vectorized parse of vague dates written in McDowell's usual fixed width layout.
+
+    Nearly every date in the tsv files is laid out exactly like "1957 Oct  4 1928:34?" (day right aligned, optional "?"),
+    so the fields can be read straight out of the bytes at fixed positions without any per-string python code.
+
+    Args:
+        strings (ndarray): Array of date strings.
+
+    Returns:
+        tuple(ndarray, ndarray): (int64 fields array of shape (n, 7) in the same layout as parse_vague_date, bool array of which strings matched the layout)
+    """
+
+    n = len(strings)
+    fields = np.zeros((n, 7), dtype=np.int64)
+
+    try:
+        raw = strings.astype("S20")
+    except (UnicodeEncodeError, ValueError, TypeError): # Non-ascii or non-string values, leave them all to the slow path
+        return fields, np.zeros(n, dtype=bool)
+
+    chars = raw.view(np.uint8).reshape(n, 20).astype(np.int64)
+    lengths = np.char.str_len(raw)
+    lengths = lengths - (chars[np.arange(n), np.maximum(lengths - 1, 0)] == ord("?")) # Uncertain dates end with "?"
+
+    def digits(start, stop):
+        return np.all((chars[:, start:stop] >= ord("0")) & (chars[:, start:stop] <= ord("9")), axis=1)
+
+    def number(start, stop):
+        value = np.zeros(n, dtype=np.int64)
+        for position in range(start, stop):
+            value = value * 10 + np.clip(chars[:, position] - ord("0"), 0, 9)
+        return value
+
+    def is_char(position, character):
+        return chars[:, position] == ord(character)
+
+    # Month names to numbers by their lowercased 3 bytes
+    month_keys = np.array([(ord(name[0]) << 16) | (ord(name[1]) << 8) | ord(name[2]) for name in MONTHS])
+    month_order = np.argsort(month_keys)
+    month_key = ((chars[:, 5] | 0x20) << 16) | ((chars[:, 6] | 0x20) << 8) | (chars[:, 7] | 0x20)
+    month_index = np.clip(np.searchsorted(month_keys[month_order], month_key), 0, 11)
+    month_found = month_keys[month_order][month_index] == month_key
+
+    has_year = digits(0, 4)
+    has_month = has_year & is_char(4, " ") & month_found
+    has_day = has_month & is_char(8, " ") & (is_char(9, " ") | digits(9, 10)) & digits(10, 11)
+    has_minute = has_day & is_char(11, " ") & digits(12, 16)
+    has_second = has_minute & is_char(16, ":") & digits(17, 19)
+
+    precision = np.full(n, PRECISION_NONE)
+    precision[(lengths == 4) & has_year] = PRECISION_YEAR
+    precision[(lengths == 8) & has_month] = PRECISION_MONTH
+    precision[(lengths == 11) & has_day] = PRECISION_DAY
+    precision[(lengths == 16) & has_minute] = PRECISION_MINUTE
+    precision[(lengths == 19) & has_second] = PRECISION_SECOND
+    matched = precision != PRECISION_NONE
+
+    fields[:, 0] = number(0, 4)
+    fields[:, 1] = np.where(precision >= PRECISION_MONTH, month_order[month_index] + 1, 1)
+    fields[:, 2] = np.where(precision >= PRECISION_DAY, number(9, 11), 1)
+    fields[:, 3] = np.where(precision >= PRECISION_MINUTE, number(12, 14), 0)
+    fields[:, 4] = np.where(precision >= PRECISION_MINUTE, number(14, 16), 0)
+    fields[:, 5] = np.where(precision >= PRECISION_SECOND, number(17, 19) * 10**9, 0)
+    fields[:, 6] = precision
+
+    return fields, matched
+
+def parse_vague_dates(series):
+    """
+    Parse a column of vague date strings into datetimes and precision codes.
+
+    Each unique string is only parsed once, launches and satellites share a lot of dates.
+    Dates in the usual fixed width layout are parsed with numpy, anything else (eg. "1989 Nov  24", "1959 Oct  4 19h") falls back to the regex.
+    Invalid dates (eg. "2023 Feb 30", "1970s") become NaT with PRECISION_NONE.
+    A leap second ("2016 Dec 31 2359:60") becomes 23:59:59.999999999 with second precision.
+    Other out of range times (eg. "2000 Jan  1 2400") keep the day with day precision.
+
+    Args:
+        series (Series): Raw date strings from a McDowell tsv.
+
+    Returns:
+        tuple(Series, Series): (datetime64[ns] with time of day, int8 precision code), both with the index of series.
+    """
+
+    codes, uniques = pd.factorize(series)
+    uniques = np.asarray(uniques, dtype=object)
+
+    fields = np.zeros((len(uniques) + 1, 7), dtype=np.int64) # Last row is for NaN (code -1)
+    fields[:-1], matched = parse_fixed_width(uniques)
+    for i in np.flatnonzero(~matched):
+        parsed = parse_vague_date(uniques[i])
+        if parsed is not None:
+            fields[i] = parsed
+
+    year, month, day, hour, minute, nanosecond, precision = fields.T
+    
+    # Leap seconds ("HHMM:60") are real GCAT times, keep them as the last instant of the minute instead of losing the date
+    nanosecond = np.where((nanosecond >= 60 * 10**9) & (nanosecond < 61 * 10**9), 60 * 10**9 - 1, nanosecond)
+
+    # Build the date from months since 1970 so no string formatting is needed
+    month_start = ((year - 1970) * 12 + month - 1).astype("datetime64[M]").astype("datetime64[D]")
+    days_in_month = (month_start.astype("datetime64[M]") + 1).astype("datetime64[D]") - month_start
+
+    valid = (precision != PRECISION_NONE) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month.astype(np.int64))
+
+    # A malformed time of day (eg. "2400") only loses the time, the day is still known
+    bad_time = valid & ~((hour < 24) & (minute < 60) & (nanosecond < 60 * 10**9))
+    hour, minute, nanosecond = (np.where(bad_time, 0, field) for field in (hour, minute, nanosecond))
+    precision = np.where(bad_time, PRECISION_DAY, precision)
+
+    values = (month_start + (day - 1)).astype("datetime64[ns]") + (hour * 3600 + minute * 60) * np.timedelta64(10**9, "ns") + nanosecond.astype("timedelta64[ns]")
+    values[~valid] = np.datetime64("NaT")
+    precision = np.where(valid, precision, PRECISION_NONE).astype(np.int8)
+
+    dates = pd.Series(values[codes], index=series.index)
+    precisions = pd.Series(precision[codes], index=series.index)
+
+    return dates, precisions